@@ -0,0 +1,45 @@
+# Compares memory per node, build time and traversal time of ArrayAVLTree against AVLTree.
+# Run from the project root: python -m benchmarks.array_tree [n ...]
+import random
+import sys
+import time
+import tracemalloc
+from data_structures.array_tree import ArrayAVLTree
+from data_structures.avl_tree import AVLTree
+
+SIZES = [100_000, 1_000_000]
+MEMORY_SAMPLE = 100_000 # tracemalloc slows building down a lot, so memory is measured on a smaller tree
+
+def bytes_per_node(cls, values):
+    tracemalloc.start()
+    tree = cls(values)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tree
+    return size / len(values)
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+def main(sizes=SIZES):
+    rng = random.Random(42)
+    # Values above 256 so both trees store real int objects, not the small-int cache
+    sample = rng.sample(range(1_000, 1_000 + 10 * MEMORY_SAMPLE), MEMORY_SAMPLE)
+    object_bytes = bytes_per_node(AVLTree, sample)
+    array_bytes = bytes_per_node(ArrayAVLTree, sample)
+    print(f"Bytes per node: AVLTree {object_bytes:.0f}, ArrayAVLTree {array_bytes:.0f} "
+          f"({object_bytes / array_bytes:.1f}x less)\n")
+
+    print(f"{'n':>9} {'build objects':>14} {'build arrays':>13} {'in-order objects':>17} {'in-order arrays':>16}")
+    for n in sizes:
+        values = rng.sample(range(10 * n), n)
+        build_objects, object_tree = timed(lambda: AVLTree(values))
+        build_arrays, array_tree = timed(lambda: ArrayAVLTree(values))
+        walk_objects, _ = timed(lambda: sum(1 for _ in object_tree))
+        walk_arrays, _ = timed(lambda: sum(1 for _ in array_tree.in_order()))
+        print(f"{n:>9} {build_objects:>13.2f}s {build_arrays:>12.2f}s {walk_objects:>16.3f}s {walk_arrays:>15.3f}s")
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
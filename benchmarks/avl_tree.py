@@ -0,0 +1,80 @@
+# Compares the iterative AVLTree.insert against the old recursive insert(root, value).
+# Run from the project root: python -m benchmarks.avl_tree
+import random
+import sys
+import time
+from data_structures.avl_tree import AVLTree, AVLTreeNode
+
+SIZES = [100_000, 1_000_000]
+
+# The recursive insert before AVLTree owned its root, kept here so the numbers stay comparable
+class LegacyAVLTree:
+    def insert(self, root, value):
+        if not root:
+            return AVLTreeNode(value)
+        if value < root.value:
+            root.left = self.insert(root.left, value)
+        else:
+            root.right = self.insert(root.right, value)
+        root.height = 1 + max(self.get_height(root.left), self.get_height(root.right))
+        balance = self.get_height(root.left) - self.get_height(root.right)
+        if balance > 1 and value < root.left.value:
+            return self.right_rotate(root)
+        if balance < -1 and value > root.right.value:
+            return self.left_rotate(root)
+        if balance > 1 and value > root.left.value:
+            root.left = self.left_rotate(root.left)
+            return self.right_rotate(root)
+        if balance < -1 and value < root.right.value:
+            root.right = self.right_rotate(root.right)
+            return self.left_rotate(root)
+        return root
+
+    def left_rotate(self, z):
+        y = z.right
+        z.right, y.left = y.left, z
+        z.height = 1 + max(self.get_height(z.left), self.get_height(z.right))
+        y.height = 1 + max(self.get_height(y.left), self.get_height(y.right))
+        return y
+
+    def right_rotate(self, z):
+        y = z.left
+        z.left, y.right = y.right, z
+        z.height = 1 + max(self.get_height(z.left), self.get_height(z.right))
+        y.height = 1 + max(self.get_height(y.left), self.get_height(y.right))
+        return y
+
+    def get_height(self, node):
+        return node.height if node else 0
+
+def legacy_build(values):
+    tree = LegacyAVLTree()
+    root = None
+    for value in values:
+        root = tree.insert(root, value)
+    return root
+
+def new_build(values):
+    tree = AVLTree()
+    for value in values:
+        tree.insert(value)
+    return tree
+
+def timed(fn, values):
+    start = time.perf_counter()
+    fn(values)
+    return time.perf_counter() - start
+
+def main(sizes=SIZES):
+    rng = random.Random(42)
+    print(f"{'n':>9} {'order':>7} {'recursive (s)':>14} {'iterative (s)':>14} {'speedup':>8}")
+    for n in sizes:
+        shuffled = list(range(n))
+        rng.shuffle(shuffled)
+        for order, values in (("random", shuffled), ("sorted", range(n))):
+            legacy = timed(legacy_build, values)
+            new = timed(new_build, values)
+            print(f"{n:>9} {order:>7} {legacy:>14.2f} {new:>14.2f} {legacy / new:>7.2f}x")
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
@@ -0,0 +1,35 @@
+# Regression check and timing for the loop-based BST helpers on a degenerate tree.
+# Sorted input turns the BST into a chain, which used to hit RecursionError after ~1,000 values.
+# Building the chain is still quadratic (every insert walks it), so 50,000 values take a while.
+# Run from the project root: python -m benchmarks.bst [n]
+import random
+import sys
+import time
+from data_structures.tree import insert_bst, search_bst, tree_height
+
+N = 50_000
+
+def build(values):
+    root = None
+    for value in values:
+        root = insert_bst(root, value)
+    return root
+
+def main(n=N):
+    start = time.perf_counter()
+    root = build(range(n))
+    elapsed = time.perf_counter() - start
+    assert tree_height(root) == n, "a sorted build should be one chain"
+    assert search_bst(root, n - 1).value == n - 1
+    assert search_bst(root, n) is None
+    print(f"{n:,} sorted values: built in {elapsed:.1f}s, height {tree_height(root):,}")
+
+    values = random.Random(42).sample(range(10 * n), n)
+    start = time.perf_counter()
+    root = build(values)
+    elapsed = time.perf_counter() - start
+    assert all(search_bst(root, value) for value in values[:1_000])
+    print(f"{n:,} random values: built in {elapsed:.2f}s, height {tree_height(root)}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else N)
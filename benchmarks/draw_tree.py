@@ -0,0 +1,32 @@
+# Times laying out and rendering an AVL tree to PNG with draw_tree.
+# Run from the project root: python -m benchmarks.draw_tree [n ...]
+import io
+import random
+import sys
+import time
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+from data_structures.avl_tree import AVLTree
+from visualizations.layout import tree_layout
+from visualizations.render import draw_tree
+
+SIZES = [100, 1_000, 10_000]
+
+def main(sizes=SIZES):
+    print(f"{'nodes':>7} {'layout':>9} {'layout + draw + PNG':>20}")
+    for n in sizes:
+        tree = AVLTree(random.Random(42).sample(range(10 * n), n))
+        start = time.perf_counter()
+        tree_layout(tree.root)
+        layout_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        fig = draw_tree(tree.root, [tree.root.value], return_fig=True)
+        fig.savefig(io.BytesIO(), format="png")
+        plt.close(fig)
+        total = time.perf_counter() - start
+        print(f"{n:>7} {layout_time * 1000:>7.1f}ms {total:>19.3f}s")
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
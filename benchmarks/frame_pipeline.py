@@ -0,0 +1,30 @@
+# Frames per second for pre-rendering a tree's grow animation with different pool sizes.
+# The frame cache is bypassed so every frame is really rendered.
+# Run from the project root: python -m benchmarks.frame_pipeline [n]
+import os
+import random
+import sys
+import time
+import matplotlib
+matplotlib.use("Agg")
+from visualizations.animations import grow_frames
+from visualizations.frame_pipeline import FramePipeline
+
+JOBS = [0, 1, 2, 4, 8]
+
+def main(n=30):
+    steps, _ = grow_frames(random.Random(42).sample(range(10 * n), n), "AVL Tree")
+    frames = [(frame, highlighted) for frame, _, highlighted in steps]
+    print(f"{len(frames)} frames, {os.cpu_count()} CPUs (jobs=0 renders in this process)")
+    print(f"{'jobs':>5} {'frames/s':>9}")
+    for jobs in JOBS:
+        if jobs:
+            list(FramePipeline(frames[:jobs], jobs=jobs, cache=None)) # Start the workers outside the timing
+        start = time.perf_counter()
+        for _ in FramePipeline(frames, jobs=jobs, cache=None):
+            pass
+        elapsed = time.perf_counter() - start
+        print(f"{jobs:>5} {len(frames) / elapsed:>9.1f}")
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,59 @@
+# Checks that the core (data structures, layout, frame generation) imports quickly and
+# without Streamlit, matplotlib, NumPy or Pillow, using python -X importtime in a fresh
+# interpreter for each module. Exits with status 1 if any module is over budget.
+# Run from the project root: python -m benchmarks.import_time
+import os
+import subprocess
+import sys
+
+PACKAGES = ("data_structures", "visualizations")
+# Modules that are meant to import the heavy libraries: the Streamlit pages and the
+# video encoders. Everything else in PACKAGES is core and is checked.
+EXCLUDED = {
+    "visualizations.heap",
+    "visualizations.linked_list",
+    "visualizations.queue",
+    "visualizations.stack",
+    "visualizations.tree",
+    "visualizations.encoders",
+}
+HEAVY_MODULES = ("streamlit", "matplotlib", "numpy", "PIL")
+BUDGET_MS = 50 # Per module, cumulative; the heavy ones each take hundreds of ms
+
+def core_modules():
+    # Every module in PACKAGES not in EXCLUDED, so new modules are checked without being listed
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    modules = []
+    for package in PACKAGES:
+        for name in sorted(os.listdir(os.path.join(root, package))):
+            module = f"{package}.{name[:-3]}"
+            if name.endswith(".py") and name != "__init__.py" and module not in EXCLUDED:
+                modules.append(module)
+    return modules
+
+def import_profile(module):
+    # Returns {imported module name: cumulative microseconds} for "import module"
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+def main():
+    failures = 0
+    print(f"{'module':<32} {'import':>8}  heavy imports")
+    for module in core_modules():
+        times = import_profile(module)
+        total_ms = times[module] / 1000
+        heavy = sorted({name.split(".")[0] for name in times} & set(HEAVY_MODULES))
+        ok = total_ms <= BUDGET_MS and not heavy
+        failures += not ok
+        print(f"{module:<32} {total_ms:>6.1f}ms  {', '.join(heavy) or '-'}{'' if ok else '  FAIL'}")
+    print(f"budget: {BUDGET_MS}ms per module, none of {', '.join(HEAVY_MODULES)}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+# Compares building a LinkedList with the old walk-to-the-end append against the tail pointer version.
+# Run from the project root: python -m benchmarks.linked_list [--full]
+import sys
+import time
+import tracemalloc
+from data_structures.linked_list import LinkedList
+
+SIZES = [1_000, 10_000, 100_000]
+LEGACY_LIMIT = 10_000 # The old build is quadratic; 100k takes minutes, so it only runs with --full
+
+# The implementation before the tail pointer, kept here so the numbers stay comparable
+class LegacyNode:
+    def __init__(self, value):
+        self.value = value
+        self.next = None
+
+class LegacyLinkedList:
+    def __init__(self, values=None):
+        self.head = None
+        if values:
+            for value in values:
+                self.append(value)
+
+    def append(self, value):
+        new_node = LegacyNode(value)
+        if not self.head:
+            self.head = new_node
+            return
+        current = self.head
+        while current.next:
+            current = current.next
+        current.next = new_node
+
+def time_build(cls, values):
+    start = time.perf_counter()
+    cls(values)
+    return time.perf_counter() - start
+
+def bytes_per_node(cls, n=10_000):
+    values = list(range(n))
+    tracemalloc.start()
+    ll = cls(values)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del ll
+    return size / n
+
+def main(full=False):
+    print(f"{'n':>8} {'legacy (s)':>12} {'new (s)':>10} {'speedup':>9}")
+    for n in SIZES:
+        values = list(range(n))
+        new = time_build(LinkedList, values)
+        if n <= LEGACY_LIMIT or full:
+            legacy = time_build(LegacyLinkedList, values)
+            print(f"{n:>8} {legacy:>12.4f} {new:>10.4f} {legacy / new:>8.1f}x")
+        else:
+            print(f"{n:>8} {'skipped':>12} {new:>10.4f} {'-':>9}")
+    legacy_bytes = bytes_per_node(LegacyLinkedList)
+    new_bytes = bytes_per_node(LinkedList)
+    print(f"\nBytes per node: legacy {legacy_bytes:.0f}, new {new_bytes:.0f} ({new_bytes / legacy_bytes:.0%})")
+
+if __name__ == "__main__":
+    main(full="--full" in sys.argv)
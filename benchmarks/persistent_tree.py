@@ -0,0 +1,72 @@
+# Compares keeping grow-animation frames as deepcopy snapshots against persistent tree versions.
+# Run from the project root: python -m benchmarks.persistent_tree [n]
+import copy
+import random
+import sys
+import time
+import tracemalloc
+from data_structures.avl_tree import AVLTree
+from data_structures.tree import insert_bst
+
+N = 2_000
+
+def deepcopy_frames(values, avl):
+    # What visualize_tree used to do: two deepcopies per inserted value, one kept as a frame
+    tree = AVLTree()
+    root = None
+    frames = []
+    for v in values:
+        root = tree.insert(v) if avl else insert_bst(root, v)
+        frames.append(copy.deepcopy(root))
+        copy.deepcopy(root)
+    return frames
+
+def persistent_frames(values, avl):
+    tree = AVLTree(persistent=True)
+    root = None
+    frames = []
+    for v in values:
+        root = tree.insert(v) if avl else insert_bst(root, v, persistent=True)
+        frames.append(root)
+    return frames
+
+def distinct_nodes(frames):
+    # Nodes reachable from any frame, counting shared subtrees once
+    seen = set()
+    stack = list(frames)
+    while stack:
+        node = stack.pop()
+        if node is None or id(node) in seen:
+            continue
+        seen.add(id(node))
+        stack.append(node.left)
+        stack.append(node.right)
+    return len(seen)
+
+def bytes_per_node(avl):
+    values = random.Random(0).sample(range(1_000, 2_000), 1_000)
+    tracemalloc.start()
+    frames = persistent_frames(values, avl)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / distinct_nodes(frames)
+
+def measure(build, values, avl):
+    start = time.perf_counter()
+    frames = build(values, avl)
+    elapsed = time.perf_counter() - start
+    return elapsed, distinct_nodes(frames)
+
+def main(n=N):
+    values = random.Random(42).sample(range(10 * n), n)
+    print(f"{n:,}-value grow animation: build time and nodes held by the frame list\n")
+    print(f"{'tree':>5} {'deepcopy':>24} {'persistent':>24}")
+    for label, avl in (("BST", False), ("AVL", True)):
+        per_node = bytes_per_node(avl)
+        old_time, old_nodes = measure(deepcopy_frames, values, avl)
+        new_time, new_nodes = measure(persistent_frames, values, avl)
+        print(f"{label:>5} {old_time:>7.2f}s {old_nodes:>9,} nodes {new_time:>7.2f}s {new_nodes:>9,} nodes"
+              f"  (~{old_nodes * per_node / 2**20:.0f} MB vs ~{new_nodes * per_node / 2**20:.1f} MB)")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else N)
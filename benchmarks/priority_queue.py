@@ -0,0 +1,67 @@
+# Compares PriorityQueue against keeping the FIFO Queue sorted by hand: each insert rotates
+# the whole queue once to slot the new value in, so n inserts cost O(n^2) against the
+# heap's O(n log n). Both then hand out all n values smallest first.
+# Run from the project root: python -m benchmarks.priority_queue [max_n]
+import random
+import sys
+import time
+from data_structures.priority_queue import PriorityQueue
+from data_structures.queue import Queue
+
+SIZES = [100, 1_000, 10_000, 100_000]
+SORTED_QUEUE_LIMIT = 10_000 # Quadratic, so the largest size is skipped
+
+def sorted_queue_insert(queue, value):
+    # Only FIFO operations: dequeue every item and enqueue it again, putting value in
+    # front of the first larger one
+    placed = False
+    for _ in range(len(queue)):
+        item = queue.dequeue()
+        if not placed and value < item:
+            queue.enqueue(value)
+            placed = True
+        queue.enqueue(item)
+    if not placed:
+        queue.enqueue(value)
+
+def sorted_queue(values):
+    queue = Queue()
+    for v in values:
+        sorted_queue_insert(queue, v)
+    while len(queue):
+        queue.dequeue()
+
+def heap_push(values):
+    pq = PriorityQueue()
+    for v in values:
+        pq.push(v)
+    while len(pq):
+        pq.pop()
+
+def heap_heapify(values):
+    pq = PriorityQueue(values)
+    while len(pq):
+        pq.pop()
+
+def heap_pushpop(values):
+    # A top-k filter: keep the 100 largest values seen, as a stream goes by
+    pq = PriorityQueue(values[:100])
+    for v in values[100:]:
+        pq.pushpop(v)
+
+def timed(run, values):
+    start = time.perf_counter()
+    run(values)
+    return time.perf_counter() - start
+
+def main(max_n=SIZES[-1]):
+    print(f"{'n':>8} {'sorted Queue':>13} {'push/pop':>10} {'heapify/pop':>12} {'pushpop top-100':>16}   (seconds)")
+    for n in SIZES:
+        if n > max_n:
+            break
+        values = random.Random(n).sample(range(10 * n), n)
+        slow = f"{timed(sorted_queue, values):>13.4f}" if n <= SORTED_QUEUE_LIMIT else f"{'-':>13}"
+        print(f"{n:>8} {slow} {timed(heap_push, values):>10.4f} {timed(heap_heapify, values):>12.4f} {timed(heap_pushpop, values):>16.4f}")
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,60 @@
+# Compares the circular-buffer Queue against the old list-backed Queue at 10^6 operations.
+# Run from the project root: python -m benchmarks.queue [--full]
+import sys
+import time
+from data_structures.queue import Queue
+
+OPERATIONS = 1_000_000
+DEPTHS = [100, 10_000, 100_000] # How many items sit in the queue while it is being worked
+LEGACY_LIMIT = 10_000 # pop(0) is O(depth), so the deepest run only happens with --full
+BATCH = 1_000
+
+# The implementation before the circular buffer, kept here so the numbers stay comparable
+class LegacyQueue:
+    def __init__(self, values=None):
+        self.items = []
+        if values:
+            for value in values:
+                self.enqueue(value)
+
+    def enqueue(self, value):
+        self.items.append(value)
+
+    def dequeue(self):
+        if self.items:
+            return self.items.pop(0)
+        return None
+
+def steady_state(cls, depth):
+    # Alternate enqueue and dequeue while the queue holds `depth` items
+    queue = cls(range(depth))
+    enqueue, dequeue = queue.enqueue, queue.dequeue
+    start = time.perf_counter()
+    for i in range(OPERATIONS // 2):
+        enqueue(i)
+        dequeue()
+    return time.perf_counter() - start
+
+def batched(depth):
+    queue = Queue(range(depth))
+    chunk = list(range(BATCH))
+    start = time.perf_counter()
+    for _ in range(OPERATIONS // (2 * BATCH)):
+        queue.enqueue_many(chunk)
+        queue.dequeue_many(BATCH)
+    return time.perf_counter() - start
+
+def main(full=False):
+    print(f"{OPERATIONS:,} operations (half enqueue, half dequeue), ops/s\n")
+    print(f"{'depth':>8} {'legacy':>12} {'ring buffer':>12} {'batched':>12}")
+    for depth in DEPTHS:
+        new = OPERATIONS / steady_state(Queue, depth)
+        bulk = OPERATIONS / batched(depth)
+        if depth <= LEGACY_LIMIT or full:
+            legacy = f"{OPERATIONS / steady_state(LegacyQueue, depth):>12,.0f}"
+        else:
+            legacy = f"{'skipped':>12}"
+        print(f"{depth:>8} {legacy} {new:>12,.0f} {bulk:>12,.0f}")
+
+if __name__ == "__main__":
+    main(full="--full" in sys.argv)
@@ -0,0 +1,83 @@
+# Multi-producer/multi-consumer throughput of ConcurrentQueue (threads) and AsyncQueue
+# (asyncio tasks), with 1 to 16 producers and as many consumers, getting one item at a
+# time or in batches. Every run moves the same number of items through a bounded queue.
+# Run from the project root: python -m benchmarks.queue_concurrency [items]
+import asyncio
+import sys
+import threading
+import time
+from data_structures.queue import AsyncQueue, ConcurrentQueue
+
+WORKERS = [1, 2, 4, 8, 16] # Producers, and as many consumers
+MAXSIZE = 1_000
+BATCH = 64
+DONE = object() # One per consumer, after every producer has finished
+
+def threaded(workers, items, batch):
+    queue = ConcurrentQueue(maxsize=MAXSIZE)
+    per_producer = items // workers
+
+    def produce():
+        for i in range(per_producer):
+            queue.put(i)
+
+    def consume():
+        while True:
+            values = queue.get_batch(batch) if batch > 1 else [queue.get()]
+            if values[-1] is DONE:
+                # A batch can grab other consumers' DONEs too; hand those back
+                for _ in range(values.count(DONE) - 1):
+                    queue.put(DONE)
+                return
+
+    producers = [threading.Thread(target=produce) for _ in range(workers)]
+    consumers = [threading.Thread(target=consume) for _ in range(workers)]
+    start = time.perf_counter()
+    for thread in producers + consumers:
+        thread.start()
+    for thread in producers:
+        thread.join()
+    for _ in consumers:
+        queue.put(DONE)
+    for thread in consumers:
+        thread.join()
+    return per_producer * workers / (time.perf_counter() - start)
+
+async def tasks(workers, items, batch):
+    queue = AsyncQueue(maxsize=MAXSIZE)
+    per_producer = items // workers
+
+    async def produce():
+        for i in range(per_producer):
+            await queue.put(i)
+
+    async def consume():
+        while True:
+            values = await queue.get_batch(batch) if batch > 1 else [await queue.get()]
+            if values[-1] is DONE:
+                for _ in range(values.count(DONE) - 1):
+                    await queue.put(DONE)
+                return
+
+    start = time.perf_counter()
+    consumers = [asyncio.create_task(consume()) for _ in range(workers)]
+    await asyncio.gather(*(produce() for _ in range(workers)))
+    for _ in consumers:
+        await queue.put(DONE)
+    await asyncio.gather(*consumers)
+    return per_producer * workers / (time.perf_counter() - start)
+
+def main(items=100_000):
+    print(f"{items:,} items, queue bounded at {MAXSIZE}, batches of {BATCH}")
+    print(f"{'workers':>7} {'threads':>13} {'threads batch':>13} {'tasks':>13} {'tasks batch':>13}   (items/s)")
+    for workers in WORKERS:
+        row = [
+            threaded(workers, items, 1),
+            threaded(workers, items, BATCH),
+            asyncio.run(tasks(workers, items, 1)),
+            asyncio.run(tasks(workers, items, BATCH)),
+        ]
+        print(f"{workers:>7} " + " ".join(f"{rate:>13,.0f}" for rate in row))
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
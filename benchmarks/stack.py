@@ -0,0 +1,51 @@
+# Compares memory per element and bulk push/pop of TypedStack against the list-backed Stack.
+# Run from the project root: python -m benchmarks.stack
+import time
+import tracemalloc
+from array import array
+from data_structures.stack import Stack, TypedStack
+
+N = 1_000_000
+BATCH = 10_000
+
+def bytes_per_item(build):
+    tracemalloc.start()
+    stack = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del stack
+    return size / N
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+def push_pop_each(stack, values):
+    for value in values:
+        stack.push(value)
+    while len(stack):
+        stack.pop()
+
+def push_pop_batched(stack, values):
+    for i in range(0, len(values), BATCH):
+        stack.push_many(values[i:i + BATCH])
+    while len(stack):
+        stack.pop_many(BATCH)
+
+def main():
+    floats = array("d", (i * 0.5 for i in range(N)))
+    boxed = floats.tolist()
+    # The floats are built inside the traced block for Stack, since boxing them is part of its cost
+    list_bytes = bytes_per_item(lambda: Stack(floats.tolist()))
+    typed_bytes = bytes_per_item(lambda: TypedStack("d", floats))
+    print(f"Bytes per float64: Stack {list_bytes:.1f}, TypedStack {typed_bytes:.1f} "
+          f"({list_bytes / typed_bytes:.1f}x less)")
+
+    print(f"\n{N:,} pushes then {N:,} pops (s)")
+    print(f"  Stack, one at a time:      {timed(lambda: push_pop_each(Stack(), boxed)):.3f}")
+    print(f"  TypedStack, one at a time: {timed(lambda: push_pop_each(TypedStack('d'), boxed)):.3f}")
+    print(f"  TypedStack, {BATCH:,} per call: {timed(lambda: push_pop_batched(TypedStack('d'), floats)):.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+# Benchmark suite: every structure and renderer at input sizes from 10 to 10^6, with
+# per-case scaling exponents, JSON results and comparison against an earlier run.
+# Run from the project root:
+#   python -m benchmarks.suite                          # everything, print the table
+#   python -m benchmarks.suite --max-size 10000         # quick run
+#   python -m benchmarks.suite --json new.json --compare old.json --plot curves.png
+#   python -m benchmarks.suite avl bst                  # only cases whose name contains a word
+#
+# Each case has a setup (not timed) and a run (timed). A measurement repeats setup + run
+# until MIN_TIME has been spent or MAX_REPEATS is reached, and keeps the fastest run.
+# The scaling exponent between two sizes is the slope of log(time) against log(n): about 1
+# for linear work, 2 for quadratic. Anything above SUPERLINEAR is flagged.
+# --compare exits with status 1 if any case got more than --threshold times slower.
+import argparse
+import json
+import math
+import platform
+import random
+import subprocess
+import sys
+import time
+import matplotlib
+matplotlib.use("Agg")
+from data_structures.avl_tree import AVLTree
+from data_structures.linked_list import LinkedList, UnrolledLinkedList
+from data_structures.priority_queue import PriorityQueue
+from data_structures.queue import Queue
+from data_structures.stack import Stack
+from data_structures.tree import insert_bst
+from visualizations.animations import traverse_tree
+from visualizations.frame_cache import figure_png
+from visualizations.render import LinkedListView, draw_linked_list, draw_queue, draw_stack, draw_tree
+
+SIZES = [10, 100, 1_000, 10_000, 100_000, 1_000_000]
+MIN_TIME = 0.2 # Seconds of timed runs per measurement
+MAX_REPEATS = 200
+SUPERLINEAR = 1.3
+
+CASES = {} # name -> (setup(n) returning the run's arguments, run(*arguments), largest n)
+
+def case(name, setup, max_size=SIZES[-1]):
+    # Registers the decorated function as the timed run of a case
+    def register(run):
+        CASES[name] = (setup, run, max_size)
+        return run
+    return register
+
+def random_values(n):
+    return random.Random(n).sample(range(10 * n), n)
+
+def build_bst(values):
+    root = None
+    for v in values:
+        root = insert_bst(root, v)
+    return root
+
+# Structures
+
+@case("linked_list.append", lambda n: (range(n),))
+def linked_list_append(values):
+    ll = LinkedList()
+    for v in values:
+        ll.append(v)
+
+@case("linked_list.iterate", lambda n: (LinkedList(range(n)),))
+def linked_list_iterate(ll):
+    for _ in ll:
+        pass
+
+# Positional edits in the middle: each one skips about n / 64 chunks
+@case("unrolled.insert_delete_middle", lambda n: (UnrolledLinkedList(range(n)),))
+def unrolled_insert_delete_middle(ul):
+    for _ in range(100):
+        ul.insert_at(len(ul) // 2, 0)
+        ul.delete_at(len(ul) // 2)
+
+# First call builds the value index; the rest are dictionary lookups
+@case("linked_list.find_first", lambda n: (LinkedList(range(n)), random_values(100)))
+def linked_list_find_first(ll, values):
+    for v in values:
+        ll.find_first(v)
+
+@case("stack.push_pop", lambda n: (Stack(), range(n)))
+def stack_push_pop(stack, values):
+    for v in values:
+        stack.push(v)
+    while len(stack):
+        stack.pop()
+
+@case("queue.enqueue_dequeue", lambda n: (Queue(), range(n)))
+def queue_enqueue_dequeue(queue, values):
+    for v in values:
+        queue.enqueue(v)
+    while len(queue):
+        queue.dequeue()
+
+@case("priority_queue.push_pop", lambda n: (PriorityQueue(), random_values(n)))
+def priority_queue_push_pop(pq, values):
+    for v in values:
+        pq.push(v)
+    while len(pq):
+        pq.pop()
+
+@case("priority_queue.heapify", lambda n: (PriorityQueue(), random_values(n)))
+def priority_queue_heapify(pq, values):
+    pq.heapify(values)
+
+@case("bst.insert_random", lambda n: (random_values(n),))
+def bst_insert_random(values):
+    build_bst(values)
+
+# Sorted input makes a plain BST a linked list, so this one is quadratic by design
+@case("bst.insert_sorted", lambda n: (range(n),), max_size=10_000)
+def bst_insert_sorted(values):
+    build_bst(values)
+
+@case("avl.insert_random", lambda n: (random_values(n),))
+def avl_insert_random(values):
+    AVLTree(values)
+
+@case("avl.insert_sorted", lambda n: (range(n),))
+def avl_insert_sorted(values):
+    AVLTree(values)
+
+@case("traverse_tree.in_order", lambda n: (AVLTree(random_values(n)).root,))
+def traverse_in_order(root):
+    for _ in traverse_tree(root, "In-order"):
+        pass
+
+@case("traverse_tree.level_order", lambda n: (AVLTree(random_values(n)).root,))
+def traverse_level_order(root):
+    for _ in traverse_tree(root, "Level-order"):
+        pass
+
+# How the tree views found each insert before InsertTrace: walk two versions of the tree
+# side by side until one has a node the other lacks. Kept here so the numbers stay comparable.
+def find_insertion(prev, curr):
+    # Returns (inserted_value, parent_value, direction) or (None, None, None)
+    if not prev:
+        return (curr.value, None, None)
+    stack = [(prev, curr, None)]
+    while stack:
+        prev_node, curr_node, parent = stack.pop()
+        if not prev_node and curr_node:
+            # New node inserted
+            return (curr_node.value, parent.value if parent else None, 'left' if parent and parent.left == curr_node else 'right')
+        if prev_node and curr_node:
+            stack.append((prev_node.left, curr_node.left, curr_node))
+            stack.append((prev_node.right, curr_node.right, curr_node))
+    return (None, None, None)
+
+def insertion_pair(n):
+    # Two versions of a tree, the second with one more value, sharing unchanged subtrees
+    values = random_values(n + 1)
+    before = build_bst(values[:-1])
+    return before, insert_bst(before, values[-1], persistent=True)
+
+@case("find_insertion", insertion_pair)
+def find_insertion_case(before, after):
+    find_insertion(before, after)
+
+# Renderers: figure plus PNG encoding, as the app shows them
+
+@case("draw_tree", lambda n: (AVLTree(random_values(n)).root,), max_size=10_000)
+def draw_tree_case(root):
+    figure_png(draw_tree(root, [root.value], return_fig=True))
+
+@case("draw_stack", lambda n: (Stack(range(n)),), max_size=1_000)
+def draw_stack_case(stack):
+    figure_png(draw_stack(stack, return_fig=True))
+
+@case("draw_queue", lambda n: (Queue(range(n)),), max_size=1_000)
+def draw_queue_case(queue):
+    figure_png(draw_queue(queue, return_fig=True))
+
+@case("draw_linked_list", lambda n: (LinkedList(range(n)),), max_size=1_000)
+def draw_linked_list_case(ll):
+    figure_png(draw_linked_list(ll, 0, return_fig=True))
+
+def linked_list_view(n):
+    view = LinkedListView(LinkedList(range(n)))
+    view.png(None) # Draws the base image, which a search does once up front
+    return view, n // 2
+
+# One search step: restore under the last highlight, draw the new one, encode the window
+@case("linked_list_view.step", linked_list_view, max_size=1_000)
+def linked_list_view_step(view, index):
+    view.png(index)
+    view.close()
+
+def measure(setup, run, n):
+    times = []
+    while len(times) < MAX_REPEATS and sum(times) < MIN_TIME:
+        arguments = setup(n)
+        start = time.perf_counter()
+        run(*arguments)
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return {"min": times[0], "median": times[len(times) // 2], "repeats": len(times)}
+
+def exponent(results, n0, n1):
+    return math.log(results[n1]["min"] / results[n0]["min"]) / math.log(n1 / n0)
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_suite(names, max_size):
+    results = {}
+    print(f"{'case':<28} {'n':>9} {'min':>11} {'per item':>11} {'exponent':>9}")
+    for name in names:
+        setup, run, case_max = CASES[name]
+        results[name] = {}
+        run(*setup(SIZES[0])) # Warm up: first-call imports and caches shouldn't count
+        previous = None
+        for n in SIZES:
+            if n > min(max_size, case_max):
+                break
+            results[name][n] = measure(setup, run, n)
+            best = results[name][n]["min"]
+            slope = ""
+            if previous is not None:
+                k = exponent(results[name], previous, n)
+                slope = f"{k:.2f}" + (" !" if k > SUPERLINEAR else "")
+            print(f"{name:<28} {n:>9} {best * 1000:>9.3f}ms {best / n * 1e9:>9.0f}ns {slope:>9}")
+            previous = n
+    return results
+
+def compare(results, baseline, threshold):
+    # Returns the (case, n, ratio) entries that are more than threshold times slower
+    regressions = []
+    print(f"\n{'case':<28} {'n':>9} {'before':>11} {'after':>11} {'ratio':>7}")
+    for name, by_size in results.items():
+        for n, result in by_size.items():
+            old = baseline.get(name, {}).get(str(n))
+            if old is None:
+                continue
+            ratio = result["min"] / old["min"]
+            flag = " REGRESSION" if ratio > threshold else ""
+            print(f"{name:<28} {n:>9} {old['min'] * 1000:>9.3f}ms {result['min'] * 1000:>9.3f}ms {ratio:>6.2f}x{flag}")
+            if flag:
+                regressions.append((name, n, ratio))
+    return regressions
+
+def plot(results, path):
+    import matplotlib.pyplot as plt
+    fig, ax = plt.subplots(figsize=(10, 7))
+    for name, by_size in results.items():
+        sizes = sorted(by_size)
+        ax.loglog(sizes, [by_size[n]["min"] for n in sizes], marker="o", label=name)
+    ax.set_xlabel("n")
+    ax.set_ylabel("seconds (fastest run)")
+    ax.grid(True, which="both", alpha=0.3)
+    ax.legend(fontsize=8)
+    fig.savefig(path, dpi=120, bbox_inches="tight")
+    plt.close(fig)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark every data structure and renderer.")
+    parser.add_argument("filters", nargs="*", help="only run cases whose name contains one of these")
+    parser.add_argument("--max-size", type=int, default=SIZES[-1])
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--compare", help="JSON results from an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25, help="slowdown ratio counted as a regression")
+    parser.add_argument("--plot", help="write log-log scaling curves to this image")
+    args = parser.parse_args(argv)
+
+    names = [name for name in CASES if not args.filters or any(f in name for f in args.filters)]
+    results = run_suite(names, args.max_size)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"commit": git_commit(), "python": platform.python_version(), "machine": platform.machine(), "results": results}, f, indent=1)
+    if args.plot:
+        plot(results, args.plot)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold}x")
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
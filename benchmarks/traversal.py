@@ -0,0 +1,54 @@
+# Times generating traversal frames for a degenerate (sorted-input) BST, old deepcopy frames vs events.
+# Run from the project root: python -m benchmarks.traversal [n]
+import copy
+import sys
+import time
+from data_structures.traversal import TRAVERSALS
+from data_structures.tree import TreeNode
+from visualizations.animations import traverse_tree
+
+N = 5_000
+LEGACY_SIZES = [50, 100, 150] # The old version copies the tree per step and recurses, so it stays small
+
+def degenerate_tree(n):
+    # What insert_bst builds from sorted input: a right-leaning chain
+    root = node = TreeNode(0)
+    for value in range(1, n):
+        node.right = TreeNode(value)
+        node = node.right
+    return root
+
+def legacy_pre_order(root):
+    # The old traverse_tree: recursive, one deepcopy of the whole tree per visited node
+    frames = []
+    def visit(n, parent):
+        if n:
+            frames.append((copy.deepcopy(root), f"Pre-order: Visit {n.value}", [n.value]))
+            visit(n.left, n)
+            visit(n.right, n)
+    visit(root, None)
+    return frames
+
+def timed(fn):
+    start = time.perf_counter()
+    try:
+        fn()
+    except RecursionError:
+        return None
+    return time.perf_counter() - start
+
+def main(n=N):
+    print("Old deepcopy frames (pre-order):")
+    for size in LEGACY_SIZES + [n]:
+        tree = degenerate_tree(size)
+        elapsed = timed(lambda: legacy_pre_order(tree))
+        print(f"  {size:>6} nodes: " + (f"{elapsed:.3f}s" if elapsed is not None else "RecursionError"))
+
+    tree = degenerate_tree(n)
+    print(f"\nEvent frames, {n:,}-node degenerate tree:")
+    for traversal in TRAVERSALS:
+        elapsed = timed(lambda: list(traverse_tree(tree, traversal)))
+        print(f"  {traversal:>11}: {elapsed * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else N)
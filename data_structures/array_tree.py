@@ -0,0 +1,170 @@
+from array import array
+
+NIL = 0 # Index 0 is a sentinel "no node" with height 0, so children never need a None check
+
+class ArrayAVLTree:
+    # The same AVL tree as AVLTree, but stored as parallel arrays (struct of arrays) instead of
+    # one Python object per node. A node is just an integer index: its value is values[i], its
+    # children are left[i] and right[i], and its height is height[i]. Each node costs about
+    # 17 bytes of contiguous memory instead of a full object with a __dict__.
+    def __init__(self, values=None, dtype="q"):
+        self.values = array(dtype, [0])
+        self.left = array("i", [NIL])
+        self.right = array("i", [NIL])
+        self.height = array("b", [0]) # AVL height stays under 1.45 * log2(n), far below 127
+        self.root = NIL
+        if values:
+            for value in values:
+                self.insert(value)
+
+    def __len__(self):
+        return len(self.values) - 1
+
+    def __contains__(self, value):
+        return self.search(value) != NIL
+
+    def __iter__(self):
+        for i in self.in_order():
+            yield self.values[i]
+
+    def insert(self, value):
+        # Same steps as AVLTree.insert: walk down, attach, then retrace the path
+        values, left, right = self.values, self.left, self.right
+        path = []
+        i = self.root
+        while i != NIL:
+            path.append(i)
+            i = left[i] if value < values[i] else right[i]
+
+        new = len(values)
+        values.append(value)
+        left.append(NIL)
+        right.append(NIL)
+        self.height.append(1)
+        if not path:
+            self.root = new
+        elif value < values[path[-1]]:
+            left[path[-1]] = new
+        else:
+            right[path[-1]] = new
+
+        self.retrace(path)
+        return new
+
+    def search(self, value):
+        # Returns the index of a node holding value, or NIL
+        values, left, right = self.values, self.left, self.right
+        i = self.root
+        while i != NIL and values[i] != value:
+            i = left[i] if value < values[i] else right[i]
+        return i
+
+    def retrace(self, path):
+        left, right, height = self.left, self.right, self.height
+        for k in range(len(path) - 1, -1, -1):
+            i = path[k]
+            left_height = height[left[i]]
+            right_height = height[right[i]]
+            if -1 <= left_height - right_height <= 1:
+                new_height = 1 + max(left_height, right_height)
+                if new_height == height[i]:
+                    return
+                height[i] = new_height
+                continue
+            subtree = self.rebalance(i)
+            if k == 0:
+                self.root = subtree
+            elif left[path[k - 1]] == i:
+                left[path[k - 1]] = subtree
+            else:
+                right[path[k - 1]] = subtree
+
+    def rebalance(self, i):
+        left, right = self.left, self.right
+        balance = self.get_balance(i)
+        if balance > 1:
+            if self.get_balance(left[i]) < 0:
+                left[i] = self.left_rotate(left[i])
+            return self.right_rotate(i)
+        if balance < -1:
+            if self.get_balance(right[i]) > 0:
+                right[i] = self.right_rotate(right[i])
+            return self.left_rotate(i)
+        return i
+
+    def left_rotate(self, z):
+        left, right, height = self.left, self.right, self.height
+        y = right[z]
+        right[z] = left[y]
+        left[y] = z
+        height[z] = 1 + max(height[left[z]], height[right[z]])
+        height[y] = 1 + max(height[left[y]], height[right[y]])
+        return y
+
+    def right_rotate(self, z):
+        left, right, height = self.left, self.right, self.height
+        y = left[z]
+        left[z] = right[y]
+        right[y] = z
+        height[z] = 1 + max(height[left[z]], height[right[z]])
+        height[y] = 1 + max(height[left[y]], height[right[y]])
+        return y
+
+    def get_balance(self, i):
+        return self.height[self.left[i]] - self.height[self.right[i]]
+
+    # Traversals yield node indices; look values up with tree.values[i]
+
+    def in_order(self):
+        left, right = self.left, self.right
+        stack = []
+        i = self.root
+        while stack or i != NIL:
+            while i != NIL:
+                stack.append(i)
+                i = left[i]
+            i = stack.pop()
+            yield i
+            i = right[i]
+
+    def pre_order(self):
+        left, right = self.left, self.right
+        stack = [self.root] if self.root != NIL else []
+        while stack:
+            i = stack.pop()
+            yield i
+            if right[i] != NIL:
+                stack.append(right[i])
+            if left[i] != NIL:
+                stack.append(left[i])
+
+    def post_order(self):
+        # Reverse of a root, right, left walk
+        left, right = self.left, self.right
+        order = []
+        stack = [self.root] if self.root != NIL else []
+        while stack:
+            i = stack.pop()
+            order.append(i)
+            if left[i] != NIL:
+                stack.append(left[i])
+            if right[i] != NIL:
+                stack.append(right[i])
+        return reversed(order)
+
+    def level_order(self):
+        left, right = self.left, self.right
+        level = [self.root] if self.root != NIL else []
+        while level:
+            next_level = []
+            for i in level:
+                yield i
+                if left[i] != NIL:
+                    next_level.append(left[i])
+                if right[i] != NIL:
+                    next_level.append(right[i])
+            level = next_level
+
+    def nbytes(self):
+        # Bytes used by the node buffers (allocated capacity may be slightly larger)
+        return sum(len(buffer) * buffer.itemsize for buffer in (self.values, self.left, self.right, self.height))
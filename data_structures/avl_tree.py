@@ -1,96 +1,342 @@
+from data_structures.tree import copy_path
+
 class AVLTreeNode:
     def __init__(self, value):
         self.value = value
         self.left = None
         self.right = None
         self.height = 1 # Height is needed to calculate the balance factor
+        self.size = 1 # Number of nodes in this subtree, used by rank/select
+
+    def copy(self):
+        # Shallow copy: same value, height and size, pointing at the same children
+        node = AVLTreeNode(self.value)
+        node.left, node.right = self.left, self.right
+        node.height, node.size = self.height, self.size
+        return node
 
 class AVLTree:
-    def insert(self, root, value):
-        # 1. Base case: If the tree is empty, return a new node
-        if not root:
-            return AVLTreeNode(value)
-
-        # 2. Recursive case: Insert the value into the appropriate subtree
-        if value < root.value:
-            root.left = self.insert(root.left, value)
+    # The tree owns its root. Inserts and deletes walk down iteratively and keep the
+    # nodes they passed on a stack (the path), then walk back up that stack to rebalance.
+    #
+    # With persistent=True nodes are never changed in place. Each insert/delete copies the
+    # nodes on its path (plus the few a rotation touches) and shares everything else, so the
+    # root returned by every insert stays a valid, unchanged version of the tree.
+    def __init__(self, values=None, persistent=False):
+        self.root = None
+        self.size = 0
+        self.persistent = persistent
+        if values:
+            for value in values:
+                self.insert(value)
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, value):
+        return self.search(value) is not None
+
+    def __iter__(self):
+        # In-order (sorted) values, using an explicit stack instead of recursion
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.value
+            node = node.right
+
+    def insert(self, value, trace=None):
+        # Pass an InsertTrace as trace to get a record of the comparisons and rotations made
+        # 1. Walk down like a BST: go left if smaller, right if greater or equal
+        path = []
+        node = self.root
+        while node:
+            path.append(node)
+            node = node.left if value < node.value else node.right
+        if trace is not None:
+            trace.record_path(value, path)
+        if self.persistent:
+            path = self.copy_path(path)
+        for node in path:
+            node.size += 1 # The new node will end up somewhere below each of these
+
+        # 2. Attach the new node to the last node on the path
+        new_node = AVLTreeNode(value)
+        if not path:
+            self.root = new_node
+        elif value < path[-1].value:
+            path[-1].left = new_node
+        else:
+            path[-1].right = new_node
+        self.size += 1
+
+        # 3. Walk back up, updating heights and rotating where needed
+        updated = self.retrace(path, trace)
+        if trace is not None:
+            trace.height_updates = updated
+        return self.root
+
+    def delete(self, value):
+        # Returns False if the value is not in the tree
+        path = []
+        node = self.root
+        while node and node.value != value:
+            path.append(node)
+            node = node.left if value < node.value else node.right
+        if not node:
+            return False
+
+        # A node with two children takes its in-order successor's value,
+        # and the successor (which has no left child) is removed instead
+        removed = node
+        if node.left and node.right:
+            target = len(path)
+            path.append(node)
+            removed = node.right
+            while removed.left:
+                path.append(removed)
+                removed = removed.left
+        if self.persistent:
+            path = self.copy_path(path)
+        if removed is not node:
+            path[target].value = removed.value
+
+        # Every node on the path loses one descendant
+        for ancestor in path:
+            ancestor.size -= 1
+
+        # The removed node has at most one child, which takes its place
+        child = removed.left or removed.right
+        if not path:
+            self.root = child
+        elif path[-1].left is removed:
+            path[-1].left = child
         else:
-            root.right = self.insert(root.right, value)
+            path[-1].right = child
+        self.size -= 1
+
+        self.retrace(path)
+        return True
+
+    def search(self, value):
+        # Returns the node holding value, or None
+        node = self.root
+        while node and node.value != value:
+            node = node.left if value < node.value else node.right
+        return node
+
+    def min(self):
+        node = self.root
+        if not node:
+            return None
+        while node.left:
+            node = node.left
+        return node.value
 
-        # 3. Update the height of the ancestor node
-        root.height = 1 + max(self.get_height(root.left),
-                              self.get_height(root.right))
+    def max(self):
+        node = self.root
+        if not node:
+            return None
+        while node.right:
+            node = node.right
+        return node.value
+
+    # Order statistics: every node knows its subtree size, so these only walk one root-to-leaf path
+
+    def rank(self, value):
+        # Number of values in the tree smaller than value
+        return self.count_below(value, inclusive=False)
+
+    def select(self, k):
+        # The k-th smallest value (0-based), or None if k is out of range
+        if k < 0 or k >= self.size:
+            return None
+        node = self.root
+        while node:
+            left_size = self.get_size(node.left)
+            if k < left_size:
+                node = node.left
+            elif k == left_size:
+                return node.value
+            else:
+                k -= left_size + 1
+                node = node.right
+
+    def count_range(self, lo, hi):
+        # Number of values v with lo <= v <= hi
+        if hi < lo:
+            return 0
+        return self.count_below(hi, inclusive=True) - self.count_below(lo, inclusive=False)
+
+    def range_iter(self, lo, hi):
+        # Values v with lo <= v <= hi in sorted order, skipping subtrees that lie entirely below lo
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                if node.value < lo:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if hi < node.value:
+                return
+            yield node.value
+            node = node.right
+
+    def count_below(self, value, inclusive):
+        # Number of values < value (or <= value if inclusive). Equal values can sit on
+        # either side after rotations, so we only go right once we know the node counts.
+        count = 0
+        node = self.root
+        while node:
+            if node.value < value or (inclusive and node.value == value):
+                count += self.get_size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return count
+
+    def copy_path(self, path):
+        # Persistent mode: copy the path so the changes below never touch an older version
+        copies = copy_path(path)
+        if copies:
+            self.root = copies[0]
+        return copies
 
-        # 4. Get the balance factor
-        balance = self.get_balance(root)
+    def own(self, node):
+        # The node itself, or in persistent mode a copy that is safe to change
+        if self.persistent:
+            return node.copy()
+        return node
+
+    def snapshot(self, path):
+        # A frozen copy of the tree as it is right now, copying only the path from the root.
+        # Heights above the path's end haven't been retraced yet, so they are recomputed here.
+        copies = copy_path(path)
+        for node in reversed(copies):
+            node.height = 1 + max(self.get_height(node.left),
+                                  self.get_height(node.right))
+        return copies[0]
+
+    def retrace(self, path, trace=None):
+        # Fix heights on the path, bottom up. An unbalanced node is rotated and the
+        # new subtree root is hooked back onto the node above it. Once a node's height
+        # comes out unchanged, nothing above it can change either, so we stop early.
+        # Returns how many nodes were retraced before stopping.
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            left_height = node.left.height if node.left else 0
+            right_height = node.right.height if node.right else 0
+            if -1 <= left_height - right_height <= 1:
+                height = 1 + max(left_height, right_height)
+                if height == node.height:
+                    return len(path) - 1 - i
+                node.height = height
+                continue
+            if trace is not None and self.persistent and trace.unbalanced_root is None:
+                trace.unbalanced_root = self.snapshot(path[:i + 1])
+            subtree = self.rebalance(node, trace)
+            if i == 0:
+                self.root = subtree
+            elif path[i - 1].left is node:
+                path[i - 1].left = subtree
+            else:
+                path[i - 1].right = subtree
+        return len(path)
+
+    def rebalance(self, node, trace=None):
+        # Returns the root of the subtree after any rotation
+        node.height = 1 + max(self.get_height(node.left),
+                              self.get_height(node.right))
+        balance = self.get_balance(node)
 
-        # 5. Rebalancing
         # * If the balance factor is outside the range [-1, 1], then the tree is unbalanced.
         #   - A balance factor of 0 means the left and right subtrees are of equal height.
         #   - A balance factor of 1 means the left subtree is taller by 1 level.
         #   - A balance factor of -1 means the right subtree is taller by 1 level.
         #   - So, if left and right subtree both have the height of 3 then 3-3=0. This means they are balanced.
+        # * The child's balance factor tells which case we are in, which works after deletes too.
+        if balance > 1:
+            # Left Right Case: turn it into a Left Left Case first
+            if self.get_balance(node.left) < 0:
+                if trace is not None:
+                    trace.rotations.append(('left', node.left.value))
+                node.left = self.left_rotate(self.own(node.left))
+            # Left Left Case
+            if trace is not None:
+                trace.rotations.append(('right', node.value))
+            return self.right_rotate(node)
 
-        # Left Left Case
-        if balance > 1 and value < root.left.value:
-            return self.right_rotate(root)
-
-        # Right Right Case
-        if balance < -1 and value > root.right.value:
-            return self.left_rotate(root)
-
-        # Left Right Case
-        if balance > 1 and value > root.left.value:
-            root.left = self.left_rotate(root.left)
-            return self.right_rotate(root)
+        if balance < -1:
+            # Right Left Case: turn it into a Right Right Case first
+            if self.get_balance(node.right) > 0:
+                if trace is not None:
+                    trace.rotations.append(('right', node.right.value))
+                node.right = self.right_rotate(self.own(node.right))
+            # Right Right Case
+            if trace is not None:
+                trace.rotations.append(('left', node.value))
+            return self.left_rotate(node)
 
-        # Right Left Case
-        if balance < -1 and value < root.right.value:
-            root.right = self.right_rotate(root.right)
-            return self.left_rotate(root)
-
-        return root
+        return node
 
     def left_rotate(self, z):
-        y = z.right
+        y = self.own(z.right)
         T2 = y.left
 
         # Perform rotation
         y.left = z
         z.right = T2
 
-        # Update heights
+        # Update heights and sizes
         z.height = 1 + max(self.get_height(z.left),
                            self.get_height(z.right))
         y.height = 1 + max(self.get_height(y.left),
                            self.get_height(y.right))
+        y.size = z.size
+        z.size = 1 + self.get_size(z.left) + self.get_size(z.right)
 
         # Return the new root
         return y
 
     def right_rotate(self, z):
-        y = z.left
+        y = self.own(z.left)
         T3 = y.right
 
         # Perform rotation
         y.right = z
         z.left = T3
 
-        # Update heights
+        # Update heights and sizes
         z.height = 1 + max(self.get_height(z.left),
                            self.get_height(z.right))
         y.height = 1 + max(self.get_height(y.left),
                            self.get_height(y.right))
+        y.size = z.size
+        z.size = 1 + self.get_size(z.left) + self.get_size(z.right)
 
         # Return the new root
         return y
 
     # Returns the height of a node. If the node is None, the height is 0.
-    def get_height(self, node): 
+    def get_height(self, node):
         if not node:
             return 0
         return node.height
 
+    # Returns the number of nodes in a subtree. If the node is None, the size is 0.
+    def get_size(self, node):
+        if not node:
+            return 0
+        return node.size
+
     # Returns the balance factor of a node. If the node is None, the balance factor is 0.
     # Balance factor = height of left subtree - height of right subtree.
     def get_balance(self, node):
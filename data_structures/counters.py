@@ -0,0 +1,216 @@
+import sys
+from data_structures.avl_tree import AVLTree
+from data_structures.linked_list import LinkedList
+from data_structures.queue import Queue
+from data_structures.stack import Stack, TypedStack
+
+# Operation counters: how much work the structures actually do, not how long it takes.
+#
+# Counting is switched on per object with instrument(structure), which swaps the object's
+# class for a counting subclass, and off again with uninstrument(structure). An object that
+# isn't instrumented runs exactly the code it always did, so counting costs nothing until it
+# is turned on. insert_bst is a function, so it takes counters= instead, like trace=.
+#
+#   counters = instrument(AVLTree())
+#   ...
+#   counters.snapshot() -> {"inserts": 1000, "comparisons": 9976, "left_rotations": 495, ...}
+#
+# What gets counted:
+#   AVLTree     inserts, deletes, comparisons (nodes walked), left_rotations, right_rotations,
+#               height_updates (nodes retraced), max_depth
+#   insert_bst  inserts, comparisons, height_updates, max_depth
+#   LinkedList  appends, pops, inserts and deletes (insert_at / delete_at away from the ends,
+#               which are appends and pops), searches (index_of, find_first, find_all, count),
+#               index_builds, hops (next pointers followed: index_of, insert_at and delete_at
+#               walking to their position, and the whole list when the value index is built)
+#   Queue       enqueues, dequeues, rejected, moves (items written or copied), reallocations
+#   Stack       pushes, pops, moves, reallocations (the list or array changed capacity)
+
+class OpCounters:
+    def __init__(self):
+        self.counts = {}
+
+    def add(self, **counts):
+        for name, count in counts.items():
+            self.counts[name] = self.counts.get(name, 0) + count
+
+    def peak(self, **values):
+        # Keeps the largest value seen for each name
+        for name, value in values.items():
+            if value > self.counts.get(name, value - 1):
+                self.counts[name] = value
+
+    def snapshot(self):
+        return dict(self.counts)
+
+    def reset(self):
+        self.counts.clear()
+
+class CountingAVLTree(AVLTree):
+    def insert(self, value, trace=None):
+        self.counters.add(inserts=1)
+        return super().insert(value, trace)
+
+    def delete(self, value):
+        self.counters.add(deletes=1)
+        return super().delete(value)
+
+    def retrace(self, path, trace=None):
+        # Inserts and deletes both end here, with every node they walked past on the path
+        updated = super().retrace(path, trace)
+        self.counters.add(comparisons=len(path), height_updates=updated)
+        self.counters.peak(max_depth=len(path))
+        return updated
+
+    def left_rotate(self, z):
+        self.counters.add(left_rotations=1)
+        return super().left_rotate(z)
+
+    def right_rotate(self, z):
+        self.counters.add(right_rotations=1)
+        return super().right_rotate(z)
+
+class CountingLinkedList(LinkedList):
+    # Appends follow no pointers at all thanks to the tail pointer; searches follow one per node
+    def append(self, value):
+        self.counters.add(appends=1)
+        super().append(value)
+
+    def appendleft(self, value):
+        self.counters.add(appends=1)
+        super().appendleft(value)
+
+    def extend(self, values):
+        size = self.size
+        super().extend(values)
+        self.counters.add(appends=self.size - size)
+
+    def popleft(self):
+        if self.size:
+            self.counters.add(pops=1)
+        return super().popleft()
+
+    def index_of(self, value):
+        index = super().index_of(value)
+        self.counters.add(searches=1, hops=index + 1 if index >= 0 else self.size)
+        return index
+
+    def insert_at(self, index, value):
+        if 0 < index < self.size: # At the ends it appends, which counts itself
+            self.counters.add(inserts=1, hops=index - 1)
+        super().insert_at(index, value)
+
+    def delete_at(self, index):
+        if 0 < index < self.size: # At the head it pops, which counts itself
+            self.counters.add(deletes=1, hops=index - 1)
+        return super().delete_at(index)
+
+    def find_first(self, value):
+        self.count_search()
+        return super().find_first(value)
+
+    def find_all(self, value):
+        self.count_search()
+        return super().find_all(value)
+
+    def count(self, value):
+        self.count_search()
+        return super().count(value)
+
+    def count_search(self):
+        # Searches use the value index; only the first one walks the list, to build it
+        self.counters.add(searches=1)
+        if self.value_nodes is None:
+            self.counters.add(index_builds=1, hops=self.size)
+
+class CountingQueue(Queue):
+    def enqueue(self, value):
+        accepted = super().enqueue(value)
+        if accepted:
+            self.counters.add(enqueues=1, moves=1)
+        else:
+            self.counters.add(rejected=1)
+        return accepted
+
+    def dequeue(self):
+        if self.size:
+            self.counters.add(dequeues=1, moves=1)
+        return super().dequeue()
+
+    def enqueue_many(self, values):
+        values = list(values)
+        count = super().enqueue_many(values)
+        self.counters.add(enqueues=count, moves=count, rejected=len(values) - count)
+        return count
+
+    def dequeue_many(self, n):
+        result = super().dequeue_many(n)
+        self.counters.add(dequeues=len(result), moves=len(result))
+        return result
+
+    def grow(self, needed):
+        # Every item is copied into the new buffer
+        self.counters.add(reallocations=1, moves=self.size)
+        super().grow(needed)
+
+class StackCounting:
+    # Shared by the list-backed Stack and the array-backed TypedStack. A change in the
+    # container's memory size means it was reallocated, copying what it held.
+    def push(self, value):
+        before = sys.getsizeof(self.items)
+        super().push(value)
+        self.count_change(1, before, "pushes")
+
+    def pop(self):
+        if not len(self.items):
+            return super().pop()
+        before = sys.getsizeof(self.items)
+        value = super().pop()
+        self.count_change(1, before, "pops")
+        return value
+
+    def count_change(self, count, size_before, operation):
+        self.counters.add(**{operation: count}, moves=count)
+        if sys.getsizeof(self.items) != size_before:
+            self.counters.add(reallocations=1, moves=len(self.items))
+
+class CountingStack(StackCounting, Stack):
+    pass
+
+class CountingTypedStack(StackCounting, TypedStack):
+    def push_many(self, values):
+        size, before = len(self.items), sys.getsizeof(self.items)
+        super().push_many(values)
+        self.count_change(len(self.items) - size, before, "pushes")
+
+    def pop_many(self, n):
+        before = sys.getsizeof(self.items)
+        result = super().pop_many(n)
+        self.count_change(len(result), before, "pops")
+        return result
+
+COUNTING = {
+    AVLTree: CountingAVLTree,
+    LinkedList: CountingLinkedList,
+    Queue: CountingQueue,
+    Stack: CountingStack,
+    TypedStack: CountingTypedStack,
+}
+
+def instrument(structure, counters=None):
+    # Starts counting on structure; returns the OpCounters it adds to
+    if counters is None:
+        counters = OpCounters()
+    cls = type(structure)
+    if cls not in COUNTING.values():
+        structure.__class__ = COUNTING[cls]
+    structure.counters = counters
+    return counters
+
+def uninstrument(structure):
+    # Stops counting; returns the final counts
+    for plain, counting in COUNTING.items():
+        if type(structure) is counting:
+            structure.__class__ = plain
+            return structure.__dict__.pop("counters").snapshot()
+    return {}
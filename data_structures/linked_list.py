@@ -1,29 +1,322 @@
 class Node:
+    # __slots__ drops the per-node __dict__, which is most of a node's memory
+    __slots__ = ("value", "next")
+
     def __init__(self, value):
         self.value = value
         self.next = None
 
 class LinkedList:
+    # find_first, find_all and count use a value -> nodes index (nodes in list order). It is
+    # only built by the first of those calls; until then writes don't touch it at all, and
+    # after that every write keeps it up to date instead of throwing it away.
     def __init__(self, values=None):
         self.head = None
+        self.tail = None # Last node, so append doesn't have to walk the list
+        self.size = 0
+        self.value_nodes = None # The index: value -> [node, ...], or None until a query builds it
         if values:
-            for value in values:
-                self.append(value)
+            self.extend(values)
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        current = self.head
+        while current:
+            yield current.value
+            current = current.next
 
     def append(self, value):
         new_node = Node(value)
         if not self.head:
             self.head = new_node
-            return
+        else:
+            self.tail.next = new_node
+        self.tail = new_node
+        self.size += 1
+        if self.value_nodes is not None:
+            self.value_nodes.setdefault(value, []).append(new_node)
+
+    def appendleft(self, value):
+        new_node = Node(value)
+        new_node.next = self.head
+        self.head = new_node
+        if not self.tail:
+            self.tail = new_node
+        self.size += 1
+        if self.value_nodes is not None:
+            self.value_nodes.setdefault(value, []).insert(0, new_node)
+
+    def extend(self, values):
+        # Link the new nodes straight off the tail instead of calling append per value
+        tail = self.tail
+        count = 0
+        value_nodes = self.value_nodes
+        for value in values:
+            new_node = Node(value)
+            if tail:
+                tail.next = new_node
+            else:
+                self.head = new_node
+            tail = new_node
+            count += 1
+            if value_nodes is not None:
+                value_nodes.setdefault(value, []).append(new_node)
+        self.tail = tail
+        self.size += count
+
+    def index_of(self, value):
+        # Position of the first node holding value, or -1
+        index = 0
         current = self.head
-        while current.next:
+        while current:
+            if current.value == value:
+                return index
             current = current.next
-        current.next = new_node
+            index += 1
+        return -1
 
-    def to_list(self):
-        result = []
+    def insert_at(self, index, value):
+        if not 0 <= index <= self.size:
+            raise IndexError("index out of range")
+        if index == 0:
+            self.appendleft(value)
+            return
+        if index == self.size:
+            self.append(value)
+            return
+        # The index keeps equal values' nodes in list order, so count the equal ones passed
+        nodes = self.value_nodes.get(value) if self.value_nodes is not None else None
+        before = 0
+        previous = self.head
+        for _ in range(index - 1):
+            if nodes and previous.value == value:
+                before += 1
+            previous = previous.next
+        if nodes and previous.value == value:
+            before += 1
+        new_node = Node(value)
+        new_node.next = previous.next
+        previous.next = new_node
+        self.size += 1
+        if self.value_nodes is not None:
+            self.value_nodes.setdefault(value, []).insert(before, new_node)
+
+    def delete_at(self, index):
+        # Removes and returns the value at index
+        if not 0 <= index < self.size:
+            raise IndexError("index out of range")
+        if index == 0:
+            return self.popleft()
+        previous = self.head
+        for _ in range(index - 1):
+            previous = previous.next
+        node = previous.next
+        previous.next = node.next
+        if node is self.tail:
+            self.tail = previous
+        self.size -= 1
+        self.unindex(node)
+        return node.value
+
+    def popleft(self):
+        if not self.head:
+            return None
+        node = self.head
+        self.head = node.next
+        if not self.head:
+            self.tail = None
+        self.size -= 1
+        self.unindex(node)
+        return node.value
+
+    def unindex(self, node):
+        if self.value_nodes is None:
+            return
+        nodes = self.value_nodes[node.value]
+        for i, other in enumerate(nodes):
+            if other is node:
+                del nodes[i]
+                break
+        if not nodes:
+            del self.value_nodes[node.value]
+
+    def build_index(self):
+        value_nodes = {}
         current = self.head
         while current:
-            result.append(current.value)
+            value_nodes.setdefault(current.value, []).append(current)
             current = current.next
+        self.value_nodes = value_nodes
+        return value_nodes
+
+    def find_first(self, value):
+        # The first node holding value, or None
+        nodes = (self.value_nodes if self.value_nodes is not None else self.build_index()).get(value)
+        return nodes[0] if nodes else None
+
+    def find_all(self, value):
+        # Every node holding value, in list order
+        nodes = (self.value_nodes if self.value_nodes is not None else self.build_index()).get(value)
+        return list(nodes) if nodes else []
+
+    def count(self, value):
+        nodes = (self.value_nodes if self.value_nodes is not None else self.build_index()).get(value)
+        return len(nodes) if nodes else 0
+
+    def to_list(self):
+        return list(self)
+
+class Chunk:
+    __slots__ = ("items", "next")
+
+    def __init__(self, items):
+        self.items = items # Up to the list's capacity values, in order
+        self.next = None
+
+class UnrolledLinkedList:
+    # Linked list of chunks, each holding up to capacity values in a Python list. Positional
+    # operations skip whole chunks by their length, so they take about n / capacity hops
+    # plus a shift inside one chunk, instead of n hops; with capacity near sqrt(n) that is
+    # O(sqrt(n)). A full chunk splits in half on insert, and a chunk that drops below half
+    # full on delete merges with (or borrows from) the next one, so chunks stay dense and
+    # a large list needs a few Python objects per capacity values instead of one per value.
+    def __init__(self, values=None, capacity=64):
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2")
+        self.capacity = capacity
+        self.head = None
+        self.tail = None
+        self.size = 0
+        if values:
+            self.extend(values)
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        chunk = self.head
+        while chunk:
+            yield from chunk.items
+            chunk = chunk.next
+
+    def chunks(self):
+        # Each chunk's values as a tuple, head first
+        result = []
+        chunk = self.head
+        while chunk:
+            result.append(tuple(chunk.items))
+            chunk = chunk.next
         return result
+
+    def append(self, value):
+        if self.tail is None or len(self.tail.items) == self.capacity:
+            self.link_after_tail(Chunk([value]))
+        else:
+            self.tail.items.append(value)
+        self.size += 1
+
+    def extend(self, values):
+        # Tops up the tail chunk, then adds full chunks
+        values = list(values)
+        start = 0
+        if self.tail is not None:
+            start = self.capacity - len(self.tail.items)
+            self.tail.items.extend(values[:start])
+        for i in range(start, len(values), self.capacity):
+            self.link_after_tail(Chunk(values[i:i + self.capacity]))
+        self.size += len(values)
+
+    def link_after_tail(self, chunk):
+        if self.tail is None:
+            self.head = chunk
+        else:
+            self.tail.next = chunk
+        self.tail = chunk
+
+    def locate(self, index):
+        # (chunk before, chunk, offset in chunk) for 0 <= index < size, skipping whole chunks
+        previous, chunk = None, self.head
+        while index >= len(chunk.items):
+            index -= len(chunk.items)
+            previous, chunk = chunk, chunk.next
+        return previous, chunk, index
+
+    def get_at(self, index):
+        if not 0 <= index < self.size:
+            raise IndexError("index out of range")
+        _, chunk, offset = self.locate(index)
+        return chunk.items[offset]
+
+    def insert_at(self, index, value):
+        if not 0 <= index <= self.size:
+            raise IndexError("index out of range")
+        if index == self.size:
+            self.append(value)
+            return
+        _, chunk, offset = self.locate(index)
+        if len(chunk.items) == self.capacity:
+            # Split the full chunk in half and insert into whichever half holds index
+            half = self.capacity // 2
+            new_chunk = Chunk(chunk.items[half:])
+            del chunk.items[half:]
+            new_chunk.next = chunk.next
+            chunk.next = new_chunk
+            if self.tail is chunk:
+                self.tail = new_chunk
+            if offset > half:
+                chunk, offset = new_chunk, offset - half
+        chunk.items.insert(offset, value)
+        self.size += 1
+
+    def delete_at(self, index):
+        # Removes and returns the value at index
+        if not 0 <= index < self.size:
+            raise IndexError("index out of range")
+        previous, chunk, offset = self.locate(index)
+        value = chunk.items.pop(offset)
+        self.size -= 1
+        following = chunk.next
+        if following is not None and len(chunk.items) < self.capacity // 2:
+            if len(chunk.items) + len(following.items) <= self.capacity:
+                # Merge the next chunk into this one
+                chunk.items.extend(following.items)
+                chunk.next = following.next
+                if self.tail is following:
+                    self.tail = chunk
+            else:
+                # Borrow from the front of the next chunk until the two are about even
+                count = (len(following.items) - len(chunk.items)) // 2
+                chunk.items.extend(following.items[:count])
+                del following.items[:count]
+        if not chunk.items:
+            # Only the last chunk can empty out; anything after it would have been merged in
+            if previous is None:
+                self.head = chunk.next
+            else:
+                previous.next = chunk.next
+            if self.tail is chunk:
+                self.tail = previous
+        return value
+
+    def popleft(self):
+        if not self.size:
+            return None
+        return self.delete_at(0)
+
+    def index_of(self, value):
+        # Position of the first occurrence of value, or -1. Each chunk is searched by
+        # list.index, so the scan runs in C and only moves between chunks in Python.
+        base = 0
+        chunk = self.head
+        while chunk:
+            try:
+                return base + chunk.items.index(value)
+            except ValueError:
+                base += len(chunk.items)
+                chunk = chunk.next
+        return -1
+
+    def to_list(self):
+        return list(self)
@@ -0,0 +1,153 @@
+class PriorityQueue:
+    # Min-priority queue in a binary heap stored as parallel arrays: the children of index i
+    # are at 2i + 1 and 2i + 2, and no priority is smaller than its parent's.
+    #
+    #   heapify                          O(n)
+    #   push, pop, decrease_key          O(log n)
+    #   pushpop, replace                 O(log n), one sift instead of two
+    #   peek, len, in                    O(1)
+    #
+    # An item's priority is the item itself unless one is given, so PriorityQueue([5, 3, 8])
+    # pops 3, 5, 8. Items and priorities can repeat: every entry gets a handle, a number
+    # push returns (heapify returns one per value), and position maps each handle to its
+    # entry's index, so decrease_key can find the entry without a search. pop and peek
+    # return None on an empty queue, like Queue.dequeue.
+    def __init__(self, values=None):
+        self.items = []
+        self.priorities = []
+        self.handles = []
+        self.position = {} # handle -> index in items / priorities / handles
+        self.next_handle = 0 # Handles are never reused, so an old one can't name a new entry
+        if values:
+            self.heapify(values)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, handle):
+        return handle in self.position
+
+    def heapify(self, values, priorities=None):
+        # Replaces the contents with values (and their priorities, if given) in O(n): sift
+        # down every parent, last first. Most nodes sit near the bottom and barely move.
+        # Returns the handles, in the order of values.
+        items = list(values)
+        priorities = items.copy() if priorities is None else list(priorities)
+        if len(priorities) != len(items):
+            raise ValueError("values and priorities must be the same length")
+        handles = list(range(self.next_handle, self.next_handle + len(items)))
+        self.next_handle += len(items)
+        self.items, self.priorities, self.handles = items, priorities, handles.copy()
+        self.position = {handle: i for i, handle in enumerate(handles)}
+        for i in range(len(items) // 2 - 1, -1, -1):
+            self.sift_down(i)
+        return handles
+
+    def push(self, item, priority=None):
+        # Returns the new entry's handle
+        handle = self.new_handle()
+        self.items.append(item)
+        self.priorities.append(item if priority is None else priority)
+        self.handles.append(handle)
+        self.position[handle] = len(self.items) - 1
+        self.sift_up(len(self.items) - 1)
+        return handle
+
+    def pop(self):
+        # Removes and returns the item with the smallest priority
+        if not self.items:
+            return None
+        top = self.items[0]
+        del self.position[self.handles[0]]
+        last = self.items.pop(), self.priorities.pop(), self.handles.pop()
+        if self.items:
+            self.place(0, *last)
+            self.sift_down(0)
+        return top
+
+    def peek(self):
+        if not self.items:
+            return None
+        return self.items[0]
+
+    def priority(self, handle):
+        return self.priorities[self.position[handle]]
+
+    def decrease_key(self, handle, priority):
+        # Lowers the priority of the entry push or heapify returned handle for; it can only move up
+        i = self.position[handle]
+        if priority > self.priorities[i]:
+            raise ValueError("decrease_key can't raise a priority")
+        self.priorities[i] = priority
+        self.sift_up(i)
+
+    def pushpop(self, item, priority=None):
+        # push then pop, with one sift: an item that would come straight back out
+        # never enters the heap
+        if priority is None:
+            priority = item
+        if not self.items or priority <= self.priorities[0]:
+            return item
+        top = self.items[0]
+        del self.position[self.handles[0]]
+        self.place(0, item, priority, self.new_handle())
+        self.sift_down(0)
+        return top
+
+    def replace(self, item, priority=None):
+        # pop then push, with one sift. Returns the popped item (None if the queue was empty).
+        if not self.items:
+            self.push(item, priority)
+            return None
+        top = self.items[0]
+        del self.position[self.handles[0]]
+        self.place(0, item, item if priority is None else priority, self.new_handle())
+        self.sift_down(0)
+        return top
+
+    def new_handle(self):
+        handle = self.next_handle
+        self.next_handle += 1
+        return handle
+
+    def place(self, i, item, priority, handle):
+        self.items[i] = item
+        self.priorities[i] = priority
+        self.handles[i] = handle
+        self.position[handle] = i
+
+    def sift_up(self, i):
+        # Move the entry at i up past every parent with a larger priority. Parents move down
+        # into the hole, and the entry is written once, where it stops.
+        items, priorities, handles = self.items, self.priorities, self.handles
+        entry = items[i], priorities[i], handles[i]
+        priority = entry[1]
+        while i:
+            parent = (i - 1) // 2
+            if priorities[parent] <= priority:
+                break
+            self.place(i, items[parent], priorities[parent], handles[parent])
+            i = parent
+        self.place(i, *entry)
+
+    def sift_down(self, i):
+        # Move the entry at i down past every smaller child, the same way
+        items, priorities, handles = self.items, self.priorities, self.handles
+        entry = items[i], priorities[i], handles[i]
+        priority = entry[1]
+        n = len(items)
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and priorities[child + 1] < priorities[child]:
+                child += 1
+            if priorities[child] >= priority:
+                break
+            self.place(i, items[child], priorities[child], handles[child])
+            i = child
+        self.place(i, *entry)
+
+    def to_list(self):
+        # Items in heap (array) order, index 0 first
+        return self.items.copy()
@@ -1,17 +1,200 @@
+import threading
+
 class Queue:
-    def __init__(self, values=None):
-        self.items = []
+    # FIFO queue stored in a circular buffer: head is the index of the front item
+    # and the back wraps around to the start of the buffer, so nothing ever shifts.
+    def __init__(self, values=None, maxsize=None, overflow="reject"):
+        if overflow not in ("reject", "overwrite"):
+            raise ValueError("overflow must be 'reject' or 'overwrite'")
+        if overflow == "overwrite" and maxsize is not None and maxsize < 1:
+            # There would be no oldest item to drop, so the new one could never fit
+            raise ValueError("an 'overwrite' queue needs a maxsize of at least 1")
+        self.maxsize = maxsize # None means unbounded
+        self.overflow = overflow # What a full bounded queue does: refuse new items or drop the oldest
+        self.buffer = [None] * 8
+        self.head = 0
+        self.size = 0
         if values:
-            for value in values:
-                self.enqueue(value)
+            self.enqueue_many(values)
+
+    def __len__(self):
+        return self.size
+
+    def is_full(self):
+        return self.maxsize is not None and self.size >= self.maxsize
 
     def enqueue(self, value):
-        self.items.append(value)
+        # Returns False if a full queue with the "reject" policy refused the value
+        if self.maxsize is not None and self.size >= self.maxsize:
+            if self.overflow == "reject":
+                return False
+            self.dequeue()
+        buffer = self.buffer
+        if self.size == len(buffer):
+            self.grow(self.size + 1)
+            buffer = self.buffer
+        buffer[(self.head + self.size) % len(buffer)] = value
+        self.size += 1
+        return True
 
     def dequeue(self):
-        if self.items:
-            return self.items.pop(0)
-        return None
+        if not self.size:
+            return None
+        buffer = self.buffer
+        head = self.head
+        value = buffer[head]
+        buffer[head] = None # Drop the reference so the item can be freed
+        self.head = (head + 1) % len(buffer)
+        self.size -= 1
+        return value
+
+    def peek(self):
+        if not self.size:
+            return None
+        return self.buffer[self.head]
+
+    def enqueue_many(self, values):
+        # Returns how many values were accepted
+        values = list(values)
+        if self.maxsize is not None:
+            free = self.maxsize - self.size
+            if len(values) > free:
+                if self.overflow == "reject":
+                    values = values[:free]
+                else:
+                    values = values[-self.maxsize:]
+                    self.dequeue_many(len(values) - free)
+        count = len(values)
+        if not count:
+            return 0
+        if self.size + count > len(self.buffer):
+            self.grow(self.size + count)
+        capacity = len(self.buffer)
+        start = (self.head + self.size) % capacity
+        first = min(count, capacity - start) # The part that fits before the buffer wraps
+        self.buffer[start:start + first] = values[:first]
+        self.buffer[:count - first] = values[first:]
+        self.size += count
+        return count
+
+    def dequeue_many(self, n):
+        n = min(n, self.size)
+        if n <= 0:
+            return []
+        capacity = len(self.buffer)
+        first = min(n, capacity - self.head)
+        result = self.buffer[self.head:self.head + first]
+        self.buffer[self.head:self.head + first] = [None] * first
+        if first < n:
+            result += self.buffer[:n - first]
+            self.buffer[:n - first] = [None] * (n - first)
+        self.head = (self.head + n) % capacity
+        self.size -= n
+        return result
+
+    def grow(self, needed):
+        # Double the buffer (capped at maxsize) and unwrap the items to start at index 0
+        capacity = max(len(self.buffer) * 2, needed)
+        if self.maxsize is not None:
+            capacity = max(min(capacity, self.maxsize), needed)
+        items = self.to_list()
+        self.buffer = items + [None] * (capacity - len(items))
+        self.head = 0
+
+    def to_list(self):
+        end = self.head + self.size
+        if end <= len(self.buffer):
+            return self.buffer[self.head:end]
+        return self.buffer[self.head:] + self.buffer[:end - len(self.buffer)]
+
+class ConcurrentQueue:
+    # Queue for threads: the same circular-buffer Queue, guarded by one lock, with
+    # blocking put and get. A bounded queue makes producers wait instead of rejecting.
+    # Like Queue.dequeue, get returns None when there is nothing to return (timed out).
+    def __init__(self, values=None, maxsize=None):
+        self.items = Queue(values)
+        self.maxsize = maxsize # None means unbounded
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+
+    def __len__(self):
+        with self.lock:
+            return len(self.items)
+
+    def is_full(self):
+        return self.maxsize is not None and len(self.items) >= self.maxsize
+
+    def put(self, value, timeout=None):
+        # Returns False if the queue stayed full for timeout seconds
+        with self.not_full:
+            if not self.not_full.wait_for(lambda: not self.is_full(), timeout):
+                return False
+            self.items.enqueue(value)
+            self.not_empty.notify()
+            return True
+
+    def get(self, timeout=None):
+        with self.not_empty:
+            if not self.not_empty.wait_for(lambda: len(self.items), timeout):
+                return None
+            value = self.items.dequeue()
+            self.not_full.notify()
+            return value
+
+    def get_batch(self, max_n, timeout=None):
+        # Waits for at least one item, then takes up to max_n in one go under one lock
+        with self.not_empty:
+            if not self.not_empty.wait_for(lambda: len(self.items), timeout):
+                return []
+            values = self.items.dequeue_many(max_n)
+            self.not_full.notify(len(values))
+            return values
+
+    def to_list(self):
+        # A snapshot, front first, as draw_queue expects
+        with self.lock:
+            return self.items.to_list()
+
+class AsyncQueue:
+    # Queue for asyncio tasks on one event loop: the same circular-buffer Queue, with
+    # awaitable put and get. A bounded queue makes put wait for room (backpressure).
+    def __init__(self, values=None, maxsize=None):
+        import asyncio # Imported here: asyncio takes longer to import than the rest of this module
+        self.items = Queue(values)
+        self.maxsize = maxsize # None means unbounded
+        lock = asyncio.Lock()
+        self.not_empty = asyncio.Condition(lock)
+        self.not_full = asyncio.Condition(lock)
+
+    def __len__(self):
+        return len(self.items)
+
+    def is_full(self):
+        return self.maxsize is not None and len(self.items) >= self.maxsize
+
+    async def put(self, value):
+        async with self.not_full:
+            await self.not_full.wait_for(lambda: not self.is_full())
+            self.items.enqueue(value)
+            self.not_empty.notify()
+
+    async def get(self):
+        async with self.not_empty:
+            await self.not_empty.wait_for(lambda: len(self.items))
+            value = self.items.dequeue()
+            self.not_full.notify()
+            return value
+
+    async def get_batch(self, max_n):
+        # Waits for at least one item, then takes up to max_n at once
+        async with self.not_empty:
+            await self.not_empty.wait_for(lambda: len(self.items))
+            values = self.items.dequeue_many(max_n)
+            self.not_full.notify(len(values))
+            return values
 
     def to_list(self):
-        return self.items.copy()
+        # A snapshot, front first, as draw_queue expects. Tasks only switch at an await,
+        # so no lock is needed to read it.
+        return self.items.to_list()
@@ -1,3 +1,6 @@
+import struct
+from array import array
+
 class Stack:
     def __init__(self, values=None):
         self.items = []
@@ -5,6 +8,9 @@ class Stack:
             for value in values:
                 self.push(value)
 
+    def __len__(self):
+        return len(self.items)
+
     def push(self, value):
         self.items.append(value)
 
@@ -13,5 +19,73 @@ class Stack:
             return self.items.pop()
         return None
 
+    def peek(self):
+        if self.items:
+            return self.items[-1]
+        return None
+
     def to_list(self):
         return self.items.copy()
+
+class TypedStack:
+    # Stack of plain numbers packed into an array.array, e.g. dtype 'd' (float64) or 'q' (int64).
+    # Each element takes its raw 4-8 bytes instead of a list pointer plus a boxed Python object.
+    def __init__(self, dtype="d", values=None):
+        self.items = array(dtype)
+        if values is not None:
+            self.push_many(values)
+
+    @property
+    def dtype(self):
+        return self.items.typecode
+
+    def __len__(self):
+        return len(self.items)
+
+    def push(self, value):
+        self.items.append(value)
+
+    def pop(self):
+        if self.items:
+            return self.items.pop()
+        return None
+
+    def peek(self):
+        if self.items:
+            return self.items[-1]
+        return None
+
+    def push_many(self, values):
+        # Anything exposing a buffer of the same native element type (array, NumPy array,
+        # memoryview) is copied in one memcpy; other iterables are appended element by element.
+        # Only a native format can match: '=l' or '<q' are standard sizes and byte orders,
+        # which can differ from the array's even when the letter is the same.
+        try:
+            view = memoryview(values)
+        except TypeError:
+            self.items.extend(values)
+            return
+        with view:
+            if view.format in (self.items.typecode, "@" + self.items.typecode) and view.c_contiguous:
+                self.items.frombytes(view.cast("B"))
+            else:
+                # Unpack by the buffer's own format, which also handles byte order and size
+                self.items.extend(value for (value,) in struct.iter_unpack(view.format, view.tobytes()))
+
+    def pop_many(self, n):
+        # Removes the top n items and returns them in the order pop() would have, top first
+        n = min(n, len(self.items))
+        if n <= 0:
+            return array(self.items.typecode)
+        top = self.items[-n:]
+        del self.items[-n:]
+        top.reverse()
+        return top
+
+    def snapshot(self):
+        # Read-only, zero-copy view of the items, bottom first. The stack cannot grow or
+        # shrink while a view is alive, so release it (or use it in a `with` block) before pushing.
+        return memoryview(self.items).toreadonly()
+
+    def to_list(self):
+        return self.items.tolist()
@@ -0,0 +1,74 @@
+from collections import deque
+
+# Tree traversals as generators over a shared tree. Each visit yields a small event
+# (node, parent_value, explanation) instead of a copy of the tree, and explicit stacks
+# replace recursion, so a degenerate tree thousands of levels deep is fine.
+# Works on any node with value/left/right (TreeNode, AVLTreeNode).
+
+TRAVERSALS = ("Pre-order", "In-order", "Post-order", "Level-order")
+
+def traversal_events(root, traversal):
+    if traversal == "Pre-order":
+        visits = pre_order(root)
+    elif traversal == "In-order":
+        visits = in_order(root)
+    elif traversal == "Post-order":
+        visits = post_order(root)
+    elif traversal == "Level-order":
+        visits = level_order(root)
+    else:
+        raise ValueError(f"Unknown traversal: {traversal}")
+    for node, parent in visits:
+        if parent:
+            explanation = f"{traversal}: Visit {node.value} (child of {parent.value})"
+        else:
+            explanation = f"{traversal}: Visit root {node.value}"
+        yield node, parent.value if parent else None, explanation
+
+# Each of these yields (node, parent) pairs in visiting order
+
+def pre_order(root):
+    stack = [(root, None)] if root else []
+    while stack:
+        node, parent = stack.pop()
+        yield node, parent
+        # Right goes on first so left comes off first
+        if node.right:
+            stack.append((node.right, node))
+        if node.left:
+            stack.append((node.left, node))
+
+def in_order(root):
+    stack = []
+    node, parent = root, None
+    while stack or node:
+        while node:
+            stack.append((node, parent))
+            node, parent = node.left, node
+        node, parent = stack.pop()
+        yield node, parent
+        node, parent = node.right, node
+
+def post_order(root):
+    # A node is visited the second time it comes off the stack, after both its subtrees
+    stack = [(root, None, False)] if root else []
+    while stack:
+        node, parent, children_done = stack.pop()
+        if children_done:
+            yield node, parent
+            continue
+        stack.append((node, parent, True))
+        if node.right:
+            stack.append((node.right, node, False))
+        if node.left:
+            stack.append((node.left, node, False))
+
+def level_order(root):
+    queue = deque([(root, None)] if root else [])
+    while queue:
+        node, parent = queue.popleft()
+        yield node, parent
+        if node.left:
+            queue.append((node.left, node))
+        if node.right:
+            queue.append((node.right, node))
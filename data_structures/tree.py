@@ -3,4 +3,104 @@ class TreeNode:
     def __init__(self, value):
         self.value = value # The value stored in the node
         self.left = None # The left child of the node
-        self.right = None # The right child of the node
\ No newline at end of file
+        self.right = None # The right child of the node
+        self.height = 1 # Levels in the subtree rooted here, kept up to date by insert_bst
+
+    def copy(self):
+        # Shallow copy: same value and height, pointing at the same children
+        node = TreeNode(self.value)
+        node.left, node.right = self.left, self.right
+        node.height = self.height
+        return node
+
+class InsertTrace:
+    # What one insert did, filled in by insert_bst / AVLTree.insert when passed as trace=.
+    # It comes for free from the walk the insert already makes, so explaining an insert
+    # never needs to compare two trees.
+    def __init__(self):
+        self.value = None # The inserted value
+        self.path = [] # (node value, 'left' or 'right') for every comparison on the way down
+        self.parent = None # Value of the node the new one hangs from, None if it became the root
+        self.direction = None # Which side of the parent it went: 'left' or 'right'
+        self.rotations = [] # AVL only: ('left' or 'right', pivot value) in the order applied
+        self.unbalanced_root = None # Persistent AVL only: the tree after attaching, before rotating
+        self.height_updates = 0 # Nodes whose stored height changed on the way back up
+
+    def record_path(self, value, path):
+        self.value = value
+        self.path = [(node.value, 'left' if value < node.value else 'right') for node in path]
+        if self.path:
+            self.parent, self.direction = self.path[-1]
+
+    def cost(self):
+        # What the insert did, as counts: one comparison per node on the way down
+        return {"comparisons": len(self.path), "rotations": len(self.rotations), "height_updates": self.height_updates}
+
+# BST helpers. These loop instead of recursing, so a degenerate tree
+# (e.g. built from sorted input) can be as deep as it likes.
+
+def insert_bst(root, value, persistent=False, trace=None, counters=None):
+    # Returns the root of the tree with value inserted.
+    # With persistent=True the nodes on the insertion path are copied instead of changed,
+    # so the old root is still a complete, untouched version of the tree.
+    # Pass an InsertTrace as trace to get a record of the comparisons made, and an
+    # OpCounters (data_structures.counters) as counters to add this insert to running totals.
+    path = []
+    node = root
+    while node:
+        path.append(node)
+        node = node.left if value < node.value else node.right
+    if trace is not None:
+        trace.record_path(value, path)
+    new_node = TreeNode(value)
+    if not path:
+        if counters is not None:
+            counters.add(inserts=1)
+        return new_node
+    if persistent:
+        path = copy_path(path)
+    if value < path[-1].value:
+        path[-1].left = new_node
+    else:
+        path[-1].right = new_node
+
+    # Each ancestor is now at least (distance to the new node + 1) tall.
+    # Once one is already that tall, every node above it is too.
+    height = 1
+    for node in reversed(path):
+        height += 1
+        if node.height >= height:
+            height -= 1
+            break
+        node.height = height
+    # height - 1 is now the number of heights that changed, with or without the early stop
+    if trace is not None:
+        trace.height_updates = height - 1
+    if counters is not None:
+        counters.add(inserts=1, comparisons=len(path), height_updates=height - 1)
+        counters.peak(max_depth=len(path))
+    return path[0]
+
+def search_bst(root, value):
+    # Returns the node holding value, or None
+    node = root
+    while node and node.value != value:
+        node = node.left if value < node.value else node.right
+    return node
+
+def tree_height(node):
+    # Heights are stored on the nodes (TreeNode and AVLTreeNode), so this is O(1)
+    if not node:
+        return 0
+    return node.height
+
+def copy_path(path):
+    # Replaces every node on a root-to-node path with a copy, linked parent to child,
+    # so whatever changes next never touches the original tree. Returns the copies.
+    copies = [node.copy() for node in path]
+    for i in range(1, len(copies)):
+        if copies[i - 1].left is path[i]:
+            copies[i - 1].left = copies[i]
+        else:
+            copies[i - 1].right = copies[i]
+    return copies
@@ -0,0 +1,75 @@
+# Writes the app's animations to GIF, APNG or MP4 files without starting Streamlit.
+#
+#   python export.py tree 5,3,7,2,4,6,8 grow.gif
+#   python export.py tree 5,3,7,2,4,6,8 inorder.png --tree-type avl --traverse in-order
+#   python export.py linked-list A,B,C,D search.gif --search C
+#   python export.py stack A,B,C stack.mp4 --jobs 4
+#
+# Frames are rendered by a pool of --jobs worker processes and streamed into the
+# encoder in order, a few at a time, so long animations don't fill up memory.
+import argparse
+import sys
+import matplotlib
+matplotlib.use("Agg")
+from data_structures.traversal import TRAVERSALS
+from visualizations.animations import TREE_TYPES, grow_frames, queue_frames, search_frames, stack_frames, traverse_tree
+from visualizations.encoders import FORMATS, fit_frame, open_writer
+from visualizations.frame_cache import frame_cache
+from visualizations.frame_pipeline import FramePipeline, default_jobs
+
+VIEWS = {"tree": "tree", "stack": "stack", "queue": "queue", "linked-list": "linked_list"}
+TREE_TYPE_NAMES = {"bst": TREE_TYPES[0], "avl": TREE_TYPES[1]}
+TRAVERSAL_NAMES = {name.lower(): name for name in TRAVERSALS} # e.g. "in-order" -> "In-order"
+DURATIONS = {"tree": 1200, "stack": 800, "queue": 800, "linked_list": 350} # ms per frame, as in the app
+
+def build_frames(args):
+    # Returns (view, [(frame, explanation, highlight), ...]) for the requested animation
+    view = VIEWS[args.structure]
+    values = [v.strip() for v in args.values.split(",") if v.strip()]
+    if view == "tree":
+        frames, tree_root = grow_frames([int(v) for v in values], TREE_TYPE_NAMES[args.tree_type])
+        if args.traverse:
+            frames = list(traverse_tree(tree_root, TRAVERSAL_NAMES[args.traverse]))
+    elif view == "linked_list":
+        if args.search is None:
+            raise ValueError("linked-list export needs --search VALUE")
+        frames = list(search_frames(values, args.search))
+    elif view == "stack":
+        frames = list(stack_frames(values))
+    else:
+        frames = list(queue_frames(values))
+    return view, frames
+
+def parse_size(text):
+    width, height = text.lower().split("x")
+    return int(width), int(height)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export a data structure animation to GIF, APNG or MP4.")
+    parser.add_argument("structure", choices=list(VIEWS))
+    parser.add_argument("values", help="comma-separated values, e.g. 5,3,7 (numbers for trees)")
+    parser.add_argument("output", help="output file: .gif, .apng or .png (APNG), or .mp4 (needs ffmpeg)")
+    parser.add_argument("--tree-type", choices=list(TREE_TYPE_NAMES), default="bst")
+    parser.add_argument("--traverse", choices=list(TRAVERSAL_NAMES), help="animate a traversal of the finished tree instead of growing it")
+    parser.add_argument("--search", help="linked list: the value to search for")
+    parser.add_argument("--format", choices=FORMATS, help="override the format picked from the file name")
+    parser.add_argument("--size", type=parse_size, default=(800, 600), help="frame size in pixels, WIDTHxHEIGHT (default 800x600)")
+    parser.add_argument("--duration", type=int, help="milliseconds per frame (default: the app's pace)")
+    parser.add_argument("--loop", type=int, default=0, help="times to play, 0 for forever (GIF/APNG)")
+    parser.add_argument("--jobs", type=int, default=default_jobs(), help="render processes; 0 renders in this process")
+    args = parser.parse_args(argv)
+
+    try:
+        view, frames = build_frames(args)
+        writer = open_writer(args.output, args.size, args.duration or DURATIONS[view], args.format, args.loop)
+    except (RuntimeError, ValueError) as error: # Bad values, no ffmpeg, unknown extension, odd MP4 size
+        parser.error(str(error))
+    # Only use the frame cache when it has a disk tier; in memory it would die with this process
+    cache = frame_cache if frame_cache.disk_dir else None
+    with FramePipeline(((frame, highlight) for frame, _, highlight in frames), view, jobs=args.jobs, cache=cache, ahead=2 * max(args.jobs, 1)) as pipeline, writer:
+        for png in pipeline:
+            writer.write(fit_frame(png, args.size))
+    print(f"Wrote {len(pipeline)} frames to {args.output}")
+
+if __name__ == "__main__":
+    sys.exit(main())
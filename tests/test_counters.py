@@ -0,0 +1,38 @@
+# Every LinkedList operation that walks pointers shows up in its counts
+from data_structures.counters import instrument, uninstrument
+from data_structures.linked_list import LinkedList
+
+def counts(run, values=(1, 2, 3, 4, 5)):
+    ll = LinkedList(values)
+    counters = instrument(ll)
+    run(ll)
+    assert uninstrument(ll) == counters.snapshot()
+    return counters.snapshot()
+
+def test_insert_at():
+    assert counts(lambda ll: ll.insert_at(3, 9)) == {"inserts": 1, "hops": 2}
+    assert counts(lambda ll: ll.insert_at(0, 9)) == {"appends": 1}
+    assert counts(lambda ll: ll.insert_at(5, 9)) == {"appends": 1}
+
+def test_delete_at():
+    assert counts(lambda ll: ll.delete_at(4)) == {"deletes": 1, "hops": 3}
+    assert counts(lambda ll: ll.delete_at(0)) == {"pops": 1}
+
+def test_find_first_builds_the_index_once():
+    def run(ll):
+        assert ll.find_first(3).value == 3
+        assert ll.find_first(4).value == 4
+    assert counts(run) == {"searches": 2, "index_builds": 1, "hops": 5}
+
+def test_find_all_and_count():
+    assert counts(lambda ll: ll.find_all(2), (2, 1, 2)) == {"searches": 1, "index_builds": 1, "hops": 3}
+    assert counts(lambda ll: ll.count(2), (2, 1, 2)) == {"searches": 1, "index_builds": 1, "hops": 3}
+
+def test_insert_then_find_first():
+    def run(ll):
+        ll.insert_at(3, 1)
+        ll.find_first(3)
+    assert counts(run) == {"inserts": 1, "searches": 1, "index_builds": 1, "hops": 2 + 6}
+
+def test_index_of():
+    assert counts(lambda ll: ll.index_of(3)) == {"searches": 1, "hops": 3}
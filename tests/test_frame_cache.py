@@ -0,0 +1,39 @@
+# The disk tier stays within max_disk_bytes, deleting the least recently used files first
+import os
+from visualizations.frame_cache import FrameCache
+
+def put(cache, key, size, mtime):
+    cache.put(key, bytes(size))
+    os.utime(cache.disk_path(key), (mtime, mtime))
+
+def disk_size(path):
+    return sum(entry.stat().st_size for entry in os.scandir(path))
+
+def test_disk_tier_stays_under_budget(tmp_path):
+    cache = FrameCache(disk_dir=str(tmp_path), max_disk_bytes=100_000)
+    for i in range(50):
+        put(cache, f"frame{i}", 5_000, i)
+    assert disk_size(tmp_path) <= 100_000
+    assert cache.stats()["disk_bytes"] == disk_size(tmp_path)
+    assert not os.path.exists(cache.disk_path("frame0"))
+    assert os.path.exists(cache.disk_path("frame49"))
+
+def test_disk_hit_is_evicted_last(tmp_path):
+    cache = FrameCache(disk_dir=str(tmp_path), max_disk_bytes=100_000)
+    for i in range(20):
+        put(cache, f"frame{i}", 5_000, i)
+    cache.clear() # Only the disk tier has it now
+    assert cache.get("frame0") is not None
+    for i in range(20, 30):
+        put(cache, f"frame{i}", 5_000, 1e9 + i)
+    assert os.path.exists(cache.disk_path("frame0"))
+    assert not os.path.exists(cache.disk_path("frame1"))
+
+def test_restart_counts_existing_files(tmp_path):
+    cache = FrameCache(disk_dir=str(tmp_path))
+    for i in range(10):
+        put(cache, f"frame{i}", 5_000, i)
+    cache.put("frame9", bytes(5_000)) # Rewriting a frame doesn't count it twice
+    assert cache.disk_bytes == 50_000
+    smaller = FrameCache(disk_dir=str(tmp_path), max_disk_bytes=20_000)
+    assert smaller.disk_bytes == disk_size(tmp_path) <= 20_000
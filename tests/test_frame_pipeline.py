@@ -0,0 +1,28 @@
+# With ahead= set, a pipeline only reads its input as far as the lookahead window
+from visualizations.frame_pipeline import FramePipeline
+
+def test_ahead_reads_frames_lazily():
+    read = []
+    def frames():
+        for i in range(8):
+            read.append(i)
+            yield tuple(range(i + 1)), None
+    pipeline = FramePipeline(frames(), "stack", jobs=0, cache=None, ahead=2)
+    assert read == []
+    for shown, png in enumerate(pipeline, 1):
+        assert png.startswith(b"\x89PNG")
+        assert len(read) <= shown + 2
+        assert len(pipeline.slots) <= 3
+    assert len(read) == len(pipeline) == 8
+
+def test_cancel_stops_reading():
+    read = []
+    def frames():
+        for i in range(8):
+            read.append(i)
+            yield (i,), None
+    with FramePipeline(frames(), "stack", jobs=0, cache=None, ahead=1) as pipeline:
+        next(iter(pipeline))
+    assert read == [0, 1] # The frame shown and the one ahead of it
+    assert len(list(pipeline)) == 1 # Only what was already read is left
+    assert read == [0, 1]
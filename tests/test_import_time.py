@@ -0,0 +1,18 @@
+# The core (data structures, layout, frame generation) has to import quickly and without
+# Streamlit, matplotlib, NumPy or Pillow. Each module is imported in a fresh interpreter;
+# python -m benchmarks.import_time prints the same check as a table.
+import pytest
+from benchmarks.import_time import BUDGET_MS, HEAVY_MODULES, core_modules, import_profile
+
+def test_core_modules_are_discovered():
+    modules = core_modules()
+    for module in ("data_structures.counters", "data_structures.priority_queue", "visualizations.frame_store", "visualizations.timing"):
+        assert module in modules
+    assert "visualizations.tree" not in modules
+
+@pytest.mark.parametrize("module", core_modules())
+def test_core_module_imports_light(module):
+    times = import_profile(module)
+    heavy = sorted({name.split(".")[0] for name in times} & set(HEAVY_MODULES))
+    assert not heavy, f"{module} imports {', '.join(heavy)}"
+    assert times[module] / 1000 <= BUDGET_MS
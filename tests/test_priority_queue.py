@@ -0,0 +1,51 @@
+# Equal items and priorities are fine; decrease_key finds an entry by the handle push gave
+import random
+from data_structures.priority_queue import PriorityQueue
+
+def check_heap(pq):
+    for i in range(1, len(pq)):
+        assert pq.priorities[(i - 1) // 2] <= pq.priorities[i]
+    assert {handle: i for i, handle in enumerate(pq.handles)} == pq.position
+
+def test_duplicates():
+    pq = PriorityQueue([5, 5, 2])
+    first, second = pq.push(5), pq.push(5)
+    assert first != second
+    check_heap(pq)
+    assert [pq.pop() for _ in range(len(pq))] == [2, 5, 5, 5, 5]
+
+def test_decrease_key_by_handle():
+    pq = PriorityQueue()
+    handles = [pq.push("task", priority) for priority in (4, 4, 9)]
+    pq.decrease_key(handles[2], 1)
+    assert pq.priority(handles[2]) == 1
+    assert pq.position[handles[2]] == 0
+    check_heap(pq)
+
+def test_matches_sorted():
+    rnd = random.Random(7)
+    pq = PriorityQueue()
+    expected = [rnd.randint(0, 20) for _ in range(50)]
+    pq.heapify(expected)
+    for _ in range(2_000):
+        action = rnd.random()
+        if action < 0.4:
+            value = rnd.randint(0, 20)
+            pq.push(value)
+            expected.append(value)
+        elif action < 0.6 and pq:
+            assert pq.pop() == min(expected)
+            expected.remove(min(expected))
+        elif action < 0.8:
+            value = rnd.randint(0, 20)
+            popped = pq.pushpop(value)
+            expected.append(value)
+            assert popped == min(expected)
+            expected.remove(popped)
+        elif expected:
+            value = rnd.randint(0, 20)
+            assert pq.replace(value) == min(expected)
+            expected.remove(min(expected))
+            expected.append(value)
+        check_heap(pq)
+    assert sorted(expected) == [pq.pop() for _ in range(len(pq))]
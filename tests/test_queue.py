@@ -0,0 +1,23 @@
+# A bounded Queue never holds more than maxsize items, whichever overflow policy it has
+import pytest
+from data_structures.queue import Queue
+
+@pytest.mark.parametrize("overflow", ["reject", "overwrite"])
+def test_bounded_queue_stays_within_maxsize(overflow):
+    queue = Queue(range(5), maxsize=3, overflow=overflow)
+    for value in range(5, 10):
+        queue.enqueue(value)
+        assert len(queue) == 3
+    queue.enqueue_many(range(10, 20))
+    assert len(queue) == 3
+    assert queue.to_list() == ([0, 1, 2] if overflow == "reject" else [17, 18, 19])
+
+def test_overwrite_needs_room():
+    with pytest.raises(ValueError):
+        Queue(maxsize=0, overflow="overwrite")
+
+def test_reject_with_no_room_rejects_everything():
+    queue = Queue(maxsize=0)
+    assert not queue.enqueue(1)
+    assert queue.enqueue_many([1, 2]) == 0
+    assert len(queue) == 0
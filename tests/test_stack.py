@@ -0,0 +1,21 @@
+# push_many copies a buffer in one go only when its element type is the array's own
+import ctypes
+from array import array
+import numpy as np
+from data_structures.stack import TypedStack
+
+def test_matching_buffer():
+    stack = TypedStack("d", np.array([1.5, 2.5]))
+    stack.push_many(array("d", [3.5]))
+    assert stack.to_list() == [1.5, 2.5, 3.5]
+
+def test_standard_sizes_and_byte_orders():
+    for values in (np.array([1, -2], dtype="<i4"), np.array([1, -2], dtype=">i8"), (ctypes.c_long * 2)(1, -2)):
+        stack = TypedStack("l")
+        stack.push_many(values)
+        assert stack.to_list() == [1, -2]
+
+def test_other_native_type_and_iterables():
+    stack = TypedStack("q", np.array([1, 2], dtype=np.int32))
+    stack.push_many(range(3, 5))
+    assert stack.to_list() == [1, 2, 3, 4]
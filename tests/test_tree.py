@@ -0,0 +1,74 @@
+# Deep trees must not hit RecursionError: the BST helpers loop instead of recursing.
+# 50,000 sorted values go through the AVL build the app uses. A plain BST turns them into
+# a chain, which takes 50,000^2 / 2 comparisons to build one insert at a time: minutes,
+# so benchmarks/bst.py times that, and these tests link the chain directly and insert at
+# its end, plus a sorted build of a few thousand values.
+from data_structures.avl_tree import AVLTree
+from data_structures.tree import InsertTrace, TreeNode, insert_bst, search_bst, tree_height
+
+DEPTH = 50_000
+
+def chain(n):
+    # The tree a sorted build of range(n) makes, with the heights insert_bst would store
+    root = node = TreeNode(0)
+    for value in range(1, n):
+        node.right = TreeNode(value)
+        node = node.right
+    node = root
+    for height in range(n, 0, -1):
+        node.height = height
+        node = node.right
+    return root
+
+def heights(root):
+    # Every node's true height, worked out bottom-up without recursion
+    order = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node:
+            order.append(node)
+            stack.extend((node.left, node.right))
+    true = {None: 0}
+    for node in reversed(order):
+        true[node] = 1 + max(true[node.left], true[node.right])
+    del true[None]
+    return true
+
+def test_insert_at_the_bottom_of_a_deep_chain():
+    root = insert_bst(chain(DEPTH), DEPTH)
+    assert tree_height(root) == DEPTH + 1
+    assert all(node.height == height for node, height in heights(root).items())
+    assert search_bst(root, DEPTH).value == DEPTH
+    assert search_bst(root, DEPTH + 1) is None
+
+def test_persistent_insert_leaves_a_deep_chain_untouched():
+    old = chain(DEPTH)
+    root = insert_bst(old, DEPTH, persistent=True)
+    assert tree_height(root) == DEPTH + 1
+    assert tree_height(old) == DEPTH
+    assert search_bst(old, DEPTH) is None
+    assert search_bst(root, DEPTH).value == DEPTH
+
+def test_sorted_inserts():
+    n = 3_000
+    root = None
+    for value in range(n):
+        root = insert_bst(root, value)
+    assert tree_height(root) == n
+    assert all(node.height == height for node, height in heights(root).items())
+    assert search_bst(root, n - 1).value == n - 1
+
+def test_sorted_avl_build():
+    # As grow_frames builds an AVL tree: persistent, with a trace per insert
+    avl = AVLTree(persistent=True)
+    for value in range(DEPTH):
+        root = avl.insert(value, trace=InsertTrace())
+        if value == DEPTH // 2:
+            half = root
+    assert tree_height(root) <= 1.45 * DEPTH.bit_length()
+    assert all(node.height == height for node, height in heights(root).items())
+    assert search_bst(root, DEPTH - 1).value == DEPTH - 1
+    # The version from halfway through is untouched
+    assert search_bst(half, DEPTH // 2 + 1) is None
+    assert all(node.height == height for node, height in heights(half).items())
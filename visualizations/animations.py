@@ -0,0 +1,113 @@
+from data_structures.tree import InsertTrace, insert_bst
+from data_structures.avl_tree import AVLTree
+from data_structures.traversal import traversal_events
+from data_structures.counters import instrument
+
+# Animation frames for every view, as plain data: no Streamlit and no drawing.
+# Tree frames are (tree root, explanation, highlighted values); stack, queue and
+# linked-list frames are (tuple of items, explanation, highlighted index or None).
+# The Streamlit pages play them live and export.py writes them to a file.
+
+TREE_TYPES = ("Binary Search Tree (BST)", "AVL Tree")
+
+def grow_frames(values, tree_type=TREE_TYPES[0], counters=None):
+    # Returns (frames, final tree root) for inserting values one at a time.
+    # Both trees are persistent: every insert returns a new version that shares the unchanged
+    # subtrees with the previous one, so a frame can hold its version without a deepcopy.
+    # Pass an OpCounters as counters to total up the work done, and to end each insert's
+    # explanation with what that insert cost.
+    tree_root = None
+    avl_tree = AVLTree(persistent=True)
+    if counters is not None:
+        instrument(avl_tree, counters)
+    frames = []
+    for v in values:
+        trace = InsertTrace()
+        if tree_type == "AVL Tree":
+            tree_root = avl_tree.insert(v, trace=trace)  # AVLTree keeps its own root and returns it
+        else:
+            tree_root = insert_bst(tree_root, v, persistent=True, trace=trace, counters=counters)
+        steps = insert_steps(trace, tree_root)
+        if counters is not None:
+            frame, explanation, highlight = steps[-1]
+            steps[-1] = (frame, f"{explanation} ({describe_cost(trace.cost())})", highlight)
+        frames.extend(steps)
+    return frames, tree_root
+
+def describe_cost(cost):
+    # {"comparisons": 3, "rotations": 1, ...} -> "3 comparisons, 1 rotation, ..."
+    parts = []
+    for name, count in cost.items():
+        if count or name == "comparisons":
+            label = name.replace("_", " ")
+            parts.append(f"{count:,} {label[:-1] if count == 1 else label}")
+    return ", ".join(parts)
+
+def traverse_tree(node, traversal):
+    # Lazily yields (tree, explanation, highlight) frames. Every frame points at the same
+    # tree, only the highlighted value changes, so nothing is copied per step.
+    for visited, parent_value, explanation in traversal_events(node, traversal):
+        yield node, explanation, [visited.value]
+
+def insert_steps(trace, tree_root):
+    # Turns one insert's trace into animation frames (tree, explanation, highlight).
+    # A rotation gets its own step, showing the tree before it when we have that version.
+    inserted = trace.value
+    if trace.parent is None:
+        explanation = f"🌱 Insert root node {inserted}."
+    else:
+        comparison = '<' if trace.direction == 'left' else '>='
+        explanation = f"🌱 Insert node {inserted}: Go {trace.direction} from {trace.parent} since {inserted} {comparison} {trace.parent}."
+    if not trace.rotations:
+        return [(tree_root, explanation, [inserted])]
+
+    rotations = ", then ".join(f"{direction} around {pivot}" for direction, pivot in trace.rotations)
+    pivots = [pivot for _, pivot in trace.rotations]
+    if trace.unbalanced_root is None:
+        return [(tree_root, f"{explanation} 🔄 Then rotate {rotations} to rebalance.", [inserted] + pivots)]
+    return [
+        (trace.unbalanced_root, f"{explanation} The tree is now unbalanced.", [inserted]),
+        (tree_root, f"🔄 Rebalance: rotate {rotations}.", pivots),
+    ]
+
+def search_frames(values, target):
+    # Linked-list search: one frame per node visited, stopping at the first match
+    items = tuple(values)
+    for i, v in enumerate(items):
+        if str(v) == str(target):
+            yield items, f"Found {target} at index {i}.", i
+            return
+        yield items, f"Index {i} holds {v}, not {target}: follow next.", i
+    yield items, f"{target} is not in the list.", None
+
+def unrolled_search_frames(chunks, target):
+    # Unrolled linked-list search: one frame per chunk visited, then the matching slot.
+    # Frames are (tuple of chunks, explanation, (chunk index, slot index or None) or None).
+    chunks = tuple(tuple(items) for items in chunks)
+    base = 0
+    for c, items in enumerate(chunks):
+        for slot, v in enumerate(items):
+            if str(v) == str(target):
+                yield chunks, f"Chunk {c} holds {target}: found at index {base + slot}.", (c, slot)
+                return
+        yield chunks, f"Chunk {c} holds {', '.join(map(str, items))}, not {target}: skip its {len(items)} values.", (c, None)
+        base += len(items)
+    yield chunks, f"{target} is not in the list.", None
+
+def stack_frames(values):
+    # Push every value, then pop until the stack is empty
+    items = []
+    for v in values:
+        items.append(v)
+        yield tuple(items), f"Push {v}.", len(items) - 1
+    while items:
+        v = items.pop()
+        yield tuple(items), f"Pop {v}.", None
+
+def queue_frames(values):
+    # Enqueue every value, then dequeue until the queue is empty
+    items = list(values)
+    for i, v in enumerate(items):
+        yield tuple(items[:i + 1]), f"Enqueue {v}.", i
+    for i, v in enumerate(items):
+        yield tuple(items[i + 1:]), f"Dequeue {v}.", None
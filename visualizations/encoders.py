@@ -0,0 +1,165 @@
+import io
+import shutil
+import struct
+import subprocess
+import zlib
+from PIL import GifImagePlugin, Image, ImageOps
+
+# Animation writers that take one frame at a time and write it out straight away,
+# so exporting a long animation never holds more than the current frame in memory.
+# Every writer gets frames as PIL images of one fixed size (see fit_frame).
+#
+#   GIF  - Pillow, frame by frame through its GIF header/frame encoders
+#   APNG - Pillow encodes each frame as a PNG, whose chunks are rewritten as APNG frames
+#   MP4  - raw RGB piped into ffmpeg, which has to be on the PATH
+
+FORMATS = ("gif", "apng", "mp4")
+
+def fit_frame(png, size):
+    # Decodes PNG bytes and scales them to fit size, padding with the frame's background
+    # colour, since the rendered figures don't all come out the same size
+    image = Image.open(io.BytesIO(png)).convert("RGB")
+    background = image.getpixel((0, 0))
+    return ImageOps.pad(image, size, method=Image.Resampling.LANCZOS, color=background)
+
+def format_for(path):
+    # Output format from the file extension: .gif, .apng/.png or .mp4
+    extension = path.rsplit(".", 1)[-1].lower()
+    if extension == "png":
+        return "apng"
+    if extension not in FORMATS:
+        raise ValueError(f"Can't tell the format of {path}; use a .gif, .apng, .png or .mp4 file name")
+    return extension
+
+def open_writer(path, size, duration, format=None, loop=0):
+    # duration is milliseconds per frame; loop=0 repeats forever (ignored for MP4)
+    format = format or format_for(path)
+    if format == "gif":
+        return GifWriter(path, size, duration, loop)
+    if format == "apng":
+        return ApngWriter(path, size, duration, loop)
+    if format == "mp4":
+        return FfmpegWriter(path, size, duration)
+    raise ValueError(f"Unknown format: {format}")
+
+class GifWriter:
+    def __init__(self, path, size, duration, loop=0):
+        self.file = open(path, "wb")
+        self.size = size
+        self.duration = duration
+        self.loop = loop
+        self.frames = 0
+
+    def write(self, image):
+        # Each frame gets its own 256-colour palette
+        frame = image.quantize(256)
+        if not self.frames:
+            header, _ = GifImagePlugin.getheader(frame, info={"loop": self.loop, "duration": self.duration})
+            self.file.write(b"".join(header))
+        for data in GifImagePlugin.getdata(frame, duration=self.duration, include_color_table=True):
+            self.file.write(data)
+        self.frames += 1
+
+    def close(self):
+        self.file.write(b";") # GIF trailer
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class ApngWriter:
+    # APNG is a PNG whose first frame is the normal image data (IDAT) and whose later
+    # frames are fdAT chunks, each announced by an fcTL chunk. The frame count in acTL
+    # comes first in the file, so it is written as 0 and filled in on close.
+    SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+    def __init__(self, path, size, duration, loop=0):
+        self.file = open(path, "wb")
+        self.size = size
+        self.duration = duration
+        self.loop = loop
+        self.frames = 0
+        self.sequence = 0 # fcTL and fdAT chunks share one running sequence number
+        self.actl_offset = None
+
+    def write(self, image):
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG")
+        chunks = list(png_chunks(buffer.getvalue()))
+        if not self.frames:
+            self.file.write(self.SIGNATURE)
+            self.write_chunk(b"IHDR", next(data for kind, data in chunks if kind == b"IHDR"))
+            self.actl_offset = self.file.tell()
+            self.write_chunk(b"acTL", struct.pack(">II", 0, self.loop))
+        width, height = image.size
+        # Delay is a fraction of a second: duration / 1000. Dispose none, blend source.
+        self.write_chunk(b"fcTL", struct.pack(">IIIIIHHBB", self.next_sequence(), width, height, 0, 0, self.duration, 1000, 0, 0))
+        for kind, data in chunks:
+            if kind != b"IDAT":
+                continue
+            if self.frames:
+                self.write_chunk(b"fdAT", struct.pack(">I", self.next_sequence()) + data)
+            else:
+                self.write_chunk(b"IDAT", data)
+        self.frames += 1
+
+    def next_sequence(self):
+        self.sequence += 1
+        return self.sequence - 1
+
+    def write_chunk(self, kind, data):
+        self.file.write(struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data)))
+
+    def close(self):
+        self.write_chunk(b"IEND", b"")
+        if self.actl_offset is not None:
+            self.file.seek(self.actl_offset)
+            self.write_chunk(b"acTL", struct.pack(">II", self.frames, self.loop))
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def png_chunks(data):
+    # Yields (chunk type, chunk data) for every chunk of a PNG file
+    offset = len(ApngWriter.SIGNATURE)
+    while offset < len(data):
+        length, kind = struct.unpack(">I4s", data[offset:offset + 8])
+        yield kind, data[offset + 8:offset + 8 + length]
+        offset += 12 + length
+
+class FfmpegWriter:
+    def __init__(self, path, size, duration):
+        ffmpeg = shutil.which("ffmpeg")
+        if ffmpeg is None:
+            raise RuntimeError("MP4 export needs ffmpeg on the PATH; write a .gif or .apng instead")
+        width, height = size
+        if width % 2 or height % 2:
+            raise ValueError("MP4 frames need an even width and height")
+        self.size = size
+        self.process = subprocess.Popen(
+            [ffmpeg, "-y", "-loglevel", "error",
+             "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{width}x{height}", "-framerate", f"1000/{duration}", "-i", "-",
+             "-pix_fmt", "yuv420p", path],
+            stdin=subprocess.PIPE,
+        )
+
+    def write(self, image):
+        self.process.stdin.write(image.tobytes())
+
+    def close(self):
+        self.process.stdin.close()
+        if self.process.wait():
+            raise RuntimeError(f"ffmpeg exited with status {self.process.returncode}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,215 @@
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+from data_structures.tree import TreeNode
+from visualizations.timing import phase
+
+# Cache of rendered frames (PNG bytes), shared by every session in the process.
+# Stepping back to a frame someone has already seen, or the same tree being shown
+# to two users, costs a dictionary lookup instead of a matplotlib render.
+#
+# Keys describe what is on screen: the view, a hash of the structure's shape and values,
+# the highlight, the figure size and the theme. Entries are evicted least recently used
+# once the cache holds more than max_bytes. Setting FRAME_CACHE_DIR adds an on-disk tier
+# that survives restarts, capped at max_disk_bytes (FRAME_CACHE_DISK_MB, 512 MB by default):
+# past that, the files used longest ago (oldest mtime; a disk hit touches its file) are
+# deleted until the tier is back under 90% of the budget, so eviction runs now and then
+# rather than on every write.
+
+THEME = "vscode-dark" # Part of every key, so a restyle never serves stale images
+SAVEFIG_OPTIONS = {"format": "png", "dpi": 200, "bbox_inches": "tight"} # Same as st.pyplot
+
+class FrameCache:
+    def __init__(self, max_bytes=64 * 2**20, disk_dir=None, max_disk_bytes=512 * 2**20):
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.disk_bytes = 0
+        self.entries = OrderedDict() # key -> PNG bytes, least recently used first
+        self.total_bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.lock = threading.Lock() # Streamlit runs each session in its own thread
+        self.disk_lock = threading.Lock() # One eviction pass at a time
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+            self.disk_bytes = sum(size for _, _, size in self.disk_files())
+            if self.disk_bytes > max_disk_bytes:
+                self.evict_disk()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        with self.lock:
+            data = self.entries.get(key)
+            if data is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return data
+        if self.disk_dir:
+            path = self.disk_path(key)
+            try:
+                with open(path, "rb") as f:
+                    data = f.read()
+                os.utime(path) # Recently used, so evicted last
+            except FileNotFoundError: # Never written, or evicted
+                data = None
+            if data is not None:
+                with self.lock:
+                    self.disk_hits += 1
+                self.put(key, data, write_disk=False)
+                return data
+        with self.lock:
+            self.misses += 1
+        return None
+
+    def put(self, key, data, write_disk=True):
+        if len(data) > self.max_bytes:
+            return
+        with self.lock:
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.total_bytes -= len(old)
+            self.entries[key] = data
+            self.total_bytes += len(data)
+            while self.total_bytes > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.total_bytes -= len(evicted)
+        if self.disk_dir and write_disk:
+            # Write to a temporary name first so a reader never sees half a file
+            path = self.disk_path(key)
+            try:
+                replaced = os.path.getsize(path)
+            except FileNotFoundError:
+                replaced = 0
+            with open(path + ".tmp", "wb") as f:
+                f.write(data)
+            os.replace(path + ".tmp", path)
+            with self.lock:
+                self.disk_bytes += len(data) - replaced
+                over = self.disk_bytes > self.max_disk_bytes
+            if over:
+                self.evict_disk()
+
+    def get_or_render(self, key, draw):
+        # draw() returns a matplotlib figure; it is only called on a miss
+        return self.get_or_encode(key, lambda: figure_png(draw()))
+
+    def get_or_encode(self, key, encode):
+        # encode() returns PNG bytes; it is only called on a miss
+        data = self.get(key)
+        if data is None:
+            with phase("render"):
+                data = encode()
+            self.put(key, data)
+        return data
+
+    def disk_path(self, key):
+        return os.path.join(self.disk_dir, key + ".png")
+
+    def disk_files(self):
+        # (mtime, path, size) for every frame in the disk tier
+        files = []
+        for entry in os.scandir(self.disk_dir):
+            if entry.name.endswith(".png"):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError: # Evicted by another process meanwhile
+                    continue
+                files.append((stat.st_mtime, entry.path, stat.st_size))
+        return files
+
+    def evict_disk(self):
+        # Deletes the least recently used files until the tier is under 90% of max_disk_bytes.
+        # The total is recounted from the directory, which other processes may share.
+        with self.disk_lock:
+            files = sorted(self.disk_files())
+            total = sum(size for _, _, size in files)
+            target = self.max_disk_bytes * 0.9
+            for _, path, size in files:
+                if total <= target:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+            with self.lock:
+                self.disk_bytes = total
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+                "entries": len(self.entries),
+                "bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+                "disk_bytes": self.disk_bytes,
+                "max_disk_bytes": self.max_disk_bytes,
+            }
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.total_bytes = 0
+
+def figure_png(fig):
+    # Renders a figure to PNG bytes and closes it
+    import matplotlib.pyplot as plt
+    buffer = io.BytesIO()
+    fig.savefig(buffer, **SAVEFIG_OPTIONS)
+    plt.close(fig)
+    return buffer.getvalue()
+
+def frame_key(view, structure, highlight=None, figsize=None):
+    # structure is anything with a stable repr: a tuple of items, or tree_structure(root)
+    text = repr((view, structure, highlight, figsize, THEME))
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+def tree_structure(root):
+    # Pre-order values with None for missing children, which pins down the exact shape
+    tokens = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node is None:
+            tokens.append(None)
+            continue
+        tokens.append(node.value)
+        stack.append(node.right)
+        stack.append(node.left)
+    return tuple(tokens)
+
+def tree_from_structure(structure):
+    # Rebuilds a tree of TreeNodes from tree_structure(root)
+    tokens = iter(structure)
+    value = next(tokens, None)
+    if value is None:
+        return None
+    root = TreeNode(value)
+    # Child slots still to fill, in pre-order: the next token always fills the top one
+    slots = [(root, "right"), (root, "left")]
+    nodes = [root]
+    for value in tokens:
+        parent, side = slots.pop()
+        if value is None:
+            continue
+        node = TreeNode(value)
+        setattr(parent, side, node)
+        nodes.append(node)
+        slots.append((node, "right"))
+        slots.append((node, "left"))
+    # Children come after their parent in pre-order, so backwards sees them first
+    for node in reversed(nodes):
+        node.height = 1 + max(node.left.height if node.left else 0, node.right.height if node.right else 0)
+    return root
+
+frame_cache = FrameCache(disk_dir=os.environ.get("FRAME_CACHE_DIR"), max_disk_bytes=int(os.environ.get("FRAME_CACHE_DISK_MB", 512)) * 2**20)
@@ -0,0 +1,136 @@
+import os
+import threading
+from collections import deque
+from data_structures.linked_list import LinkedList
+from data_structures.queue import Queue
+from data_structures.stack import Stack
+from visualizations.frame_cache import figure_png, frame_cache, frame_key, tree_from_structure, tree_structure
+from visualizations.timing import phase
+
+# Renders every frame of an animation up front in a pool of worker processes, so
+# playback only ever waits on the sleep between frames, not on matplotlib.
+#
+# Frames go to the workers as tuples of plain values (cheap to pickle) and
+# come back as PNG bytes, which also land in the shared frame cache. Frames the cache
+# already has are never sent. Iterating the pipeline yields the PNGs in frame order.
+
+def default_jobs():
+    return max(1, min(os.cpu_count() or 1, 8))
+
+pool = None
+pool_jobs = 0
+pool_lock = threading.Lock()
+
+def get_pool(jobs):
+    # One pool per process, shared by every session; rebuilt only if more workers are asked for
+    global pool, pool_jobs
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    with pool_lock:
+        if pool is None or pool_jobs < jobs:
+            if pool is not None:
+                pool.shutdown(wait=False)
+            # "spawn" starts clean workers; forking a threaded server like Streamlit can deadlock
+            pool = ProcessPoolExecutor(max_workers=jobs, mp_context=multiprocessing.get_context("spawn"), initializer=init_worker)
+            pool_jobs = jobs
+        return pool
+
+def init_worker():
+    import matplotlib
+    matplotlib.use("Agg")
+
+def render_png(view, structure, highlight, figsize):
+    # Runs in a worker process. structure is tree_structure(root) for trees, the items otherwise.
+    from visualizations import render
+    if view == "tree":
+        fig = render.draw_tree(tree_from_structure(structure), list(highlight), return_fig=True, figsize=figsize)
+    elif view == "stack":
+        fig = render.draw_stack(Stack(structure), highlight, return_fig=True)
+    elif view == "queue":
+        fig = render.draw_queue(Queue(structure), highlight, return_fig=True)
+    elif view == "linked_list":
+        fig = render.draw_linked_list(LinkedList(structure), highlight, return_fig=True)
+    else:
+        raise ValueError(f"Unknown view: {view}")
+    return figure_png(fig)
+
+class FramePipeline:
+    # frames: (frame, highlight) pairs for one view. For "tree" a frame is a tree root and the
+    # highlight a list of values; for "stack", "queue" and "linked_list" a frame is a tuple of
+    # items and the highlight an index or None. Keys match tree_png, stack_png and friends.
+    #
+    # jobs=0 renders in this process, one frame at a time as they are iterated, which is what
+    # you want when only one core is free. ahead=None starts every frame right away; a number
+    # keeps at most that many frames rendering ahead of the consumer. frames is only read as
+    # far as that window reaches, and a frame's structure and key are worked out when it
+    # enters the window, so a long export holds a window's worth of frames, not all of them.
+    # A pipeline is meant to be iterated once, inside a with block: leaving it early (an
+    # exception, or Streamlit stopping the script for a rerun) cancels the frames that
+    # haven't started, so the workers don't go on rendering.
+    def __init__(self, frames, view="tree", jobs=None, figsize=(8, 6), cache=frame_cache, ahead=None):
+        self.jobs = default_jobs() if jobs is None else jobs
+        self.view = view
+        self.cache = cache
+        self.ahead = ahead
+        self.executor = get_pool(self.jobs) if self.jobs > 0 else None
+        self.figsize = figsize if view == "tree" else None # The other views size their own figures
+        self.frames = iter(frames)
+        self.slots = deque() # Per frame read but not yet handed out: [key, ready PNG bytes, a Future, or the arguments to render it]
+        self.count = 0 # Frames read from frames so far
+        self.handed_out = 0
+        if ahead is None:
+            self.submit(None)
+
+    def __len__(self):
+        # Frames read so far: all of them once the pipeline has been iterated, or with ahead=None
+        return self.count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cancel()
+
+    def submit(self, end):
+        # Reads frames up to index end (None for all of them) and hands them to the pool
+        while end is None or self.count < end:
+            pair = next(self.frames, None)
+            if pair is None:
+                break
+            frame, highlight = pair
+            if self.view == "tree":
+                structure, highlight = tree_structure(frame), tuple(highlight)
+            else:
+                structure = tuple(frame)
+            key = frame_key(self.view, structure, highlight, self.figsize)
+            data = self.cache.get(key) if self.cache is not None else None
+            if data is None:
+                data = (self.view, structure, highlight, self.figsize)
+                if self.executor is not None:
+                    data = self.executor.submit(render_png, *data)
+            self.slots.append([key, data])
+            self.count += 1
+
+    def __iter__(self):
+        while True:
+            self.submit(self.handed_out + 1 + (self.ahead or 0))
+            if not self.slots:
+                return
+            key, work = self.slots.popleft() # Handed out; from here on only the cache keeps it
+            self.handed_out += 1
+            if isinstance(work, bytes):
+                yield work
+                continue
+            with phase("render"):
+                data = render_png(*work) if isinstance(work, tuple) else work.result()
+            if self.cache is not None:
+                self.cache.put(key, data)
+            yield data
+
+    def cancel(self):
+        # Drop frames that haven't started yet, e.g. when the user leaves the page mid-animation,
+        # and stop reading new ones
+        self.frames = iter(())
+        for _, work in self.slots:
+            if hasattr(work, "cancel"):
+                work.cancel()
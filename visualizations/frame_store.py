@@ -0,0 +1,238 @@
+import sys
+from array import array
+from collections import OrderedDict
+from visualizations.frame_cache import tree_from_structure, tree_structure
+
+# Compact storage for tree animation frames kept in session state.
+#
+# A list of (tree root, explanation, highlight) frames holds every tree version as node
+# objects for as long as the session lives. FrameStore keeps a checkpoint (the tree as
+# tree_structure tokens) every k frames and, for every frame, the ops that turn the
+# previous frame's tree into its own:
+#
+#   REPLACE path subtree   - put a new subtree at path (an insert is a one-node subtree)
+#   LEFT / RIGHT path      - rotate the subtree at path
+#
+# A path is the left/right turns from the root, packed into bits. Ops, highlights and
+# checkpoints are int arrays of indices into one table of distinct values; captions are
+# one UTF-8 buffer.
+#
+# frames[i] starts from the newest tree it already has at or before i (the last frame
+# asked for, or a checkpoint, materialized once) and applies the ops in between. Ops copy
+# only the nodes on their path, so the starting tree is never changed and stepping
+# forward one frame costs one frame's ops.
+
+REPLACE, LEFT, RIGHT = 0, 1, 2
+NONE = -1 # Token for a missing child
+PATH_BITS = 31 # Path bits per array item, which is a signed 32-bit int
+
+class FrameStore:
+    def __init__(self, frames, k=32):
+        self.k = k
+        self.values = [] # Distinct values; everything else refers to them by index
+        self.value_index = {}
+        self.captions = bytearray() # Every caption as UTF-8, back to back: a str per caption
+        self.caption_starts = array("i", [0]) # would take up to 4 bytes a character (emoji)
+        self.ops = array("i")
+        self.op_starts = array("i", [0]) # Frame i's ops are ops[op_starts[i]:op_starts[i + 1]]
+        self.highlights = array("i")
+        self.highlight_starts = array("i", [0])
+        self.checkpoints = {} # Frame index -> tree_structure tokens
+        self.materialized = OrderedDict() # Frame index -> root, for the last few trees built
+        previous = None
+        for i, (root, caption, highlight) in enumerate(frames):
+            if i:
+                self.diff(previous, root)
+            self.op_starts.append(len(self.ops))
+            self.highlights.extend(self.index(v) for v in highlight)
+            self.highlight_starts.append(len(self.highlights))
+            self.captions += caption.encode()
+            self.caption_starts.append(len(self.captions))
+            if i % k == 0:
+                last = self.checkpoints.get(i - k)
+                if last is not None and self.op_starts[i - k + 1] == self.op_starts[i + 1]:
+                    self.checkpoints[i] = last # Unchanged since the last checkpoint, e.g. a traversal
+                else:
+                    self.checkpoints[i] = array("i", (NONE if v is None else self.index(v) for v in tree_structure(root)))
+            previous = root
+
+    def __len__(self):
+        return len(self.caption_starts) - 1
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("frame index out of range")
+        highlight = [self.values[v] for v in self.highlights[self.highlight_starts[i]:self.highlight_starts[i + 1]]]
+        caption = self.captions[self.caption_starts[i]:self.caption_starts[i + 1]].decode()
+        return self.tree(i), caption, highlight
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def index(self, value):
+        index = self.value_index.get(value)
+        if index is None:
+            index = self.value_index[value] = len(self.values)
+            self.values.append(value)
+        return index
+
+    def tree(self, i):
+        # The newest tree we hold at or after frame i's checkpoint, then the ops from there
+        start = i - i % self.k
+        for j in self.materialized:
+            if start < j <= i:
+                start = j
+        root = self.materialized.get(start)
+        if root is None:
+            root = tree_from_structure([None if v == NONE else self.values[v] for v in self.checkpoints[start]])
+        position = self.op_starts[start + 1]
+        end = self.op_starts[i + 1]
+        while position < end:
+            root, position = self.apply(root, position)
+        self.materialized[i] = root
+        self.materialized.move_to_end(i)
+        while len(self.materialized) > 2:
+            self.materialized.popitem(last=False)
+        return root
+
+    # Encoding
+
+    def diff(self, before, after):
+        # Appends the ops that turn before into after. Subtrees the two versions share are
+        # skipped, so this only walks the part that changed.
+        stack = [(before, after, 0, 0)]
+        while stack:
+            a, b, bits, depth = stack.pop()
+            if a is b:
+                continue
+            if a is not None and b is not None and a.value != b.value:
+                a = self.match_rotation(a, b, bits, depth)
+            if a is None or b is None or a.value != b.value:
+                self.add_op(REPLACE, bits, depth)
+                tokens = tree_structure(b)
+                self.ops.append(len(tokens))
+                self.ops.extend(NONE if v is None else self.index(v) for v in tokens)
+                continue
+            stack.append((a.right, b.right, bits | 1 << depth, depth + 1))
+            stack.append((a.left, b.left, bits, depth + 1))
+
+    def match_rotation(self, a, b, bits, depth):
+        # If one rotation, or the two of a double rotation, brings b's root to the top of a,
+        # records them and returns the rotated a; otherwise returns a unchanged
+        if a.right and b.left and b.value == a.right.value and b.left.value == a.value:
+            self.add_op(LEFT, bits, depth)
+            return rotate(a, LEFT)
+        if a.left and b.right and b.value == a.left.value and b.right.value == a.value:
+            self.add_op(RIGHT, bits, depth)
+            return rotate(a, RIGHT)
+        if a.right and a.right.left and b.value == a.right.left.value:
+            self.add_op(RIGHT, bits | 1 << depth, depth + 1)
+            self.add_op(LEFT, bits, depth)
+            a = a.copy()
+            a.right = rotate(a.right, RIGHT)
+            return rotate(a, LEFT)
+        if a.left and a.left.right and b.value == a.left.right.value:
+            self.add_op(LEFT, bits, depth + 1)
+            self.add_op(RIGHT, bits, depth)
+            a = a.copy()
+            a.left = rotate(a.left, LEFT)
+            return rotate(a, RIGHT)
+        return a
+
+    def add_op(self, op, bits, depth):
+        self.ops.extend((op, depth))
+        for shift in range(0, depth, PATH_BITS):
+            self.ops.append(bits >> shift & (1 << PATH_BITS) - 1)
+
+    # Decoding
+
+    def apply(self, root, position):
+        # Applies the op at ops[position] to root without changing it. Returns the new root
+        # and the position of the next op.
+        ops = self.ops
+        op, depth = ops[position], ops[position + 1]
+        position += 2
+        words = -(-depth // PATH_BITS)
+        bits = 0
+        for w in range(words):
+            bits |= ops[position + w] << w * PATH_BITS
+        position += words
+        if op == REPLACE:
+            count = ops[position]
+            subtree = tree_from_structure([None if v == NONE else self.values[v] for v in ops[position + 1:position + 1 + count]])
+            position += 1 + count
+        # Copy the path down to the parent of the changed subtree
+        path = []
+        node = root
+        for d in range(depth):
+            path.append(node)
+            node = node.right if bits >> d & 1 else node.left
+        if op != REPLACE:
+            subtree = rotate(node, op)
+        if not path:
+            return subtree, position
+        copies = [n.copy() for n in path]
+        for d, parent in enumerate(copies):
+            child = copies[d + 1] if d + 1 < len(copies) else subtree
+            if bits >> d & 1:
+                parent.right = child
+            else:
+                parent.left = child
+        for node in reversed(copies):
+            set_height(node)
+        return copies[0], position
+
+    # Memory
+
+    def nbytes(self):
+        # Approximate memory held: the arrays, captions, value table and the cached trees
+        total = sys.getsizeof(self) + sys.getsizeof(self.__dict__)
+        total += sum(sys.getsizeof(a) for a in (self.ops, self.op_starts, self.highlights, self.highlight_starts, self.captions, self.caption_starts))
+        total += sys.getsizeof(self.values) + sys.getsizeof(self.value_index) + sum(sys.getsizeof(v) for v in self.values)
+        total += sys.getsizeof(self.checkpoints) + sum(sys.getsizeof(c) for c in {id(c): c for c in self.checkpoints.values()}.values())
+        return total + tree_nbytes(list(self.materialized.values()))
+
+def rotate(node, direction):
+    # Rotated copy of the subtree at node; only node and the child that moves up are copied
+    node = node.copy()
+    if direction == LEFT:
+        top = node.right.copy()
+        node.right, top.left = top.left, node
+    else:
+        top = node.left.copy()
+        node.left, top.right = top.right, node
+    set_height(node)
+    set_height(top)
+    return top
+
+def set_height(node):
+    node.height = 1 + max(node.left.height if node.left else 0, node.right.height if node.right else 0)
+
+def tree_nbytes(roots):
+    # Memory held by the distinct nodes reachable from roots (shared subtrees count once)
+    seen = set()
+    total = 0
+    stack = list(roots)
+    while stack:
+        node = stack.pop()
+        if node is None or id(node) in seen:
+            continue
+        seen.add(id(node))
+        total += sys.getsizeof(node) + sys.getsizeof(node.__dict__) + sys.getsizeof(node.value)
+        stack.append(node.left)
+        stack.append(node.right)
+    return total
+
+def frames_nbytes(frames):
+    # The same estimate for frames kept as a plain list of (root, explanation, highlight)
+    frames = list(frames)
+    total = sys.getsizeof(frames) + tree_nbytes(root for root, _, _ in frames)
+    for frame in frames:
+        total += sys.getsizeof(frame) + sys.getsizeof(frame[1]) + sys.getsizeof(frame[2])
+    return total
+
+def session_nbytes(session_state):
+    # Memory held by the FrameStores in one session's state
+    return sum(value.nbytes() for value in session_state.values() if isinstance(value, FrameStore))
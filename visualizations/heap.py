@@ -0,0 +1,69 @@
+import streamlit as st
+from data_structures.priority_queue import PriorityQueue
+from visualizations.frame_cache import frame_cache, frame_key
+from visualizations.render import draw_heap
+from visualizations.timing import phase
+
+def visualize_heap():
+    st.markdown("# Priority Queue ⛰️")
+    st.markdown('''
+        <div style="margin-top: 1.5em; margin-bottom: 1.5em;">
+        A priority queue always hands out the <strong>smallest</strong> value next, whatever order the values came in.
+        It is stored as a <strong>binary heap</strong>: a plain array where the children of index <strong>i</strong> sit at <strong>2i + 1</strong> and <strong>2i + 2</strong>, and every parent is no bigger than its children.
+        <br><br>
+        <strong>Push</strong> adds a value at the end and swaps it up past bigger parents; <strong>Pop</strong> takes the root, moves the last value there and swaps it down past smaller children.
+        Each takes O(log n) steps, one per level. <strong>Heapify</strong> builds a heap from a whole list at once in O(n).
+        </div>
+        ''', unsafe_allow_html=True)
+
+    canvas_placeholder = st.empty()
+    st.markdown("<div style='height: 1.5em'></div>", unsafe_allow_html=True)
+
+    # Keep the PriorityQueue itself in the session, so its array and position index carry over
+    if 'heap_state' not in st.session_state:
+        st.session_state.heap_state = PriorityQueue([9, 4, 7, 1, 8, 2, 6])
+    heap = st.session_state.heap_state
+
+    col_push, col_pop, col_input = st.columns([0.2, 0.2, 1])
+    with col_push:
+        push_clicked = st.button('Push ⬆️', key="heap_push")
+    with col_pop:
+        pop_clicked = st.button('Pop ❌', key="heap_pop")
+    with col_input:
+        push_value = st.text_input('Number to push:', '', key="heap_push_value")
+    heapify_input = st.text_input('Or heapify a new list (numeric comma-separated):', '', key="heap_heapify_values")
+    heapify_clicked = st.button('Heapify', key="heap_heapify")
+
+    highlight = []
+    try:
+        if push_clicked and push_value:
+            value = parse_number(push_value)
+            handle = heap.push(value)
+            st.success(f'Pushed {value}: it settled at index {heap.position[handle]}')
+            highlight = [heap.position[handle]]
+        elif pop_clicked:
+            if not len(heap):
+                st.warning('Priority queue is empty!')
+            else:
+                st.success(f'Popped: {heap.pop()}')
+        elif heapify_clicked and heapify_input:
+            heap.heapify(parse_number(v) for v in heapify_input.split(",") if v.strip())
+            st.success(f'Heapified {len(heap)} values')
+    except ValueError as error: # Not a number
+        st.warning(str(error))
+    if len(heap):
+        highlight = highlight or [0] # The next value out
+
+    with phase("send"):
+        canvas_placeholder.image(heap_png(heap.to_list(), highlight))
+
+def parse_number(text):
+    try:
+        return int(text.strip())
+    except ValueError:
+        raise ValueError(f'"{text.strip()}" is not a whole number') from None
+
+def heap_png(values, highlight_indices=()):
+    # PNG of draw_heap, served from the shared frame cache when this exact heap was drawn before
+    key = frame_key("heap", tuple(values), tuple(highlight_indices))
+    return frame_cache.get_or_render(key, lambda: draw_heap(values, highlight_indices, return_fig=True))
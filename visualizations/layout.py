@@ -0,0 +1,49 @@
+from array import array
+
+# Tree layout: every node's (x, y) is computed in one pass, without drawing anything.
+# x is the node's in-order position, so nodes never overlap and a left child is always left
+# of its parent however deep the tree gets. y is minus the depth, so the root sits at y = 0.
+# Coordinates live in array('d') buffers the renderer can hand to NumPy without copying.
+
+class TreeLayout:
+    def __init__(self):
+        self.values = [] # Node values, in in-order
+        self.xs = array('d')
+        self.ys = array('d')
+        self.parents = array('i') # Index of each node's parent, -1 for the root
+
+    def __len__(self):
+        return len(self.values)
+
+    def edges(self):
+        # (parent index, child index) for every edge
+        return [(parent, child) for child, parent in enumerate(self.parents) if parent >= 0]
+
+    def depth(self):
+        # Number of levels, 0 for an empty tree
+        return int(-min(self.ys)) + 1 if self.ys else 0
+
+def tree_layout(root):
+    layout = TreeLayout()
+    values, xs, ys, parents = layout.values, layout.xs, layout.ys, layout.parents
+    # In-order walk with an explicit stack of [node, depth, parent index, left child index].
+    # A right child's parent is placed before it, so its index is already known. A left
+    # child is placed before its parent, so it leaves its index in the parent's stack entry.
+    stack = []
+    node, depth, parent = root, 0, -1
+    while stack or node:
+        while node:
+            stack.append([node, depth, parent, -1])
+            node, depth, parent = node.left, depth + 1, -1
+        node, depth, parent, left_child = stack.pop()
+        index = len(values)
+        values.append(node.value)
+        xs.append(index)
+        ys.append(-depth)
+        parents.append(parent)
+        if left_child >= 0:
+            parents[left_child] = index
+        if stack and stack[-1][0].left is node:
+            stack[-1][3] = index
+        node, depth, parent = node.right, depth + 1, index
+    return layout
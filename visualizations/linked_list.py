@@ -1,6 +1,13 @@
 import streamlit as st
-import matplotlib.pyplot as plt
-from data_structures.linked_list import LinkedList
+from data_structures.linked_list import LinkedList, UnrolledLinkedList
+from visualizations.frame_cache import frame_cache, frame_key
+from visualizations.animations import search_frames, unrolled_search_frames
+from visualizations.render import LinkedListView, draw_linked_list, draw_unrolled_linked_list
+from visualizations.svg_animation import linked_list_animation_html
+from visualizations.timing import phase
+
+LIST_TYPES = ("Singly linked list", "Unrolled linked list")
+UNROLLED_CAPACITY = 4 # Small, so a few inserts are enough to see a chunk split
 
 def visualize_linked_list():
     st.markdown("# Linked List 🔗")
@@ -29,8 +36,15 @@ def visualize_linked_list():
 
     st.markdown("#### Search, Insert, or Delete at Nth Position")
 
-    values_list = ['A', 'B', 'C']
-    ll = LinkedList(values_list)
+    # An unrolled list keeps several values per node, so positional operations skip whole chunks
+    list_type = st.radio("List type", LIST_TYPES, horizontal=True, key="ll_list_type")
+    unrolled = list_type == LIST_TYPES[1]
+
+    # Keep the LinkedList itself in the session, so edits are its own insert_at / delete_at
+    # and searches reuse its value index instead of rebuilding the list every rerun
+    if 'll_state' not in st.session_state:
+        st.session_state.ll_state = LinkedList(['A', 'B', 'C'])
+    ll = st.session_state.ll_state
     canvas_placeholder = st.empty()
     st.markdown("<div style='height: 1.5em'></div>", unsafe_allow_html=True)
     # Override Streamlit pink border for input widgets except when focused
@@ -47,10 +61,11 @@ def visualize_linked_list():
 
     # Controls for search, insert, delete at nth position
     col_search, col_insert, col_delete = st.columns(3)
-    ll_length = len(st.session_state.ll_state) if 'll_state' in st.session_state else len(ll.to_list())
+    ll_length = len(ll)
     with col_search:
         search_value = st.text_input('Search value', '', key="ll_search_value")
         search_clicked = st.button('Search', key="ll_search_btn")
+        client_side = st.toggle('Animate in the browser', key="ll_client_side", disabled=unrolled) and not unrolled
     with col_insert:
         insert_index = st.number_input('Insert at index', min_value=0, max_value=ll_length, step=1, value=0, key="ll_insert_index")
         insert_at_value = st.text_input('Value to insert', '', key="ll_insert_at_value")
@@ -59,24 +74,64 @@ def visualize_linked_list():
         delete_index = st.number_input('Delete at index', min_value=0, max_value=max(ll_length-1,0), step=1, value=0, key="ll_delete_index")
         delete_at_clicked = st.button('Delete', key="ll_delete_at_btn")
 
-    if 'll_state' not in st.session_state:
-        st.session_state.ll_state = ll.to_list()
+    if unrolled:
+        # Kept across reruns so the chunks show the splits and merges the edits caused.
+        # Edits made in the singly linked view drop it, and it is rebuilt from ll here.
+        if st.session_state.get('ll_unrolled') is None:
+            st.session_state.ll_unrolled = UnrolledLinkedList(ll, capacity=UNROLLED_CAPACITY)
+        unrolled_ll = st.session_state.ll_unrolled
 
     highlight_index = None
     search_result = None
+    shown_in_browser = False
     # Search by value with animation
-    if search_clicked and search_value:
-        found_index = None
-        for i, v in enumerate(st.session_state.ll_state):
-            fig = draw_linked_list(LinkedList(st.session_state.ll_state), highlight_index=i, return_fig=True)
-            canvas_placeholder.pyplot(fig, use_container_width=False, clear_figure=True)
+    if search_clicked and search_value and client_side:
+        # The whole search ships as one animation that plays in the browser, no server renders
+        with phase("build"):
+            frames = list(search_frames(ll, search_value))
+            html = linked_list_animation_html(frames, autoplay=True)
+        with phase("send"), canvas_placeholder.container():
+            st.iframe(html, height=260)
+        shown_in_browser = True
+        found_index = frames[-1][2]
+        if found_index is not None:
+            st.success(f'Value "{search_value}" found at index {found_index}')
+        else:
+            st.warning(f'Value "{search_value}" not found in the list.')
+    elif search_clicked and search_value and unrolled:
+        for chunks, description, position in unrolled_search_frames(unrolled_ll.chunks(), search_value):
+            with canvas_placeholder.container():
+                with phase("send"):
+                    st.image(unrolled_png(chunks, position))
+                st.caption(description)
             import time
-            time.sleep(0.35)
-            import matplotlib.pyplot as plt
-            plt.close('all')
-            if str(v) == str(search_value):
-                found_index = i
-                break
+            with phase("wait"):
+                time.sleep(0.35)
+        found_index = unrolled_ll.index_of(search_value)
+        if found_index >= 0:
+            st.success(f'Value "{search_value}" found at index {found_index}')
+            highlight_index = found_index
+        else:
+            st.warning(f'Value "{search_value}" not found in the list.')
+    elif search_clicked and search_value:
+        found_index = None
+        # The value index answers the search up front; the walk below is only the animation
+        target = ll.find_first(search_value)
+        # The view lays the list out once; each step only redraws the highlighted node
+        with LinkedListView(ll) as view:
+            node = ll.head
+            i = 0
+            while node:
+                with phase("send"):
+                    canvas_placeholder.image(linked_list_png(ll, highlight_index=i, view=view))
+                import time
+                with phase("wait"):
+                    time.sleep(0.35)
+                if node is target:
+                    found_index = i
+                    break
+                node = node.next
+                i += 1
         if found_index is not None:
             st.success(f'Value "{search_value}" found at index {found_index}')
             highlight_index = found_index
@@ -85,77 +140,59 @@ def visualize_linked_list():
             highlight_index = None
     # Insert at nth position
     elif insert_at_clicked and insert_at_value:
-        if insert_index < 0 or insert_index > len(st.session_state.ll_state):
+        if insert_index < 0 or insert_index > len(ll):
             st.warning('Index out of range!')
         else:
-            st.session_state.ll_state.insert(insert_index, insert_at_value)
+            if unrolled:
+                unrolled_ll.insert_at(insert_index, insert_at_value)
+            else:
+                st.session_state.ll_unrolled = None
+            ll.insert_at(insert_index, insert_at_value)
             st.success(f'Inserted {insert_at_value} at index {insert_index}')
             highlight_index = insert_index
     # Delete at nth position
     elif delete_at_clicked:
-        if delete_index < 0 or delete_index >= len(st.session_state.ll_state):
+        if delete_index < 0 or delete_index >= len(ll):
             st.warning('Index out of range!')
         else:
-            removed = st.session_state.ll_state.pop(delete_index)
+            if unrolled:
+                unrolled_ll.delete_at(delete_index)
+            else:
+                st.session_state.ll_unrolled = None
+            removed = ll.delete_at(delete_index)
             st.success(f'Deleted {removed} at index {delete_index}')
             highlight_index = delete_index
 
-    ll = LinkedList(st.session_state.ll_state)
-    fig = draw_linked_list(ll, highlight_index=highlight_index, return_fig=True)
-    canvas_placeholder.pyplot(fig, use_container_width=False, clear_figure=True)
-    import matplotlib.pyplot as plt
-    plt.close('all')
+    if unrolled:
+        chunks = unrolled_ll.chunks()
+        with phase("send"):
+            canvas_placeholder.image(unrolled_png(chunks, chunk_position(chunks, highlight_index)))
+    elif not shown_in_browser:
+        with phase("send"):
+            canvas_placeholder.image(linked_list_png(ll, highlight_index=highlight_index))
 
-def draw_linked_list(ll, highlight_index=None, return_fig=False):
-    items = ll.to_list()
-    min_width = 3.5
-    fig_width = max(len(items) * 0.95 + 0.7, min_width)
-    fig, ax = plt.subplots(figsize=(fig_width, 1.6))
-    fig.patch.set_facecolor("#1E1E1E")
-    ax.set_xlim(-0.5, max(2.5, len(items) - 0.1))
-    ax.set_ylim(0, 1.6)
-    ax.axis('off')
+def linked_list_png(ll, highlight_index=None, view=None):
+    # PNG of draw_linked_list, served from the shared frame cache when this exact list was drawn before.
+    # With a LinkedListView of ll, the frame is the view's window around the highlight: a miss
+    # only redraws the highlight, and the key reuses the view's own, so no step walks the list.
+    if view is not None:
+        if view.key is None:
+            view.key = frame_key("linked_list_view", tuple(view.items), None, (view.dpi, view.window))
+        return frame_cache.get_or_encode(frame_key("linked_list_view", view.key, highlight_index), lambda: view.png(highlight_index))
+    key = frame_key("linked_list", tuple(ll), highlight_index)
+    return frame_cache.get_or_render(key, lambda: draw_linked_list(ll, highlight_index, return_fig=True))
 
-    base_radius = 0.23
-    base_font = 11
-    base_lw = 1.1
-    min_radius = 0.13
-    min_font = 7
-    min_lw = 0.5
-    n = max(len(items), 1)
-    radius_scale = min(1, 3.0 / (n + 2))
-    other_scale = min(1, 2.0 / n)
-    radius = max(base_radius * radius_scale, min_radius)
-    font_size = max(int(base_font * other_scale), min_font)
-    lw = max(base_lw * other_scale, min_lw)
-
-    y = 0.8
-    for i, value in enumerate(items):
-        x = i * 0.95 + 0.35
-        # Highlight selected index
-        if highlight_index is not None and i == highlight_index:
-            color = '#FFC107'  # Yellow highlight
-            edgecolor = '#1E1E1E'
-            lw_highlight = lw + 1.2
-        else:
-            color = "#569CD6"  # Color for linked list nodes
-            edgecolor = 'black'
-            lw_highlight = lw
-        circle = plt.Circle((x, y), radius, color=color, ec=edgecolor, lw=lw_highlight, zorder=2)
-        ax.add_patch(circle)
-        ax.text(x, y, str(value), ha='center', va='center', fontsize=font_size, fontweight='bold', color='#1E1E1E', zorder=3)
-        # Draw arrow line to next node
-        if i < len(items) - 1:
-            start_x = x + radius
-            end_x = (i + 1) * 0.95 + 0.35 - radius
-            ax.annotate('', xy=(end_x, y), xytext=(start_x, y),
-                        arrowprops=dict(arrowstyle="->", color="#D4D4D4", lw=lw, shrinkA=0, shrinkB=0), zorder=1)
-        # Head and Tail labels
-        if i == 0:
-            ax.text(x, y + radius + 0.18, 'Head', ha='center', va='center', fontsize=max(int(font_size*0.9), 7), color='#1E1E1E', fontweight='bold', bbox=dict(facecolor='#B7E1F7', edgecolor='none', boxstyle='round,pad=0.18'))
-        if i == len(items) - 1:
-            ax.text(x, y - radius - 0.18, 'Tail', ha='center', va='center', fontsize=max(int(font_size*0.9), 7), color='#1E1E1E', fontweight='bold', bbox=dict(facecolor='#B7E1F7', edgecolor='none', boxstyle='round,pad=0.18'))
+def unrolled_png(chunks, position=None):
+    # PNG of draw_unrolled_linked_list, through the shared frame cache
+    key = frame_key("unrolled_linked_list", tuple(chunks), position, UNROLLED_CAPACITY)
+    return frame_cache.get_or_render(key, lambda: draw_unrolled_linked_list(chunks, UNROLLED_CAPACITY, position, return_fig=True))
 
-    if return_fig:
-        return fig
-    st.pyplot(fig, use_container_width=False)
\ No newline at end of file
+def chunk_position(chunks, index):
+    # (chunk index, slot index) of the value at index, or None
+    if index is None:
+        return None
+    for c, items in enumerate(chunks):
+        if index < len(items):
+            return c, index
+        index -= len(items)
+    return None
@@ -1,6 +1,8 @@
 import streamlit as st
-import matplotlib.pyplot as plt
 from data_structures.queue import Queue
+from visualizations.frame_cache import frame_cache, frame_key
+from visualizations.render import draw_queue
+from visualizations.timing import phase
 
 def visualize_queue():
     st.markdown("# Queue 👥")
@@ -26,68 +28,25 @@ def visualize_queue():
     with col_input:
         insert_value = st.text_input('Value to enqueue (single character pls):', '', key="queue_insert_value")
 
+    # Keep the Queue itself in the session so dequeue doesn't shift a list every time
     if 'queue_state' not in st.session_state:
-        st.session_state.queue_state = queue.to_list()
+        st.session_state.queue_state = queue
 
     if enqueue_clicked and insert_value:
-        st.session_state.queue_state.append(insert_value)
+        st.session_state.queue_state.enqueue(insert_value)
         st.success(f'Enqueued: {insert_value}')
         st.rerun()
     elif dequeue_clicked:
-        if not st.session_state.queue_state:
+        if not len(st.session_state.queue_state):
             st.warning('Queue is empty!')
         else:
-            dequeued = st.session_state.queue_state.pop(0)
+            dequeued = st.session_state.queue_state.dequeue()
             st.success(f'Dequeued: {dequeued}')
 
-    queue = Queue(st.session_state.queue_state)
-    fig = draw_queue(queue, return_fig=True)
-    canvas_placeholder.pyplot(fig, use_container_width=False, clear_figure=True)
+    with phase("send"):
+        canvas_placeholder.image(queue_png(st.session_state.queue_state))
 
-def draw_queue(queue, highlight_index=None, return_fig=False):
-    items = queue.to_list()
-    min_width = 5 # Set a minimum width for the figure
-    fig_width = max(len(items) * 1.5, min_width)  # Ensure the width never goes below the minimum
-    fig, ax = plt.subplots(figsize=(fig_width, 2.5))  # Adjust width based on queue length
-    fig.patch.set_facecolor("#151C15")
-    ax.set_xlim(-0.5, max(3, len(items))) 
-    ax.set_ylim(0, 3) 
-    ax.axis('off')
-
-    base_width = 0.6
-    base_font = 18
-    base_rect_height = 1.7
-    base_rect_y = 0.2  
-    base_top_font = 14
-    base_lw = 1.5
-    min_width = 0.18
-    min_font = 8
-    min_rect_height = 0.45
-    min_rect_y = 0.1 
-    min_top_font = 7
-    min_lw = 0.5
-    n = max(len(items), 1)
-    width_scale = min(1, 6.0 / (n + 3))
-    other_scale = min(1, 3.0 / n)
-    rect_width = max(base_width * width_scale, min_width)
-    font_size = max(int(base_font * other_scale), min_font)
-    rect_height = max(base_rect_height * other_scale, min_rect_height)
-    rect_y = max(base_rect_y * other_scale, min_rect_y)
-    top_font_size = max(int(base_top_font * other_scale), min_top_font)
-    lw = max(base_lw * other_scale, min_lw)
-
-    for i, value in enumerate(items):
-        x = i
-        color = '#569CD6'
-        rect = plt.Rectangle((x, rect_y), rect_width, rect_height, color=color, ec='black', lw=lw)
-        ax.add_patch(rect)
-        ax.text(x + rect_width/2, rect_y + rect_height/2 - rect_height*0.07, str(value), ha='center', va='center', fontsize=font_size, fontweight='bold', color='#1E1E1E')
-        if i == 0:
-            label = 'Head' if len(items) == 1 else 'Head'
-            ax.text(x + rect_width/2, rect_y + rect_height + 0.6, label, ha='center', va='center', fontsize=top_font_size, color='#1E1E1E', fontweight='bold', bbox=dict(facecolor='#B7E1F7', edgecolor='none', boxstyle='round,pad=0.24'))
-        if i == len(items) - 1 and len(items) > 1:
-            ax.text(x + rect_width/2, rect_y + rect_height + 0.6, 'Tail', ha='center', va='center', fontsize=top_font_size, color='#1E1E1E', fontweight='bold', bbox=dict(facecolor='#B7E1F7', edgecolor='none', boxstyle='round,pad=0.24'))
-
-    if return_fig:
-        return fig
-    st.pyplot(fig, use_container_width=False)
\ No newline at end of file
+def queue_png(queue, highlight_index=None):
+    # PNG of draw_queue, served from the shared frame cache when this exact queue was drawn before
+    key = frame_key("queue", tuple(queue.to_list()), highlight_index)
+    return frame_cache.get_or_render(key, lambda: draw_queue(queue, highlight_index, return_fig=True))
@@ -0,0 +1,424 @@
+from visualizations.layout import tree_layout
+
+# Drawing code that only needs matplotlib, so it can run in worker processes
+# and command-line tools that never import Streamlit. matplotlib and NumPy are
+# imported inside the functions, so importing this module costs nothing until
+# something is actually drawn.
+
+def draw_tree(root, highlight_list, return_fig=False, figsize=(8, 6)):
+    # Lays out the whole tree in one pass, then draws every edge as one LineCollection
+    # and every node as one scatter, so the cost barely grows with the number of nodes.
+    import matplotlib.pyplot as plt
+    import numpy as np
+    from matplotlib.collections import LineCollection
+    highlight_color = '#FFD700'  # Gold for highlighted nodes
+    node_color = "#569CD6"       # Blue for normal nodes
+    edge_color = "#D4D4D4"       # Light grey for edges
+    text_color = "#1E1E1E"       # Dark for text
+
+    fig, ax = plt.subplots(figsize=figsize)
+    ax.axis('off')
+    ax.set_facecolor('#1E1E1E')
+    fig.patch.set_facecolor('#1E1E1E')
+    fig.subplots_adjust(left=0.05, right=0.95, top=0.95, bottom=0.05)
+
+    layout = tree_layout(root)
+    if len(layout):
+        xs = np.frombuffer(layout.xs)
+        ys = np.frombuffer(layout.ys)
+        highlighted = np.array([value in highlight_list for value in layout.values], dtype=bool)
+        ax.set_xlim(xs.min() - 1, xs.max() + 1)
+        ax.set_ylim(ys.min() - 1, ys.max() + 1)
+
+        edges = np.array(layout.edges(), dtype=int).reshape(-1, 2)
+        if len(edges):
+            segments = np.stack([np.column_stack([xs[edges[:, 0]], ys[edges[:, 0]]]),
+                                 np.column_stack([xs[edges[:, 1]], ys[edges[:, 1]]])], axis=1)
+
+        # Fit each label into the gap to its nearest neighbour on the same level (and into
+        # the space between levels). Labels that would need less than a 6pt font are culled,
+        # except on highlighted nodes, which always keep theirs.
+        axes_width = fig.get_figwidth() * fig.dpi * 0.9
+        axes_height = fig.get_figheight() * fig.dpi * 0.9
+        x_pixels = axes_width / (xs.max() - xs.min() + 2)
+        y_pixels = axes_height / (ys.max() - ys.min() + 2)
+        by_level = np.lexsort((xs, ys))
+        same_level = ys[by_level][1:] == ys[by_level][:-1]
+        neighbour_gap = np.where(same_level, np.diff(xs[by_level]), np.inf)
+        gaps = np.full(len(layout), np.inf)
+        gaps[by_level[1:]] = np.minimum(gaps[by_level[1:]], neighbour_gap)
+        gaps[by_level[:-1]] = np.minimum(gaps[by_level[:-1]], neighbour_gap)
+        box_widths = 0.65 * np.array([len(str(value)) for value in layout.values]) + 0.8  # In font sizes
+        points = 72 / fig.dpi
+        font_sizes = np.minimum(12, np.minimum(y_pixels * 0.5, gaps * x_pixels * 0.9 / box_widths) * points)
+        labeled = font_sizes >= 6
+        font_sizes = np.where(highlighted, np.maximum(font_sizes, 6) * 14 / 12, font_sizes)
+        labeled |= highlighted
+
+        if len(edges):
+            line_width = max(0.5, min(3, min(x_pixels, y_pixels) / 4))
+            ax.add_collection(LineCollection(segments, colors=edge_color, linewidths=line_width, alpha=0.7, zorder=1))
+
+        # Unlabeled nodes are drawn together as one scatter of small squares
+        dots = ~labeled
+        if dots.any():
+            dot_size = min(x_pixels, y_pixels) * 0.6 * points
+            ax.scatter(xs[dots], ys[dots], s=dot_size ** 2, c=node_color, marker='s', linewidths=0, zorder=3)
+
+        for i in np.flatnonzero(labeled):
+            color = highlight_color if highlighted[i] else node_color
+            ax.text(xs[i], ys[i], str(layout.values[i]), bbox=dict(facecolor=color, edgecolor='black'), ha='center', va='center', fontsize=font_sizes[i], fontweight='bold', color=text_color, zorder=4)
+
+    if return_fig:
+        return fig
+    import streamlit as st
+    st.pyplot(fig)
+
+def draw_stack(stack, highlight_index=None, return_fig=False):
+    # Read the items in place (a list for Stack, an array.array for TypedStack) instead of copying them
+    import matplotlib.pyplot as plt
+    items = stack.items
+    fig, ax = plt.subplots(figsize=(6, 2.5))  # Reduced height for canvas
+    fig.patch.set_facecolor("#151C15")  # Light blue/gray background similar to tree
+    ax.set_xlim(0, 2.5)
+    ax.set_ylim(-0.5, max(3, len(items)))  # Show at least 3 slots, expand if needed
+    ax.axis('off')
+
+    # Dynamically adjust element size based on stack length
+    base_height = 0.6
+    base_font = 18
+    base_rect_width = 1.7
+    base_rect_x = .95  # Moved further right
+    base_top_font = 14
+    base_lw = 1.5
+    min_height = 0.18
+    min_font = 8
+    base_rect_width = .5  
+    min_rect_width = 0.45 
+    min_rect_x = 0.9   # Moved further right
+    min_top_font = 7
+    min_lw = 0.5
+    n = max(len(items), 1)
+    # Shrink height more slowly as stack grows
+    height_scale = min(1, 6.0 / (n + 3))
+    other_scale = min(1, 3.0 / n)
+    rect_height = max(base_height * height_scale, min_height)
+    font_size = max(int(base_font * other_scale), min_font)
+    rect_width = max(base_rect_width * other_scale, min_rect_width)
+    rect_x = max(base_rect_x * other_scale, min_rect_x)
+    top_font_size = max(int(base_top_font * other_scale), min_top_font)
+    lw = max(base_lw * other_scale, min_lw)
+
+    for i, value in enumerate(items):
+        y = i
+        color = '#569CD6'
+        rect = plt.Rectangle((rect_x, y), rect_width, rect_height, color=color, ec='black', lw=lw)
+        ax.add_patch(rect)
+        ax.text(rect_x + rect_width/2, y + rect_height/2 - rect_height*0.07, str(value), ha='center', va='center', fontsize=font_size, fontweight='bold', color='#1E1E1E')
+        if i == len(items) - 1:
+            ax.text(rect_x + rect_width + 0.2, y + rect_height/2, 'Top', va='center', fontsize=top_font_size, color='#1E1E1E', fontweight='bold', bbox=dict(facecolor='#B7E1F7', edgecolor='none', boxstyle='round,pad=0.24'))
+
+    # If return_fig is True, return the figure instead of displaying it
+    if return_fig:
+        return fig
+    import streamlit as st
+    st.pyplot(fig, use_container_width=False)
+
+def draw_queue(queue, highlight_index=None, return_fig=False):
+    import matplotlib.pyplot as plt
+    items = queue.to_list()
+    min_width = 5 # Set a minimum width for the figure
+    fig_width = max(len(items) * 1.5, min_width)  # Ensure the width never goes below the minimum
+    fig, ax = plt.subplots(figsize=(fig_width, 2.5))  # Adjust width based on queue length
+    fig.patch.set_facecolor("#151C15")
+    ax.set_xlim(-0.5, max(3, len(items))) 
+    ax.set_ylim(0, 3) 
+    ax.axis('off')
+
+    base_width = 0.6
+    base_font = 18
+    base_rect_height = 1.7
+    base_rect_y = 0.2  
+    base_top_font = 14
+    base_lw = 1.5
+    min_width = 0.18
+    min_font = 8
+    min_rect_height = 0.45
+    min_rect_y = 0.1 
+    min_top_font = 7
+    min_lw = 0.5
+    n = max(len(items), 1)
+    width_scale = min(1, 6.0 / (n + 3))
+    other_scale = min(1, 3.0 / n)
+    rect_width = max(base_width * width_scale, min_width)
+    font_size = max(int(base_font * other_scale), min_font)
+    rect_height = max(base_rect_height * other_scale, min_rect_height)
+    rect_y = max(base_rect_y * other_scale, min_rect_y)
+    top_font_size = max(int(base_top_font * other_scale), min_top_font)
+    lw = max(base_lw * other_scale, min_lw)
+
+    for i, value in enumerate(items):
+        x = i
+        color = '#569CD6'
+        rect = plt.Rectangle((x, rect_y), rect_width, rect_height, color=color, ec='black', lw=lw)
+        ax.add_patch(rect)
+        ax.text(x + rect_width/2, rect_y + rect_height/2 - rect_height*0.07, str(value), ha='center', va='center', fontsize=font_size, fontweight='bold', color='#1E1E1E')
+        if i == 0:
+            label = 'Head' if len(items) == 1 else 'Head'
+            ax.text(x + rect_width/2, rect_y + rect_height + 0.6, label, ha='center', va='center', fontsize=top_font_size, color='#1E1E1E', fontweight='bold', bbox=dict(facecolor='#B7E1F7', edgecolor='none', boxstyle='round,pad=0.24'))
+        if i == len(items) - 1 and len(items) > 1:
+            ax.text(x + rect_width/2, rect_y + rect_height + 0.6, 'Tail', ha='center', va='center', fontsize=top_font_size, color='#1E1E1E', fontweight='bold', bbox=dict(facecolor='#B7E1F7', edgecolor='none', boxstyle='round,pad=0.24'))
+
+    if return_fig:
+        return fig
+    import streamlit as st
+    st.pyplot(fig, use_container_width=False)
+
+def linked_list_geometry(count):
+    # Node x positions, the row's y, and the node radius, font size and line width for a
+    # list of count nodes. Smaller nodes for longer lists, down to a minimum.
+    base_radius = 0.23
+    base_font = 11
+    base_lw = 1.1
+    min_radius = 0.13
+    min_font = 7
+    min_lw = 0.5
+    n = max(count, 1)
+    radius_scale = min(1, 3.0 / (n + 2))
+    other_scale = min(1, 2.0 / n)
+    radius = max(base_radius * radius_scale, min_radius)
+    font_size = max(int(base_font * other_scale), min_font)
+    lw = max(base_lw * other_scale, min_lw)
+    xs = [i * 0.95 + 0.35 for i in range(count)]
+    return xs, 0.8, radius, font_size, lw
+
+def draw_linked_list_node(ax, x, y, value, highlighted, radius, font_size, lw):
+    # One node: its circle and its label. Returns both artists.
+    import matplotlib.pyplot as plt
+    if highlighted:
+        color = '#FFC107'  # Yellow highlight
+        edgecolor = '#1E1E1E'
+        lw_highlight = lw + 1.2
+    else:
+        color = "#569CD6"  # Color for linked list nodes
+        edgecolor = 'black'
+        lw_highlight = lw
+    circle = plt.Circle((x, y), radius, color=color, ec=edgecolor, lw=lw_highlight, zorder=2)
+    ax.add_patch(circle)
+    text = ax.text(x, y, str(value), ha='center', va='center', fontsize=font_size, fontweight='bold', color='#1E1E1E', zorder=3)
+    return circle, text
+
+def draw_linked_list(ll, highlight_index=None, return_fig=False):
+    import matplotlib.pyplot as plt
+    items = ll.to_list()
+    min_width = 3.5
+    fig_width = max(len(items) * 0.95 + 0.7, min_width)
+    fig, ax = plt.subplots(figsize=(fig_width, 1.6))
+    fig.patch.set_facecolor("#1E1E1E")
+    ax.set_xlim(-0.5, max(2.5, len(items) - 0.1))
+    ax.set_ylim(0, 1.6)
+    ax.axis('off')
+
+    xs, y, radius, font_size, lw = linked_list_geometry(len(items))
+    for i, (x, value) in enumerate(zip(xs, items)):
+        # Highlight selected index
+        draw_linked_list_node(ax, x, y, value, highlight_index is not None and i == highlight_index, radius, font_size, lw)
+        # Draw arrow line to next node
+        if i < len(items) - 1:
+            start_x = x + radius
+            end_x = xs[i + 1] - radius
+            ax.annotate('', xy=(end_x, y), xytext=(start_x, y),
+                        arrowprops=dict(arrowstyle="->", color="#D4D4D4", lw=lw, shrinkA=0, shrinkB=0), zorder=1)
+        # Head and Tail labels
+        if i == 0:
+            ax.text(x, y + radius + 0.18, 'Head', ha='center', va='center', fontsize=max(int(font_size*0.9), 7), color='#1E1E1E', fontweight='bold', bbox=dict(facecolor='#B7E1F7', edgecolor='none', boxstyle='round,pad=0.18'))
+        if i == len(items) - 1:
+            ax.text(x, y - radius - 0.18, 'Tail', ha='center', va='center', fontsize=max(int(font_size*0.9), 7), color='#1E1E1E', fontweight='bold', bbox=dict(facecolor='#B7E1F7', edgecolor='none', boxstyle='round,pad=0.18'))
+
+    if return_fig:
+        return fig
+    import streamlit as st
+    st.pyplot(fig, use_container_width=False)
+
+def draw_unrolled_linked_list(chunks, capacity, highlight=None, return_fig=False):
+    # chunks: each chunk's values, head first. highlight: (chunk index, slot index or None);
+    # a slot lights up one value, None outlines the whole chunk.
+    import matplotlib.pyplot as plt
+    cell = 0.5
+    gap = 0.6 # Between chunks, for the arrow
+    chunk_width = capacity * cell
+    fig_width = max(len(chunks) * (chunk_width + gap) * 0.8 + 0.7, 3.5)
+    fig, ax = plt.subplots(figsize=(fig_width, 1.8))
+    fig.patch.set_facecolor("#1E1E1E")
+    ax.set_xlim(-0.4, max(len(chunks) * (chunk_width + gap), 2 * chunk_width))
+    ax.set_ylim(-0.2, 1.6)
+    ax.set_aspect('equal')
+    ax.axis('off')
+
+    n = max(sum(len(items) for items in chunks), 1)
+    font_size = max(int(11 * min(1, 12.0 / n)), 6)
+    label_font = 9
+    y = 0.55
+    for c, items in enumerate(chunks):
+        x0 = c * (chunk_width + gap)
+        highlighted_chunk = highlight is not None and highlight[0] == c
+        for slot in range(capacity):
+            if slot < len(items):
+                color = '#FFC107' if highlighted_chunk and highlight[1] == slot else "#569CD6"
+            else:
+                color = "#2a3331" # Free slot
+            ax.add_patch(plt.Rectangle((x0 + slot * cell, y), cell, cell, facecolor=color, edgecolor='black', lw=0.8, zorder=2))
+            if slot < len(items):
+                ax.text(x0 + (slot + 0.5) * cell, y + cell / 2, str(items[slot]), ha='center', va='center', fontsize=font_size, fontweight='bold', color='#1E1E1E', zorder=3)
+        if highlighted_chunk and highlight[1] is None:
+            ax.add_patch(plt.Rectangle((x0, y), chunk_width, cell, fill=False, edgecolor='#FFC107', lw=2.5, zorder=4))
+        ax.text(x0 + chunk_width / 2, y - 0.22, f"{len(items)}/{capacity}", ha='center', va='center', fontsize=label_font - 2, color='#D4D4D4')
+        if c < len(chunks) - 1:
+            ax.annotate('', xy=(x0 + chunk_width + gap, y + cell / 2), xytext=(x0 + chunk_width, y + cell / 2),
+                        arrowprops=dict(arrowstyle="->", color="#D4D4D4", lw=1, shrinkA=0, shrinkB=0), zorder=1)
+        if c == 0:
+            ax.text(x0 + cell / 2, y + cell + 0.3, 'Head', ha='center', va='center', fontsize=label_font, color='#1E1E1E', fontweight='bold', bbox=dict(facecolor='#B7E1F7', edgecolor='none', boxstyle='round,pad=0.18'))
+        if c == len(chunks) - 1:
+            ax.text(x0 + chunk_width - cell / 2, y + cell + 0.3, 'Tail', ha='center', va='center', fontsize=label_font, color='#1E1E1E', fontweight='bold', bbox=dict(facecolor='#B7E1F7', edgecolor='none', boxstyle='round,pad=0.18'))
+
+    if return_fig:
+        return fig
+    import streamlit as st
+    st.pyplot(fig, use_container_width=False)
+
+def draw_heap(values, highlight_indices=(), return_fig=False):
+    # A binary heap's array two ways: as the tree it encodes (children of i at 2i + 1 and
+    # 2i + 2) above, and as the flat array with its indices below. Highlighted indices light
+    # up in both.
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
+    node_color = "#569CD6"
+    highlight_color = '#FFD700'
+    edge_color = "#D4D4D4"
+    text_color = "#1E1E1E"
+    n = len(values)
+    depth = max(n.bit_length() - 1, 0) # Index of the bottom level
+    width = 2 ** depth # Slots on the bottom level
+    fig_width = min(max(width * 0.9, 5), 16)
+    fig, (tree_ax, array_ax) = plt.subplots(2, 1, figsize=(fig_width, 5), gridspec_kw={"height_ratios": [3, 1]})
+    fig.patch.set_facecolor('#1E1E1E')
+    for ax in (tree_ax, array_ax):
+        ax.set_facecolor('#1E1E1E')
+        ax.axis('off')
+    highlighted = set(highlight_indices)
+    font_size = max(min(12, int(160 / max(width, n, 1))), 6)
+
+    # Tree: node i sits centered over the slots its subtree would fill on the bottom level
+    xs, ys = [], []
+    for i in range(n):
+        level = (i + 1).bit_length() - 1
+        span = 2 ** (depth - level)
+        xs.append((i + 1 - 2 ** level + 0.5) * span)
+        ys.append(-level)
+    tree_ax.add_collection(LineCollection([[(xs[(i - 1) // 2], ys[(i - 1) // 2]), (xs[i], ys[i])] for i in range(1, n)], colors=edge_color, linewidths=1.5, zorder=1))
+    colors = [highlight_color if i in highlighted else node_color for i in range(n)]
+    tree_ax.scatter(xs, ys, s=max(900 / max(width, 1) ** 0.5, 60), c=colors, edgecolors="black", zorder=2)
+    for i, value in enumerate(values):
+        tree_ax.text(xs[i], ys[i], str(value), ha='center', va='center', fontsize=font_size, fontweight='bold', color=text_color, zorder=3)
+    tree_ax.set_xlim(0, width)
+    tree_ax.set_ylim(-depth - 0.5, 0.5)
+
+    # Array: one cell per index
+    for i, value in enumerate(values):
+        array_ax.add_patch(plt.Rectangle((i, 0), 1, 1, facecolor=colors[i], edgecolor="black", lw=1))
+        array_ax.text(i + 0.5, 0.5, str(value), ha='center', va='center', fontsize=font_size, fontweight='bold', color=text_color)
+        array_ax.text(i + 0.5, -0.3, str(i), ha='center', va='center', fontsize=max(font_size - 2, 6), color=edge_color)
+    array_ax.set_xlim(-0.1, max(n, 4) + 0.1)
+    array_ax.set_ylim(-0.6, 1.1)
+
+    if return_fig:
+        return fig
+    import streamlit as st
+    st.pyplot(fig, use_container_width=False)
+
+class LinkedListView:
+    # Retained-mode linked list for stepping a highlight along it, as the search does.
+    # The list (circles, arrows, labels) is drawn once into a base image. Each step puts
+    # back the base pixels under the last highlighted node, draws the new highlight, and
+    # encodes a window of at most window nodes around it, so a step costs the same on a
+    # list of 5 nodes or 1,000; only the one-off base drawing grows with the list. A list
+    # that fits in the window comes out whole, matching draw_linked_list saved with
+    # bbox_inches="tight". The figure is only built on the first png() call.
+    def __init__(self, ll, dpi=200, window=9):
+        self.ll = ll
+        self.items = ll.to_list()
+        self.dpi = dpi
+        self.window = window
+        self.fig = None
+        self.key = None # Frame cache key for the list, set by the first cached step
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def png(self, highlight_index):
+        import io
+        import math
+        from matplotlib.transforms import Bbox
+        from PIL import Image
+        if self.fig is None:
+            self.draw_base()
+        if self.dirty is not None:
+            self.canvas.restore_region(self.background, bbox=self.dirty, xy=(0, 0))
+            self.dirty = None
+        left, top, right, bottom = self.crop
+        if highlight_index is None:
+            center = left
+        else:
+            x = self.xs[highlight_index]
+            self.circle.center = (x, self.y)
+            self.label.set_position((x, self.y))
+            self.label.set_text(str(self.items[highlight_index]))
+            self.ax.draw_artist(self.circle)
+            self.ax.draw_artist(self.label)
+            renderer = self.canvas.get_renderer()
+            box = Bbox.union([self.circle.get_window_extent(renderer), self.label.get_window_extent(renderer)]).padded(4)
+            self.dirty = (math.floor(box.x0), math.floor(box.y0), math.ceil(box.x1), math.ceil(box.y1))
+            center = self.node_px[highlight_index]
+        # The window slides with the highlight and stops at the ends of the list
+        width = min(right - left, self.window_px)
+        start = min(max(int(center - width / 2), left), right - width)
+        pixels = self.pixels[top:bottom, start:start + width]
+        buffer = io.BytesIO()
+        Image.fromarray(pixels).save(buffer, format="png", compress_level=1)
+        return buffer.getvalue()
+
+    def draw_base(self):
+        import math
+        import numpy as np
+        self.fig = fig = draw_linked_list(self.ll, None, return_fig=True)
+        fig.set_dpi(self.dpi)
+        self.ax = fig.axes[0]
+        self.xs, self.y, radius, font_size, lw = linked_list_geometry(len(self.items))
+        # The overlay: animated artists are left out of the base drawing
+        self.circle, self.label = draw_linked_list_node(self.ax, 0, self.y, "", True, radius, font_size, lw)
+        self.circle.set_animated(True)
+        self.label.set_animated(True)
+        self.canvas = fig.canvas
+        self.canvas.draw()
+        self.background = self.canvas.copy_from_bbox(fig.bbox)
+        self.dirty = None # Display box of the highlight drawn over the base, if any
+        self.pixels = np.asarray(self.canvas.buffer_rgba()) # A view: steps draw into it
+        # The tight crop savefig would make, padded by its default 0.1 inches
+        height = self.canvas.get_width_height()[1]
+        box = fig.get_tightbbox(self.canvas.get_renderer()).padded(0.1)
+        left, top = int(box.x0 * self.dpi), math.ceil(height - box.y1 * self.dpi)
+        self.crop = (max(left, 0), max(top, 0), left + int(box.width * self.dpi), top + int(box.height * self.dpi))
+        self.node_px = [self.ax.transData.transform((x, self.y))[0] for x in self.xs]
+        if len(self.xs) <= self.window:
+            self.window_px = self.crop[2] - self.crop[0]
+        else:
+            self.window_px = int(self.window * (self.node_px[1] - self.node_px[0]))
+
+    def close(self):
+        if self.fig is not None:
+            import matplotlib.pyplot as plt
+            plt.close(self.fig)
+            self.fig = None
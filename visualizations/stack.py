@@ -1,6 +1,8 @@
 import streamlit as st
-import matplotlib.pyplot as plt
 from data_structures.stack import Stack
+from visualizations.frame_cache import frame_cache, frame_key
+from visualizations.render import draw_stack
+from visualizations.timing import phase
 
 def visualize_stack():
     st.markdown("# Stack 📚")
@@ -61,70 +63,29 @@ def visualize_stack():
         </style>
         """, unsafe_allow_html=True)
         insert_value = st.text_input('', '', key="stack_insert_value")
+    # Keep the Stack itself in the session instead of rebuilding it from a list on every rerun
     if 'stack_state' not in st.session_state:
-        st.session_state.stack_state = stack.to_list()
+        st.session_state.stack_state = stack
     if insert_clicked and insert_value:
-        st.session_state.stack_state.append(insert_value)
+        st.session_state.stack_state.push(insert_value)
         st.success(f'Inserted: {insert_value}')
         st.rerun()
     elif peek_clicked:
-        if not st.session_state.stack_state:
+        if not len(st.session_state.stack_state):
             st.warning('You took a peek, but the stack is empty!')
         else:
-            top_item = st.session_state.stack_state[-1]
+            top_item = st.session_state.stack_state.peek()
             st.info(f'You took a peek, the top item is: {top_item}')
     elif pop_clicked:
-        if not st.session_state.stack_state:
+        if not len(st.session_state.stack_state):
             st.warning('Stack is empty!')
         else:
             popped = st.session_state.stack_state.pop()
             st.success(f'Popped: {popped}')
-    stack = Stack(st.session_state.stack_state)
-    canvas_placeholder.pyplot(draw_stack(stack, return_fig=True), use_container_width=False)
+    with phase("send"):
+        canvas_placeholder.image(stack_png(st.session_state.stack_state))
 
-def draw_stack(stack, highlight_index=None, return_fig=False):
-    items = stack.to_list()
-    fig, ax = plt.subplots(figsize=(6, 2.5))  # Reduced height for canvas
-    fig.patch.set_facecolor("#151C15")  # Light blue/gray background similar to tree
-    ax.set_xlim(0, 2.5)
-    ax.set_ylim(-0.5, max(3, len(items)))  # Show at least 3 slots, expand if needed
-    ax.axis('off')
-
-    # Dynamically adjust element size based on stack length
-    base_height = 0.6
-    base_font = 18
-    base_rect_width = 1.7
-    base_rect_x = .95  # Moved further right
-    base_top_font = 14
-    base_lw = 1.5
-    min_height = 0.18
-    min_font = 8
-    base_rect_width = .5  
-    min_rect_width = 0.45 
-    min_rect_x = 0.9   # Moved further right
-    min_top_font = 7
-    min_lw = 0.5
-    n = max(len(items), 1)
-    # Shrink height more slowly as stack grows
-    height_scale = min(1, 6.0 / (n + 3))
-    other_scale = min(1, 3.0 / n)
-    rect_height = max(base_height * height_scale, min_height)
-    font_size = max(int(base_font * other_scale), min_font)
-    rect_width = max(base_rect_width * other_scale, min_rect_width)
-    rect_x = max(base_rect_x * other_scale, min_rect_x)
-    top_font_size = max(int(base_top_font * other_scale), min_top_font)
-    lw = max(base_lw * other_scale, min_lw)
-
-    for i, value in enumerate(items):
-        y = i
-        color = '#569CD6'
-        rect = plt.Rectangle((rect_x, y), rect_width, rect_height, color=color, ec='black', lw=lw)
-        ax.add_patch(rect)
-        ax.text(rect_x + rect_width/2, y + rect_height/2 - rect_height*0.07, str(value), ha='center', va='center', fontsize=font_size, fontweight='bold', color='#1E1E1E')
-        if i == len(items) - 1:
-            ax.text(rect_x + rect_width + 0.2, y + rect_height/2, 'Top', va='center', fontsize=top_font_size, color='#1E1E1E', fontweight='bold', bbox=dict(facecolor='#B7E1F7', edgecolor='none', boxstyle='round,pad=0.24'))
-
-    # If return_fig is True, return the figure instead of displaying it
-    if return_fig:
-        return fig
-    st.pyplot(fig, use_container_width=False)
+def stack_png(stack, highlight_index=None):
+    # PNG of draw_stack, served from the shared frame cache when this exact stack was drawn before
+    key = frame_key("stack", tuple(stack.items), highlight_index)
+    return frame_cache.get_or_render(key, lambda: draw_stack(stack, highlight_index, return_fig=True))
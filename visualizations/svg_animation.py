@@ -0,0 +1,236 @@
+import json
+from visualizations.frame_store import FrameStore
+
+# Client-side animations: one self-contained HTML snippet (SVG plus a little JavaScript)
+# holding every frame of an animation, with play, step and slider controls. Once it is on
+# the page, stepping through frames happens entirely in the browser: no Streamlit rerun
+# and no server-side render per step.
+#
+# Linked-list frames carry a layout index, the highlighted node indices and a caption, with
+# each distinct list's layout (labels, positions, parents) stored once. Tree frames carry a
+# caption and highlighted values; the trees themselves come as one initial tree plus the
+# ops each frame applies, and are laid out in the browser the way tree_layout does it.
+
+COLORS = {
+    "node": "#569CD6",
+    "highlight": "#FFD700",
+    "edge": "#D4D4D4",
+    "text": "#1E1E1E",
+}
+
+def tree_animation_html(frames, autoplay=False, interval=1200, height=480):
+    # frames: (tree root, caption, highlighted values), as from grow_frames or traverse_tree.
+    # Trees ship as FrameStore's encoding: the first frame's tree, then per frame the ops
+    # (subtree replacements and rotations) that turn the previous tree into it. The browser
+    # replays them and lays out only the frames it draws, so the payload grows with the
+    # changes, not with frames x nodes.
+    frames = list(frames)
+    store = FrameStore(frames, k=len(frames) + 1) # One checkpoint: the first frame
+    tree = {
+        "labels": [str(v) for v in store.values],
+        "initial": list(store.checkpoints.get(0, [])),
+        "ops": list(store.ops),
+        "opStarts": list(store.op_starts),
+    }
+    frame_data = []
+    for i in range(len(store)):
+        caption = store.captions[store.caption_starts[i]:store.caption_starts[i + 1]].decode()
+        frame_data.append({"caption": caption, "highlight": list(store.highlights[store.highlight_starts[i]:store.highlight_starts[i + 1]])})
+    return animation_html(None, frame_data, shape="box", arrows=False, autoplay=autoplay, interval=interval, height=height, tree=tree)
+
+def linked_list_animation_html(frames, autoplay=False, interval=350, height=200):
+    # frames: (tuple of items, caption, highlighted index or None), as from search_frames
+    layouts = []
+    seen = {}
+    frame_data = []
+    for items, caption, highlight_index in frames:
+        index = seen.get(items)
+        if index is None:
+            index = seen[items] = len(layouts)
+            layouts.append({"labels": [str(v) for v in items], "xs": list(range(len(items))), "ys": [0] * len(items), "parents": list(range(-1, len(items) - 1))})
+        frame_data.append({"layout": index, "caption": caption, "highlight": [] if highlight_index is None else [highlight_index]})
+    return animation_html(layouts, frame_data, shape="circle", arrows=True, autoplay=autoplay, interval=interval, height=height)
+
+def animation_html(layouts, frames, shape, arrows, autoplay, interval, height, tree=None):
+    data = {"layouts": layouts, "tree": tree, "frames": frames, "shape": shape, "arrows": arrows, "autoplay": autoplay, "interval": interval, "colors": COLORS}
+    # "</" would end the script tag early if a label contained "</script>"
+    payload = json.dumps(data, separators=(",", ":")).replace("</", "<\\/")
+    return TEMPLATE.replace("__HEIGHT__", str(height)).replace("__DATA__", payload)
+
+TEMPLATE = """
+<style>
+  body { margin: 0; background: #1E1E1E; color: #D4D4D4; font-family: 'Segoe UI', sans-serif; font-size: 14px; }
+  .controls { display: flex; align-items: center; gap: 6px; margin-top: 6px; }
+  .controls button { background: #2a3331; color: #D4D4D4; border: 1px solid #454545; border-radius: 3px; padding: 2px 10px; cursor: pointer; }
+  .controls input { flex: 1; accent-color: #569CD6; }
+  .caption { min-height: 1.4em; margin-top: 4px; }
+</style>
+<svg id="canvas" width="100%" height="__HEIGHT__" preserveAspectRatio="xMidYMid meet"></svg>
+<div class="controls">
+  <button id="prev">&larr;</button><button id="play">&#9654;</button><button id="next">&rarr;</button>
+  <input id="slider" type="range" min="0" value="0"><span id="step"></span>
+</div>
+<div class="caption" id="caption"></div>
+<script>
+const data = __DATA__;
+const NS = "http://www.w3.org/2000/svg";
+const X = 48, Y = 64, FONT = 14;
+const svg = document.getElementById("canvas");
+const slider = document.getElementById("slider");
+const play = document.getElementById("play");
+let current = 0, timer = null;
+slider.max = data.frames.length - 1;
+
+function add(parent, name, attrs, text) {
+  const node = document.createElementNS(NS, name);
+  for (const key in attrs) node.setAttribute(key, attrs[key]);
+  if (text !== undefined) node.textContent = text;
+  parent.appendChild(node);
+  return node;
+}
+
+// Trees: nodes are {v: value index, l, r}. Ops are FrameStore's: [op, depth, path words,
+// then for a replace the subtree's pre-order tokens], with -1 for a missing child.
+const REPLACE = 0, LEFT = 1, PATH_BITS = 31;
+
+function build(tokens, start, count) {
+  if (!count || tokens[start] < 0) return null;
+  const root = {v: tokens[start], l: null, r: null};
+  const slots = [[root, "r"], [root, "l"]];
+  for (let i = start + 1; i < start + count; i++) {
+    const [parent, side] = slots.pop();
+    if (tokens[i] < 0) continue;
+    const node = {v: tokens[i], l: null, r: null};
+    parent[side] = node;
+    slots.push([node, "r"], [node, "l"]);
+  }
+  return root;
+}
+
+function copy(node) { return {v: node.v, l: node.l, r: node.r}; }
+
+function rotate(node, op) {
+  node = copy(node);
+  let top;
+  if (op === LEFT) { top = copy(node.r); node.r = top.l; top.l = node; }
+  else { top = copy(node.l); node.l = top.r; top.r = node; }
+  return top;
+}
+
+function apply(root, ops, p) {
+  // Returns [new root, position of the next op]; root itself is never changed
+  const op = ops[p], depth = ops[p + 1], words = p + 2;
+  p = words + Math.ceil(depth / PATH_BITS);
+  const right = d => (ops[words + Math.floor(d / PATH_BITS)] >> (d % PATH_BITS)) & 1;
+  let subtree;
+  if (op === REPLACE) { subtree = build(ops, p + 1, ops[p]); p += 1 + ops[p]; }
+  const path = [];
+  let node = root;
+  for (let d = 0; d < depth; d++) { path.push(node); node = right(d) ? node.r : node.l; }
+  if (op !== REPLACE) subtree = rotate(node, op);
+  if (!path.length) return [subtree, p];
+  const copies = path.map(copy);
+  copies.forEach((parent, d) => { const child = d + 1 < copies.length ? copies[d + 1] : subtree; if (right(d)) parent.r = child; else parent.l = child; });
+  return [copies[0], p];
+}
+
+const roots = [];
+if (data.tree) {
+  const tree = data.tree;
+  let root = build(tree.initial, 0, tree.initial.length);
+  for (let i = 0; i < data.frames.length; i++) {
+    for (let p = tree.opStarts[i]; p < tree.opStarts[i + 1];) [root, p] = apply(root, tree.ops, p);
+    roots.push(root);
+  }
+}
+
+function treeLayout(root) {
+  // Same as tree_layout: x is the in-order position, y is minus the depth
+  const layout = {labels: [], values: [], xs: [], ys: [], parents: []};
+  const stack = [];
+  let node = root, depth = 0, parent = -1;
+  while (stack.length || node) {
+    while (node) { stack.push([node, depth, parent, -1]); node = node.l; depth++; parent = -1; }
+    let leftChild;
+    [node, depth, parent, leftChild] = stack.pop();
+    const index = layout.values.length;
+    layout.values.push(node.v); layout.labels.push(data.tree.labels[node.v]);
+    layout.xs.push(index); layout.ys.push(-depth); layout.parents.push(parent);
+    if (leftChild >= 0) layout.parents[leftChild] = index;
+    if (stack.length && stack[stack.length - 1][0].l === node) stack[stack.length - 1][3] = index;
+    node = node.r; depth++; parent = index;
+  }
+  return layout;
+}
+
+const layouts = new Map(); // Root -> layout; a traversal's frames all share one root
+function frameLayout(i) {
+  if (!data.tree) return data.layouts[data.frames[i].layout];
+  const root = roots[i];
+  if (!layouts.has(root)) layouts.set(root, treeLayout(root));
+  return layouts.get(root);
+}
+
+function draw(i) {
+  current = i;
+  const frame = data.frames[i], layout = frameLayout(i), colors = data.colors;
+  let highlight = new Set(frame.highlight);
+  if (data.tree) { // Tree frames highlight values; turn them into node indices
+    const values = highlight;
+    highlight = new Set();
+    layout.values.forEach((v, k) => { if (values.has(v)) highlight.add(k); });
+  }
+  const n = layout.labels.length;
+  let minX = 0, maxX = 0, maxDepth = 0;
+  for (let k = 0; k < n; k++) {
+    minX = Math.min(minX, layout.xs[k]); maxX = Math.max(maxX, layout.xs[k]); maxDepth = Math.max(maxDepth, -layout.ys[k]);
+  }
+  svg.replaceChildren();
+  // Never zoom in further than a tree 8 nodes wide and 4 levels deep, so small trees keep small nodes
+  const width = Math.max(maxX - minX + 2, 8) * X, height = Math.max(maxDepth + 2, 4) * Y;
+  svg.setAttribute("viewBox", `${(minX + maxX) / 2 * X - width / 2} ${-Y} ${width} ${height}`);
+  const defs = add(svg, "defs", {});
+  const marker = add(defs, "marker", {id: "arrow", viewBox: "0 0 10 10", refX: 10, refY: 5, markerWidth: 6, markerHeight: 6, orient: "auto"});
+  add(marker, "path", {d: "M0,0 L10,5 L0,10 z", fill: colors.edge});
+  const radius = 18;
+  for (let child = 0; child < n; child++) {
+    const parent = layout.parents[child];
+    if (parent < 0) continue;
+    const x1 = layout.xs[parent] * X, y1 = -layout.ys[parent] * Y, x2 = layout.xs[child] * X, y2 = -layout.ys[child] * Y;
+    const line = {x1: x1, y1: y1, x2: x2, y2: y2, stroke: colors.edge, "stroke-width": 2, "stroke-opacity": 0.7};
+    if (data.arrows) {
+      // Stop at the edge of the circles so the arrowhead stays visible
+      const length = Math.hypot(x2 - x1, y2 - y1), dx = (x2 - x1) / length, dy = (y2 - y1) / length;
+      Object.assign(line, {x1: x1 + dx * radius, y1: y1 + dy * radius, x2: x2 - dx * radius, y2: y2 - dy * radius, "marker-end": "url(#arrow)"});
+    }
+    add(svg, "line", line);
+  }
+  for (let k = 0; k < n; k++) {
+    const x = layout.xs[k] * X, y = -layout.ys[k] * Y, label = layout.labels[k];
+    const fill = highlight.has(k) ? colors.highlight : colors.node;
+    if (data.shape === "circle") {
+      add(svg, "circle", {cx: x, cy: y, r: radius, fill: fill, stroke: "black"});
+    } else {
+      const width = (0.65 * label.length + 0.8) * FONT, height = 1.6 * FONT;
+      add(svg, "rect", {x: x - width / 2, y: y - height / 2, width: width, height: height, fill: fill, stroke: "black"});
+    }
+    add(svg, "text", {x: x, y: y, fill: colors.text, "font-size": FONT, "font-weight": "bold", "text-anchor": "middle", "dominant-baseline": "central"}, label);
+  }
+  slider.value = i;
+  document.getElementById("step").textContent = `Step ${i + 1}/${data.frames.length}`;
+  document.getElementById("caption").textContent = frame.caption;
+}
+
+function stop() { clearInterval(timer); timer = null; play.innerHTML = "&#9654;"; }
+function start() {
+  if (current === data.frames.length - 1) draw(0);
+  play.innerHTML = "&#10074;&#10074;";
+  timer = setInterval(() => { if (current < data.frames.length - 1) draw(current + 1); else stop(); }, data.interval);
+}
+play.onclick = () => timer ? stop() : start();
+document.getElementById("prev").onclick = () => { stop(); draw(Math.max(0, current - 1)); };
+document.getElementById("next").onclick = () => { stop(); draw(Math.min(data.frames.length - 1, current + 1)); };
+slider.oninput = () => { stop(); draw(Number(slider.value)); };
+if (data.frames.length) { draw(0); if (data.autoplay) start(); }
+</script>
+"""
@@ -0,0 +1,102 @@
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# Per-rerun timing. main.py starts a timer at the top of every rerun and finishes it at the
+# bottom; code in between marks what it is doing with `with phase(name):`. Phases nest, and
+# time is only ever charged to the innermost one, so a render inside a send phase counts
+# as render, not both. Each finished rerun is logged on the "rerun_timing" logger
+# and kept in a short history for summary().
+#
+#   setup  - page config, CSS, sidebar
+#   page   - the picked page's own code: its text, widgets and logic, minus the phases below
+#   build  - building the data structure and its animation frames
+#   render - drawing frames (matplotlib, or waiting on the frame pipeline)
+#   send   - putting the drawn frames and animations on the page (st.image, st.iframe)
+#   wait   - the sleeps between animation frames
+#
+# Set RERUN_TIMING=1 to print the log lines to stderr.
+
+PHASES = ("setup", "page", "build", "render", "send", "wait")
+
+logger = None # Set up on the first finished rerun, so importing this module stays cheap
+
+history = deque(maxlen=500) # Most recent finished reruns, as report dicts
+history_lock = threading.Lock()
+local = threading.local() # Streamlit runs each session's reruns in its own thread
+
+class RerunTimer:
+    def __init__(self, label):
+        self.label = label
+        self.totals = dict.fromkeys(PHASES, 0.0)
+        self.stack = [] # Open phases, innermost last
+        self.start = self.last = time.perf_counter()
+
+    def enter(self, name):
+        now = time.perf_counter()
+        if self.stack:
+            self.totals[self.stack[-1]] += now - self.last
+        self.stack.append(name)
+        self.last = now
+
+    def exit(self):
+        now = time.perf_counter()
+        self.totals[self.stack.pop()] += now - self.last
+        self.last = now
+
+    def report(self):
+        total = time.perf_counter() - self.start
+        report = {"label": self.label, "total": total, **self.totals}
+        report["other"] = max(0.0, total - sum(self.totals.values()))
+        return report
+
+def start_rerun(label):
+    local.timer = RerunTimer(label)
+    return local.timer
+
+def finish_rerun():
+    timer = getattr(local, "timer", None)
+    if timer is None:
+        return None
+    local.timer = None
+    report = timer.report()
+    with history_lock:
+        history.append(report)
+    get_logger().info("rerun %s: %s", report["label"], " ".join(f"{name}={report[name] * 1000:.1f}ms" for name in PHASES + ("other", "total")))
+    return report
+
+def get_logger():
+    global logger
+    if logger is None:
+        import logging
+        logger = logging.getLogger("rerun_timing")
+        if os.environ.get("RERUN_TIMING"):
+            logger.setLevel(logging.INFO)
+            logger.addHandler(logging.StreamHandler())
+    return logger
+
+@contextmanager
+def phase(name):
+    # Does nothing outside a rerun, e.g. in export.py or a benchmark
+    timer = getattr(local, "timer", None)
+    if timer is None:
+        yield
+        return
+    timer.enter(name)
+    try:
+        yield
+    finally:
+        timer.exit()
+
+def summary():
+    # Mean and 95th percentile per phase, in milliseconds, over the recent reruns
+    with history_lock:
+        reports = list(history)
+    result = {"reruns": len(reports)}
+    for name in PHASES + ("other", "total"):
+        values = sorted(report[name] * 1000 for report in reports)
+        if values:
+            result[name] = {"mean": sum(values) / len(values), "p95": values[min(len(values) - 1, int(len(values) * 0.95))]}
+    return result
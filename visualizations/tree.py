@@ -1,119 +1,40 @@
 import streamlit as st
-import matplotlib.pyplot as plt
-from data_structures.tree import TreeNode
-from data_structures.avl_tree import AVLTree  # Import AVLTree class
+from data_structures.tree import tree_height
+from data_structures.traversal import TRAVERSALS
+from data_structures.counters import OpCounters
+from visualizations.animations import TREE_TYPES, grow_frames, traverse_tree
+from visualizations.render import draw_tree
+from visualizations.frame_cache import frame_cache, frame_key, tree_structure
+from visualizations.frame_pipeline import FramePipeline
+from visualizations.frame_store import FrameStore, session_nbytes
+from visualizations.svg_animation import tree_animation_html
+from visualizations.timing import phase
 
 # Helper functions
 
-def tree_height(node):
-    if not node:
-        return 0
-    return 1 + max(tree_height(node.left), tree_height(node.right))
+def tree_png(root, highlight_list, figsize=(8, 6)):
+    # PNG of draw_tree, served from the shared frame cache when this exact frame was drawn before
+    key = frame_key("tree", tree_structure(root), tuple(highlight_list), figsize)
+    return frame_cache.get_or_render(key, lambda: draw_tree(root, highlight_list, return_fig=True, figsize=figsize))
 
-def draw_node(node, x, y, dx, highlight_list, ax, level=0, max_width=0, edge_positions=None):
-    if node:
-        highlight_color = '#FFD700'  # Gold for highlighted nodes
-        node_color = "#569CD6"       # Blue for normal nodes
-        edge_color = "#D4D4D4"       # Light grey for edges
-        text_color = "#1E1E1E"       # Dark for text
+def count_summary(snapshot):
+    rotations = snapshot.get("left_rotations", 0) + snapshot.get("right_rotations", 0)
+    return f"{snapshot.get('comparisons', 0):,} comparisons, {rotations:,} rotations, {snapshot.get('height_updates', 0):,} height updates, depth {snapshot.get('max_depth', 0)}"
 
-        color = highlight_color if node.value in highlight_list else node_color
-        size = 14 if node.value in highlight_list else 12
-        ax.text(x, y, str(node.value), bbox=dict(facecolor=color, edgecolor='black'), ha='center', va='center', fontsize=size, fontweight='bold', color=text_color, zorder=4)
+def frame_memory_caption(store):
+    st.caption(f"{len(store)} steps stored in {store.nbytes() / 1024:,.0f} KB; {session_nbytes(st.session_state) / 1024:,.0f} KB of animation frames in this session")
 
-        # Track edge positions for dynamic axis limits
-        if edge_positions is not None:
-            edge_positions.append((x, y))
+# The in-browser animations depend only on these inputs, so reruns for anything else
+# (another widget, a button press) reuse the HTML instead of rebuilding it
+@st.cache_data(max_entries=16)
+def grow_animation_html(values, tree_type, show_counts):
+    frames, _ = grow_frames(values, tree_type, counters=OpCounters() if show_counts else None)
+    return tree_animation_html((frame, f"Tree Height: {tree_height(frame) - 1}. {description}", highlighted) for frame, description, highlighted in frames)
 
-        next_dx = dx / (2 ** level) if max_width > 0 else dx / 2
-
-        if node.left:
-            ax.plot([x, x-next_dx], [y, y-1], color=edge_color, lw=3, alpha=0.7, zorder=1)
-            if edge_positions is not None:
-                edge_positions.append((x-next_dx, y-1))
-            draw_node(node.left, x-next_dx, y-1, dx, highlight_list, ax, level + 1, max_width, edge_positions)
-        if node.right:
-            ax.plot([x, x+next_dx], [y, y-1], color=edge_color, lw=3, alpha=0.7, zorder=1)
-            if edge_positions is not None:
-                edge_positions.append((x+next_dx, y-1))
-            draw_node(node.right, x+next_dx, y-1, dx, highlight_list, ax, level + 1, max_width, edge_positions)
-
-# Tree insertion functions
-
-def insert_bst(root, value):
-    if not root:
-        return TreeNode(value)
-    if value < root.value:  
-        root.left = insert_bst(root.left, value)
-    else:
-        root.right = insert_bst(root.right, value)
-    return root
-
-def insert_avl(root, value, avl_tree):
-    return avl_tree.insert(root, value)  # Use AVLTree's insert method
-
-# Traversal functions
-
-def traverse_tree(node, traversal, parent=None):
-    frames = []
-    explanations = []
-    import copy
-
-    if traversal == "Pre-order":
-        def pre_order(n, parent):
-            if n:
-                highlight = [n.value]
-                if parent:
-                    explanations.append(f"Pre-order: Visit {n.value} (child of {parent.value})")
-                else:
-                    explanations.append(f"Pre-order: Visit root {n.value}")
-                frames.append((copy.deepcopy(node), explanations[-1], highlight))
-                pre_order(n.left, n)
-                pre_order(n.right, n)
-        pre_order(node, parent)
-
-    elif traversal == "In-order":
-        def in_order(n, parent):
-            if n:
-                in_order(n.left, n)
-                highlight = [n.value]
-                if parent:
-                    explanations.append(f"In-order: Visit {n.value} (child of {parent.value})")
-                else:
-                    explanations.append(f"In-order: Visit root {n.value}")
-                frames.append((copy.deepcopy(node), explanations[-1], highlight))
-                in_order(n.right, n)
-        in_order(node, parent)
-
-    elif traversal == "Post-order":
-        def post_order(n, parent):
-            if n:
-                post_order(n.left, n)
-                post_order(n.right, n)
-                highlight = [n.value]
-                if parent:
-                    explanations.append(f"Post-order: Visit {n.value} (child of {parent.value})")
-                else:
-                    explanations.append(f"Post-order: Visit root {n.value}")
-                frames.append((copy.deepcopy(node), explanations[-1], highlight))
-        post_order(node, parent)
-
-    return frames, explanations
-
-def find_insertion(prev, curr):
-    # Returns (inserted_value, parent_value, direction) or (None, None, None)
-    if not prev:
-        return (curr.value, None, None)
-    stack = [(prev, curr, None)]
-    while stack:
-        prev_node, curr_node, parent = stack.pop()
-        if not prev_node and curr_node:
-            # New node inserted
-            return (curr_node.value, parent.value if parent else None, 'left' if parent and parent.left == curr_node else 'right')
-        if prev_node and curr_node:
-            stack.append((prev_node.left, curr_node.left, curr_node))
-            stack.append((prev_node.right, curr_node.right, curr_node))
-    return (None, None, None)
+@st.cache_data(max_entries=16)
+def traversal_animation_html(values, tree_type, traversal_type):
+    _, tree_root = grow_frames(values, tree_type)
+    return tree_animation_html(traverse_tree(tree_root, traversal_type))
 
 # Streamlit UI
 
@@ -143,7 +64,7 @@ def visualize_tree():
     """, unsafe_allow_html=True)
 
     # User input section
-    tree_type = st.selectbox("Choose tree type:", ["Binary Search Tree (BST)", "AVL Tree"], index=0)
+    tree_type = st.selectbox("Choose tree type:", list(TREE_TYPES), index=0)
 
     # Ensure both text boxes are always synchronized
     if "tree_node_values" not in st.session_state:
@@ -155,84 +76,68 @@ def visualize_tree():
 
     # Use st.session_state.tree_node_values everywhere for values
     values = [int(v.strip()) for v in st.session_state.tree_node_values.split(",") if v.strip()]
-
-    # Initialize tree and AVLTree instance
-    tree_root = None
-    avl_tree = AVLTree()
-
-    # Build tree from user input
-    frames = []
-    explanations = []
-    prev_tree = None
-    for i, v in enumerate(values):
-        if tree_type == "Binary Search Tree (BST)":
-            tree_root = insert_bst(prev_tree, v)
+    tree_values = tuple(values) # The values tree_root is built from, for the cached animations
+
+    # Counting adds each insert's comparisons, rotations and height updates to its step
+    show_counts = st.toggle("Show operation counts", key="tree_op_counts")
+
+    # Build tree from user input; each insert leaves a trace that explains it
+    with phase("build"):
+        if show_counts:
+            counts = {name: OpCounters() for name in TREE_TYPES}
+            frames, tree_root = grow_frames(values, tree_type, counters=counts[tree_type])
+            for name in TREE_TYPES: # The same values in the other tree type, for comparison
+                if name != tree_type:
+                    grow_frames(values, name, counters=counts[name])
         else:
-            tree_root = insert_avl(prev_tree, v, avl_tree)
-        import copy
-        frames.append((copy.deepcopy(tree_root), None, [v]))
-        prev_tree = copy.deepcopy(tree_root)
+            frames, tree_root = grow_frames(values, tree_type)
+    if show_counts:
+        st.caption(" · ".join(f"**{name}**: {count_summary(counts[name].snapshot())}" for name in TREE_TYPES))
 
-    # Generate explanations by analyzing frames
-    for i, (frame, _, highlight) in enumerate(frames):
-        if i == 0:
-            explanations.append(f"🌱 Insert root node {highlight[0]}.")
-        else:
-            prev_frame = frames[i-1][0]
-            inserted, parent, direction = find_insertion(prev_frame, frame)
-            if parent is None:
-                explanations.append(f"🌱 Insert node {inserted}: direct child of root.")
-            else:
-                comparison = '<' if direction == 'left' else '>='
-                explanations.append(f"🌱 Insert node {inserted}: Go {direction} from {parent} since {inserted} {comparison} {parent}.")
-        frames[i] = (frame, explanations[-1], highlight)
+    # In the browser, every frame ships with the page and stepping never reruns the script
+    client_side = st.toggle("Step through frames in the browser", key="tree_client_side")
 
     # Only allow one animation (grow or traverse) at a time
     if "active_animation" not in st.session_state:
         st.session_state.active_animation = None
 
     st.markdown("### 'Grow' your Tree:")
-    col1, col2, col3 = st.columns([1, 1, 2])
-    with col1:
-        play_tree_animation = st.button("🎬 Grow", disabled=st.session_state.active_animation == "traverse")
+    if client_side:
+        with phase("build"):
+            html = grow_animation_html(tree_values, tree_type, show_counts)
+        with phase("send"):
+            st.iframe(html, height=560)
+        play_tree_animation = False
+    else:
+        col1, col2, col3 = st.columns([1, 1, 2])
+        with col1:
+            play_tree_animation = st.button("🎬 Grow", disabled=st.session_state.active_animation == "traverse")
 
     if play_tree_animation and st.session_state.active_animation is None:
         st.session_state.active_animation = "grow"
         st.session_state.show_keyframes = False  # Reset to animation mode
-        st.session_state.tree_animation_frames = frames
+        st.session_state.tree_animation_frames = FrameStore(frames)
         st.session_state.tree_current_frame = 0
         placeholder = st.empty()
-        for i, (frame, description, highlighted) in enumerate(frames):
-            with placeholder.container():
-                st.write(f"**Tree Height:** {tree_height(frame) - 1}")
-                st.write(f"**Step {i+1}/{len(frames)}:** {description}")
-                fig, ax = plt.subplots(figsize=(8, 6))
-                max_height = tree_height(frame)
-                max_width = 2 ** max_height
-                ax.set_xlim(-max_width * 1.2, max_width * 1.2)
-                ax.set_ylim(-max_height-1, 1)
-                ax.axis('off')
-                ax.set_facecolor('#1E1E1E') 
-                edge_positions = []
-                draw_node(frame, 0, 0, max_width, highlighted, ax, max_width=max_width, edge_positions=edge_positions)
-                if edge_positions:
-                    x_positions, y_positions = zip(*edge_positions)
-                    ax.set_xlim(min(x_positions) - 1, max(x_positions) + 1)
-                    ax.set_ylim(min(y_positions) - 1, max(y_positions) + 1)
-                fig.patch.set_facecolor('#1E1E1E')
-                fig.subplots_adjust(left=0.05, right=0.95, top=0.95, bottom=0.05)
-                st.pyplot(fig)
-                plt.close(fig)
-            import time, gc
-            time.sleep(1.2)
-            gc.collect()  # Explicitly free memory
+        # Every frame starts rendering in the worker pool now; the loop below just shows them
+        with FramePipeline((frame, highlighted) for frame, _, highlighted in frames) as pipeline:
+            for i, ((frame, description, highlighted), png) in enumerate(zip(frames, pipeline)):
+                with placeholder.container():
+                    st.write(f"**Tree Height:** {tree_height(frame) - 1}")
+                    st.write(f"**Step {i+1}/{len(frames)}:** {description}")
+                    with phase("send"):
+                        st.image(png, use_container_width=True)
+                import time, gc
+                with phase("wait"):
+                    time.sleep(1.2)
+                    gc.collect()  # Explicitly free memory
         placeholder.empty()
         st.session_state.show_keyframes = True
         st.session_state.active_animation = None
 
-    if st.session_state.get("show_keyframes", False) and st.session_state.active_animation is None:
+    if st.session_state.get("show_keyframes", False) and st.session_state.active_animation is None and not client_side:
         if "tree_animation_frames" not in st.session_state:
-            st.session_state.tree_animation_frames = frames
+            st.session_state.tree_animation_frames = FrameStore(frames)
         if "tree_current_frame" not in st.session_state:
             st.session_state.tree_current_frame = 0
         st.markdown("---")
@@ -262,23 +167,9 @@ def visualize_tree():
             if st.button("→", key="tree_next_button"):
                 st.session_state.tree_current_frame = min(total_steps - 1, st.session_state.tree_current_frame + 1)
                 st.rerun()
-        fig, ax = plt.subplots(figsize=(8, 6))
-        max_height = tree_height(frame)
-        max_width = 2 ** max_height
-        ax.set_xlim(-max_width * 1.2, max_width * 1.2)
-        ax.set_ylim(-max_height-1, 1)
-        ax.axis('off')
-        ax.set_facecolor('#1E1E1E')  # Dark Slate Gray background
-        edge_positions = []
-        draw_node(frame, 0, 0, max_width, highlighted, ax, max_width=max_width, edge_positions=edge_positions)
-        if edge_positions:
-            x_positions, y_positions = zip(*edge_positions)
-            ax.set_xlim(min(x_positions) - 1, max(x_positions) + 1)
-            ax.set_ylim(min(y_positions) - 1, max(y_positions) + 1)
-        fig.patch.set_facecolor('#1E1E1E')
-        fig.subplots_adjust(left=0.05, right=0.95, top=0.95, bottom=0.05)
-        st.pyplot(fig)
-        plt.close(fig)
+        with phase("send"):
+            st.image(tree_png(frame, highlighted), use_container_width=True)
+        frame_memory_caption(st.session_state.tree_animation_frames)
 
     # Add description for tree traversals
     st.markdown(
@@ -300,6 +191,11 @@ def visualize_tree():
         - Visit the left subtree, then the right subtree, and finally the node.
         - ***Example***: For an AVL Tree [2,1,3,4], the traversal order is **1, 4, 3, 2**.
             - Useful for deleting or freeing nodes in a tree.
+
+        **Level-Order Traversal**: 
+        - Visit the nodes one level at a time, top to bottom and left to right.
+        - ***Example***: For an AVL Tree [2,1,3,4], the traversal order is **2, 1, 3, 4**.
+            - Useful for finding the shortest path from the root to a node.
         """
     )
 
@@ -307,51 +203,48 @@ def visualize_tree():
     if "show_traversal_keyframes" not in st.session_state:
         st.session_state.show_traversal_keyframes = False
 
-    traversal_type = st.selectbox("Choose tree traversal:", ["Pre-order", "In-order", "Post-order"], index=0)
+    traversal_type = st.selectbox("Choose tree traversal:", list(TRAVERSALS), index=0)
     st.session_state.traversal_type = traversal_type
     traversal_user_input = st.text_input("Update tree node values if needed (numeric comma-separated):", value=st.session_state.tree_node_values, key="traversal_tree_node_input")
     st.session_state.tree_node_values = traversal_user_input
     values = [int(v.strip()) for v in st.session_state.tree_node_values.split(",") if v.strip()]
     st.markdown(f"### Traverse your {tree_type}:")
-    play_traversal_animation = st.button("🔄 Traverse", disabled=st.session_state.active_animation == "grow")
+    if client_side:
+        with phase("build"):
+            html = traversal_animation_html(tree_values, tree_type, traversal_type)
+        with phase("send"):
+            st.iframe(html, height=560)
+        play_traversal_animation = False
+    else:
+        play_traversal_animation = st.button("🔄 Traverse", disabled=st.session_state.active_animation == "grow")
 
     if play_traversal_animation and st.session_state.active_animation is None:
         st.session_state.active_animation = "traverse"
         st.session_state.show_traversal_keyframes = False
-        traversal_frames, traversal_explanations = traverse_tree(tree_root, traversal_type)
-        st.session_state.traversal_animation_frames = traversal_frames
+        # Every frame points at the same shared tree, so the whole list is just highlights;
+        # building it up front lets the worker pool render all the steps in parallel
+        with phase("build"):
+            traversal_frames = list(traverse_tree(tree_root, traversal_type))
+        total_steps = len(traversal_frames)
+        st.session_state.traversal_animation_frames = FrameStore(traversal_frames)
         st.session_state.traversal_current_frame = 0
         placeholder = st.empty()
-        for i, (frame, description, highlighted) in enumerate(traversal_frames):
-            with placeholder.container():
-                st.write(f"**Step {i+1}/{len(traversal_frames)}:** {description if description else 'Traversing tree...'}")
-                fig, ax = plt.subplots(figsize=(8, 6))
-                max_height = tree_height(frame)
-                max_width = 2 ** max_height
-                ax.set_xlim(-max_width * 1.2, max_width * 1.2)
-                ax.set_ylim(-max_height-1, 1)
-                ax.axis('off')
-                ax.set_facecolor('#1E1E1E')  # Dark Slate Gray background
-                edge_positions = []
-                draw_node(frame, 0, 0, max_width, highlighted, ax, max_width=max_width, edge_positions=edge_positions)
-                if edge_positions:
-                    x_positions, y_positions = zip(*edge_positions)
-                    ax.set_xlim(min(x_positions) - 1, max(x_positions) + 1)
-                    ax.set_ylim(min(y_positions) - 1, max(y_positions) + 1)
-                fig.patch.set_facecolor('#1E1E1E')
-                fig.subplots_adjust(left=0.05, right=0.95, top=0.95, bottom=0.05)
-                st.pyplot(fig)
-                plt.close(fig)
-            import time, gc
-            time.sleep(1.2)
-            gc.collect()
+        with FramePipeline((frame, highlighted) for frame, _, highlighted in traversal_frames) as pipeline:
+            for i, ((frame, description, highlighted), png) in enumerate(zip(traversal_frames, pipeline)):
+                with placeholder.container():
+                    st.write(f"**Step {i+1}/{total_steps}:** {description if description else 'Traversing tree...'}")
+                    with phase("send"):
+                        st.image(png, use_container_width=True)
+                import time, gc
+                with phase("wait"):
+                    time.sleep(1.2)
+                    gc.collect()
         placeholder.empty()
         st.session_state.show_traversal_keyframes = True
         st.session_state.active_animation = None
 
-    if st.session_state.get("show_traversal_keyframes", False) and st.session_state.active_animation is None:
+    if st.session_state.get("show_traversal_keyframes", False) and st.session_state.active_animation is None and not client_side:
         st.markdown("---")
-        traversal_order = [str(frame[2][0]) for frame in st.session_state.traversal_animation_frames]
         total_steps = len(st.session_state.traversal_animation_frames)
         
         # Slider for step selection
@@ -379,20 +272,6 @@ def visualize_tree():
             if st.button("→", key="traversal_next_button"):
                 st.session_state.traversal_current_frame = min(total_steps - 1, st.session_state.traversal_current_frame + 1)
                 st.rerun()
-        fig, ax = plt.subplots(figsize=(8, 6))
-        max_height = tree_height(frame)
-        max_width = 2 ** max_height
-        ax.set_xlim(-max_width * 1.2, max_width * 1.2)
-        ax.set_ylim(-max_height-1, 1)
-        ax.axis('off')
-        ax.set_facecolor('#1E1E1E')  # Dark Slate Gray background
-        edge_positions = []
-        draw_node(frame, 0, 0, max_width, highlighted, ax, max_width=max_width, edge_positions=edge_positions)
-        if edge_positions:
-            x_positions, y_positions = zip(*edge_positions)
-            ax.set_xlim(min(x_positions) - 1, max(x_positions) + 1)
-            ax.set_ylim(min(y_positions) - 1, max(y_positions) + 1)
-        fig.patch.set_facecolor('#1E1E1E')
-        fig.subplots_adjust(left=0.05, right=0.95, top=0.95, bottom=0.05)
-        st.pyplot(fig)
-        plt.close(fig)
\ No newline at end of file
+        with phase("send"):
+            st.image(tree_png(frame, highlighted), use_container_width=True)
+        frame_memory_caption(st.session_state.traversal_animation_frames)